@@ -1,83 +1,469 @@
-from azure.identity import AzureCliCredential
-from azure.search.documents import SearchClient
-from azure.search.documents.indexes import SearchIndexClient
-from azure.search.documents.indexes.models import SearchIndex, SimpleField, SearchableField, SearchFieldDataType
-from azure.storage.blob import BlobServiceClient
+"""Index the sample dataset blobs into Azure AI Search.
+
+Blobs are downloaded concurrently and split into documents of at most
+--chunk-chars characters (CSV chunks repeat the header row). Documents are
+uploaded in batches bounded by bytes and count while downloads continue.
+A local manifest records each blob's fingerprint and document ids, so
+later runs skip unchanged blobs and delete documents of changed or removed ones.
+The manifest also records the storage container and search index it describes;
+it is ignored for any other target, and when the index holds fewer documents
+than the manifest lists (e.g. the index was recreated).
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+MANIFEST_VERSION = 2
+DEFAULT_CHUNK_CHARS = 8000
+# Azure AI Search accepts up to 1000 documents and 16 MB per indexing request
+DEFAULT_MAX_BATCH_DOCS = 1000
+DEFAULT_MAX_BATCH_BYTES = 8 * 1024 * 1024
+
+
+def blob_title(blob_name):
+    return blob_name.replace(".csv", "").replace(".json", "")
+
+
+def document_id(blob_name, chunk):
+    """Stable document key; keys may only contain letters, digits, '_', '-' and '='."""
+    encoded = base64.urlsafe_b64encode(blob_name.encode("utf-8")).decode("ascii")
+    return f"{encoded}-{chunk}"
+
+
+def blob_fingerprint(blob):
+    """Identify a blob version from its listing, without downloading it."""
+    content_settings = getattr(blob, "content_settings", None)
+    md5 = getattr(content_settings, "content_md5", None)
+    if md5:
+        return "md5:" + base64.b64encode(bytes(md5)).decode("ascii")
+    return f"etag:{blob.etag}"
 
-if len(sys.argv) < 4:
-    print("Usage: python index_datasets.py <storage_account_name> <blob_container_name> <ai_search_endpoint> [<ai_search_index_name>]")
-    sys.exit(1)
-
-storage_account_name = sys.argv[1]
-blob_container_name = sys.argv[2]
-ai_search_endpoint = sys.argv[3]
-ai_search_index_name = sys.argv[4] if len(sys.argv) > 4 else "sample-dataset-index"
-if not ai_search_endpoint.__contains__("search.windows.net"):
-    ai_search_endpoint = f"https://{ai_search_endpoint}.search.windows.net"
-
-credential = AzureCliCredential()
-
-try:
-    blob_service_client = BlobServiceClient(account_url=f"https://{storage_account_name}.blob.core.windows.net", credential=credential)
-    container_client = blob_service_client.get_container_client(blob_container_name)
-    print("Fetching files in container...")
-    blob_list = list(container_client.list_blobs())
-except Exception as e:
-    print(f"Error fetching files: {e}")
-    sys.exit(1)
-
-success_count = 0
-fail_count = 0
-data_list = []
-
-try:
-    index_fields = [ 
-        SimpleField(name="id", type=SearchFieldDataType.String, key=True),
-        SearchableField(name="content", type=SearchFieldDataType.String, searchable=True),
-        SearchableField(name="title", type=SearchFieldDataType.String, searchable=True, filterable=True)
+
+def chunk_text(text, max_chars, header=""):
+    """Split text at line boundaries into chunks of at most max_chars characters.
+
+    When given, header (e.g. a CSV header row) starts every chunk.
+    Lines longer than a chunk are split.
+    """
+    budget = max(1, max_chars - len(header))
+    chunks, current, size = [], [], 0
+    for line in text.splitlines(keepends=True):
+        while len(line) > budget:
+            if current:
+                chunks.append(header + "".join(current))
+                current, size = [], 0
+            chunks.append(header + line[:budget])
+            line = line[budget:]
+        if size + len(line) > budget and current:
+            chunks.append(header + "".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current or not chunks:
+        chunks.append(header + "".join(current))
+    return chunks
+
+
+def blob_documents(blob_name, text, max_chars):
+    """The search documents of one blob."""
+    header = ""
+    if blob_name.endswith(".csv"):
+        first_line, newline, rest = text.partition("\n")
+        if rest:
+            header, text = first_line + newline, rest
+    title = blob_title(blob_name)
+    return [
+        {"id": document_id(blob_name, n), "content": chunk, "title": title}
+        for n, chunk in enumerate(chunk_text(text, max_chars, header))
     ]
-    index = SearchIndex(name=ai_search_index_name, fields=index_fields)
-
-    print("Creating or updating Azure Search index...")
-    search_index_client = SearchIndexClient(endpoint=ai_search_endpoint, credential=credential)
-    index_result = search_index_client.create_or_update_index(index=index)
-    print(f"Index '{ai_search_index_name}' created or updated successfully.")
-except Exception as e:
-    print(f"Error creating/updating index: {e}")
-    sys.exit(1)
-
-for idx, blob in enumerate(blob_list, start=1):
-    #if blob.name.endswith(".csv"):
-    title = blob.name.replace(".csv", "")
-    title = title.replace(".json", "")
-    data = container_client.download_blob(blob.name).readall()
-    
+
+
+def load_manifest(path, chunk_chars, target=None):
+    """Previous run's blob entries; None when missing, made with other settings or for another target."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable manifest {path}: {e}")
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("chunk_chars") != chunk_chars:
+        print("Manifest was written with other settings; re-indexing all blobs.")
+        return None
+    if manifest.get("target") != (target or {}):
+        print("Manifest was written for another storage container or search index; re-indexing all blobs.")
+        return None
+    return manifest.get("blobs", {})
+
+
+def save_manifest(path, chunk_chars, blobs, target=None):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": MANIFEST_VERSION, "chunk_chars": chunk_chars, "target": target or {}, "blobs": blobs},
+            f,
+            indent=1,
+        )
+    os.replace(temp_path, path)
+
+
+def index_matches_manifest(search_client, blobs, log=print):
+    """Cheap check that the index still holds the documents the manifest lists as indexed."""
+    expected = sum(len(entry["ids"]) for entry in blobs.values() if entry["fingerprint"])
+    try:
+        count = search_client.get_document_count()
+    except Exception as e:
+        log(f"Could not count indexed documents: {e}")
+        return False
+    if count < expected:
+        log(f"Index holds {count} documents but the manifest lists {expected}; re-indexing all blobs.")
+        return False
+    return True
+
+
+def batch_documents(documents, max_batch_docs, max_batch_bytes):
+    """Group documents into upload batches bounded by count and serialized size."""
+    batch, size = [], 0
+    for document in documents:
+        document_size = len(json.dumps(document).encode("utf-8"))
+        if batch and (len(batch) >= max_batch_docs or size + document_size > max_batch_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(document)
+        size += document_size
+    if batch:
+        yield batch
+
+
+class Progress:
+    """Counters for the run, printed every report_every seconds and at the end."""
+
+    def __init__(self, total_blobs, report_every=2.0, log=print):
+        self.total_blobs = total_blobs
+        self.report_every = report_every
+        self.log = log
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.counts = dict.fromkeys(
+            [
+                "blobs_indexed",
+                "blobs_unchanged",
+                "blobs_failed",
+                "documents_uploaded",
+                "documents_failed",
+                "documents_deleted",
+                "bytes_downloaded",
+            ],
+            0,
+        )
+
+    def add(self, **counts):
+        for name, value in counts.items():
+            self.counts[name] += value
+        now = time.perf_counter()
+        if now - self.last_report >= self.report_every:
+            self.last_report = now
+            self.log(self.line())
+
+    def line(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        done = self.counts["blobs_indexed"] + self.counts["blobs_unchanged"] + self.counts["blobs_failed"]
+        megabytes = self.counts["bytes_downloaded"] / (1024 * 1024)
+        return (
+            f"[{done}/{self.total_blobs} blobs] {self.counts['documents_uploaded']} documents uploaded, "
+            f"{megabytes:.1f} MB downloaded in {elapsed:.1f}s "
+            f"({megabytes / elapsed:.2f} MB/s, {self.counts['documents_uploaded'] / elapsed:.1f} docs/s)"
+        )
+
+    def summary(self):
+        return {**self.counts, "elapsed_seconds": round(time.perf_counter() - self.started, 3)}
+
+
+def download_blobs(container_client, blobs, concurrency):
+    """Yield (blob, data or exception) as downloads finish, with at most 2 x concurrency in flight."""
+
+    def download(blob):
+        try:
+            return blob, container_client.download_blob(blob.name).readall()
+        except Exception as e:
+            return blob, e
+
+    pending_blobs = deque(blobs)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="download") as executor:
+        in_flight = set()
+        while pending_blobs or in_flight:
+            while pending_blobs and len(in_flight) < 2 * concurrency:
+                in_flight.add(executor.submit(download, pending_blobs.popleft()))
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def upload_batch(search_client, batch):
+    """Upload one batch; returns the ids of the documents that failed."""
+    try:
+        results = search_client.upload_documents(documents=batch)
+    except Exception as e:
+        print(f"Error uploading {len(batch)} documents: {e}")
+        return {document["id"] for document in batch}
+    failed = set()
+    for result in results:
+        if not result.succeeded:
+            print(f"Error indexing document {result.key}: {result.error_message}")
+            failed.add(result.key)
+    return failed
+
+
+def indexed_document_ids(search_client):
+    """Ids of every document in the index (used when there is no manifest yet)."""
+    return {document["id"] for document in search_client.search(search_text="*", select=["id"])}
+
+
+def delete_documents(search_client, document_ids, max_batch_docs):
+    """Delete documents by id; returns how many were deleted."""
+    deleted = 0
+    ids = sorted(document_ids)
+    for i in range(0, len(ids), max_batch_docs):
+        batch = [{"id": document_id} for document_id in ids[i : i + max_batch_docs]]
+        try:
+            deleted += sum(1 for result in search_client.delete_documents(documents=batch) if result.succeeded)
+        except Exception as e:
+            print(f"Error deleting {len(batch)} stale documents: {e}")
+    return deleted
+
+
+def index_blobs(
+    container_client,
+    search_client,
+    manifest_path,
+    download_concurrency=8,
+    upload_concurrency=4,
+    chunk_chars=DEFAULT_CHUNK_CHARS,
+    max_batch_docs=DEFAULT_MAX_BATCH_DOCS,
+    max_batch_bytes=DEFAULT_MAX_BATCH_BYTES,
+    full=False,
+    report_every=2.0,
+    log=print,
+    target=None,
+):
+    """Index the container's blobs incrementally; returns the run's counters.
+
+    container_client needs list_blobs() and download_blob(name).readall();
+    search_client needs upload_documents, delete_documents, search and
+    get_document_count (as the Azure SDK clients provide). target identifies
+    the container and index (e.g. account, container, endpoint and index
+    name); a manifest written for another target is not used.
+    """
+    previous = None if full else load_manifest(manifest_path, chunk_chars, target)
+    if previous and not index_matches_manifest(search_client, previous, log):
+        previous = None
+    blobs = list(container_client.list_blobs())
+    progress = Progress(len(blobs), report_every, log)
+    manifest = {}
+
+    to_download = []
+    for blob in blobs:
+        entry = (previous or {}).get(blob.name)
+        if entry and entry["fingerprint"] == blob_fingerprint(blob):
+            manifest[blob.name] = entry
+            progress.add(blobs_unchanged=1)
+        else:
+            to_download.append(blob)
+    log(f"{len(blobs)} blobs, {len(to_download)} new or changed.")
+
+    # Documents of a blob are recorded in the manifest once all of them are uploaded
+    waiting = {}  # blob name -> (entry, ids not uploaded yet, any failed)
+    attempted = {}  # blob name -> ids sent for it
+    uploads = set()
+    upload_executor = ThreadPoolExecutor(max_workers=upload_concurrency, thread_name_prefix="upload")
+
+    def settle(futures):
+        for future in futures:
+            batch, failed_ids = future.result()
+            progress.add(
+                documents_uploaded=len(batch) - len(failed_ids),
+                documents_failed=len(failed_ids),
+            )
+            for document in batch:
+                name = document["_blob"]
+                entry, remaining, failed = waiting[name]
+                remaining.discard(document["id"])
+                failed = failed or document["id"] in failed_ids
+                waiting[name] = (entry, remaining, failed)
+                if not remaining:
+                    del waiting[name]
+                    if failed:
+                        progress.add(blobs_failed=1)
+                    else:
+                        manifest[name] = entry
+                        progress.add(blobs_indexed=1)
+
+    def submit(batch):
+        nonlocal uploads
+        # Bound memory: wait for uploads when the queue is full
+        while len(uploads) >= 2 * upload_concurrency:
+            done, uploads = wait(uploads, return_when=FIRST_COMPLETED)
+            settle(done)
+        documents = [{k: v for k, v in document.items() if k != "_blob"} for document in batch]
+        future = upload_executor.submit(lambda: (batch, upload_batch(search_client, documents)))
+        uploads.add(future)
+
+    def documents_to_upload():
+        for blob, data in download_blobs(container_client, to_download, download_concurrency):
+            if isinstance(data, Exception):
+                log(f"Error downloading blob - {blob.name}: {data}")
+                progress.add(blobs_failed=1)
+                continue
+            progress.add(bytes_downloaded=len(data))
+            sha256 = hashlib.sha256(data).hexdigest()
+            try:
+                text = data.decode("utf-8")
+            except UnicodeDecodeError as e:
+                log(f"Error reading file - {blob.name}: {e}")
+                progress.add(blobs_failed=1)
+                # Not retried until the blob changes
+                manifest[blob.name] = {"fingerprint": blob_fingerprint(blob), "sha256": sha256, "ids": []}
+                continue
+            documents = blob_documents(blob.name, text, chunk_chars)
+            entry = {
+                "fingerprint": blob_fingerprint(blob),
+                "sha256": sha256,
+                "ids": [document["id"] for document in documents],
+            }
+            old = (previous or {}).get(blob.name)
+            if old and old["sha256"] == sha256:
+                # New version with the same content (e.g. re-uploaded): nothing to index
+                manifest[blob.name] = entry
+                progress.add(blobs_unchanged=1)
+                continue
+            waiting[blob.name] = (entry, set(entry["ids"]), False)
+            attempted[blob.name] = entry["ids"]
+            for document in documents:
+                yield {**document, "_blob": blob.name}
+
     try:
-        print(f"Reading data from blob: {blob.name}...")
-        text = data.decode('utf-8')
-        data_list.append({
-            "content": text,
-            "id": str(idx),
-            "title": title
-        })
-        success_count += 1
+        for batch in batch_documents(documents_to_upload(), max_batch_docs, max_batch_bytes):
+            submit(batch)
+        settle(wait(uploads).done)
+    finally:
+        upload_executor.shutdown(wait=True)
+
+    # Failed blobs keep their documents and are retried next run (no fingerprint matches)
+    failed_blobs = {blob.name for blob in to_download} - set(manifest)
+    for name in failed_blobs:
+        old_ids = (previous or {}).get(name, {}).get("ids", [])
+        ids = sorted(set(old_ids) | set(attempted.get(name, [])))
+        manifest[name] = {"fingerprint": None, "sha256": None, "ids": ids}
+
+    # Documents no longer produced by any blob: known from the previous manifest,
+    # or on a first run from the index itself (e.g. documents of an older indexer)
+    current_ids = {document_id for entry in manifest.values() for document_id in entry["ids"]}
+    known_ids = set()
+    if previous is not None:
+        known_ids = {document_id for entry in previous.values() for document_id in entry["ids"]}
+    elif failed_blobs:
+        log("Some blobs failed; stale documents are removed on the next run.")
+    else:
+        try:
+            known_ids = indexed_document_ids(search_client)
+        except Exception as e:
+            log(f"Could not list indexed documents, stale documents are kept: {e}")
+    stale_ids = known_ids - current_ids
+    if stale_ids:
+        progress.add(documents_deleted=delete_documents(search_client, stale_ids, max_batch_docs))
+
+    save_manifest(manifest_path, chunk_chars, manifest, target)
+    log(progress.line())
+    return progress.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index the sample dataset blobs into Azure AI Search.")
+    parser.add_argument("storage_account_name")
+    parser.add_argument("blob_container_name")
+    parser.add_argument("ai_search_endpoint")
+    parser.add_argument("ai_search_index_name", nargs="?", default="sample-dataset-index")
+    parser.add_argument("--manifest", help="Manifest file (default: .index_manifest_<index name>.json)")
+    parser.add_argument("--full", action="store_true", help="Re-index every blob, ignoring the manifest")
+    parser.add_argument("--download-concurrency", type=int, default=8)
+    parser.add_argument("--upload-concurrency", type=int, default=4)
+    parser.add_argument("--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS)
+    parser.add_argument("--max-batch-bytes", type=int, default=DEFAULT_MAX_BATCH_BYTES)
+    args = parser.parse_args(argv)
+
+    from azure.identity import AzureCliCredential
+    from azure.search.documents import SearchClient
+    from azure.search.documents.indexes import SearchIndexClient
+    from azure.search.documents.indexes.models import SearchFieldDataType, SearchIndex, SearchableField, SimpleField
+    from azure.storage.blob import BlobServiceClient
+
+    ai_search_endpoint = args.ai_search_endpoint
+    if "search.windows.net" not in ai_search_endpoint:
+        ai_search_endpoint = f"https://{ai_search_endpoint}.search.windows.net"
+    credential = AzureCliCredential()
+
+    try:
+        index_fields = [
+            SimpleField(name="id", type=SearchFieldDataType.String, key=True),
+            SearchableField(name="content", type=SearchFieldDataType.String, searchable=True),
+            SearchableField(name="title", type=SearchFieldDataType.String, searchable=True, filterable=True),
+        ]
+        index = SearchIndex(name=args.ai_search_index_name, fields=index_fields)
+
+        print("Creating or updating Azure Search index...")
+        search_index_client = SearchIndexClient(endpoint=ai_search_endpoint, credential=credential)
+        search_index_client.create_or_update_index(index=index)
+        print(f"Index '{args.ai_search_index_name}' created or updated successfully.")
+    except Exception as e:
+        print(f"Error creating/updating index: {e}")
+        return 1
+
+    blob_service_client = BlobServiceClient(
+        account_url=f"https://{args.storage_account_name}.blob.core.windows.net", credential=credential
+    )
+    container_client = blob_service_client.get_container_client(args.blob_container_name)
+    search_client = SearchClient(endpoint=ai_search_endpoint, index_name=args.ai_search_index_name, credential=credential)
+
+    try:
+        print("Fetching files in container...")
+        stats = index_blobs(
+            container_client,
+            search_client,
+            args.manifest or f".index_manifest_{args.ai_search_index_name}.json",
+            download_concurrency=args.download_concurrency,
+            upload_concurrency=args.upload_concurrency,
+            chunk_chars=args.chunk_chars,
+            max_batch_bytes=args.max_batch_bytes,
+            full=args.full,
+            target={
+                "storage_account": args.storage_account_name,
+                "container": args.blob_container_name,
+                "search_endpoint": ai_search_endpoint,
+                "index_name": args.ai_search_index_name,
+            },
+        )
     except Exception as e:
-        print(f"Error reading file - {blob.name}: {e}")
-        fail_count += 1
-        continue
-
-if not data_list:
-    print(f"No data to upload to Azure Search index. Success: {success_count}, Failed: {fail_count}")
-    sys.exit(1)
-
-try:
-    print("Uploading documents to the index...")
-    search_client = SearchClient(endpoint=ai_search_endpoint, index_name=ai_search_index_name, credential=credential)
-    result = search_client.upload_documents(documents=data_list)
-    print(f"Uploaded {len(data_list)} documents.")
-except Exception as e:
-    print(f"Error uploading documents: {e}")
-    sys.exit(1)
-
-print(f"Processing complete. Success: {success_count}, Failed: {fail_count}")
\ No newline at end of file
+        print(f"Error indexing files: {e}")
+        return 1
+
+    print(
+        f"Processing complete. Indexed: {stats['blobs_indexed']}, Unchanged: {stats['blobs_unchanged']}, "
+        f"Failed: {stats['blobs_failed']}, Documents uploaded: {stats['documents_uploaded']}, "
+        f"deleted: {stats['documents_deleted']}"
+    )
+    if stats["blobs_indexed"] + stats["blobs_unchanged"] == 0:
+        print("No data was indexed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
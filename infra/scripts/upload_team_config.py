@@ -1,37 +1,69 @@
 import sys
 import os
-import requests
 import json
+import asyncio
+import aiohttp
 
-def check_team_exists(backend_url, team_id, user_principal_id):
+
+def load_team_configs(directory_path, files_to_process):
     """
-    Check if a team already exists in the database.
-    
+    Read the team configuration files that exist in the directory.
+
     Args:
-        backend_url: The backend endpoint URL
-        team_id: The team ID to check
-        user_principal_id: User principal ID for authentication
-        
+        directory_path: Directory containing the JSON files
+        files_to_process: (filename, team_id) pairs
+
+    Returns:
+        teams: list of {"source", "team_id", "config"} entries for the bulk endpoint
+    """
+    teams = []
+    for filename, team_id in files_to_process:
+        file_path = os.path.join(directory_path, filename)
+        if not os.path.isfile(file_path):
+            print(f"File not found: {filename}")
+            continue
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                teams.append({"source": filename, "team_id": team_id, "config": json.load(f)})
+        except Exception as e:
+            print(f"Error reading {filename}: {str(e)}")
+    return teams
+
+
+async def upload_team_configs(backend_url, teams, user_principal_id):
+    """
+    Upload all team configurations with one request to the bulk endpoint.
+
+    The backend skips teams that already exist and validates the others concurrently.
+
     Returns:
-        exists: bool
+        uploaded_count: int
     """
-    check_endpoint = backend_url.rstrip('/') + f'/api/v3/team_configs/{team_id}'
+    bulk_endpoint = backend_url.rstrip('/') + '/api/v3/team_configs/bulk'
     headers = {
         'x-ms-client-principal-id': user_principal_id
     }
-    
-    try:
-        response = requests.get(check_endpoint, headers=headers)
-        if response.status_code == 200:
-            return True
-        elif response.status_code == 404:
-            return False
+    timeout = aiohttp.ClientTimeout(total=600)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with session.post(bulk_endpoint, json={"teams": teams}, headers=headers) as response:
+            if response.status != 200:
+                print(f"Failed to upload team configurations. Status code: {response.status}, Response: {await response.text()}")
+                return 0
+            resp_json = await response.json()
+
+    uploaded_count = 0
+    for result in resp_json.get("results", []):
+        source = result.get("source")
+        if result.get("status") == "created":
+            print(f"Successfully uploaded team configuration: {result.get('name')} (team_id: {result.get('team_id')})")
+            uploaded_count += 1
+        elif result.get("status") in ("exists", "duplicate"):
+            print(f"Team '{result.get('name')}' (ID: {result.get('team_id')}) already exists!")
         else:
-            print(f"Error checking team {team_id}: Status {response.status_code}, Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"Exception checking team {team_id}: {str(e)}")
-        return False
+            print(f"Upload failed for {source}: {'; '.join(result.get('errors', []))}")
+    return uploaded_count
+
 
 if len(sys.argv) < 2:
     print("Usage: python upload_team_config.py <backend_endpoint> <directory_path> [<user_principal_id>]")
@@ -51,60 +83,13 @@ files_to_process = [
     ("retail.json", "00000000-0000-0000-0000-000000000003"),
 ]
 
-upload_endpoint = backend_url.rstrip('/') + '/api/v3/upload_team_config'
-
-# Process each JSON file in the directory
+teams = load_team_configs(directory_path, files_to_process)
 uploaded_count = 0
-for filename, team_id in files_to_process:
-    file_path = os.path.join(directory_path, filename)
-    if os.path.isfile(file_path):
-        print(f"Uploading file: {filename}")
-        # Check if team already exists
-        team_exists = check_team_exists(backend_url, team_id, user_principal_id)            
-        if team_exists:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    team_data = json.load(f)
-                    team_name = team_data.get('name', 'Unknown')
-                    print(f"Team '{team_name}' (ID: {team_id}) already exists!")
-                    continue
-            except Exception as e:
-                print(f"Error reading {filename}: {str(e)}")
-                continue
-
-        try:
-            with open(file_path, 'rb') as file_data:
-                files = {
-                    'file': (filename, file_data, 'application/json')
-                }
-                headers = {
-                    'x-ms-client-principal-id': user_principal_id
-                }
-    
-                params = {
-                    'team_id': team_id
-                }
-                response = requests.post(
-                    upload_endpoint,
-                    files=files,
-                    headers=headers,
-                    params=params
-                )
-                if response.status_code == 200:
-                    try:
-                        resp_json = response.json()
-                        if resp_json.get("status") == "success":
-                            print(f"Successfully uploaded team configuration: {resp_json.get('name')} (team_id: {resp_json.get('team_id')})")
-                            uploaded_count += 1
-                        else:
-                            print(f"Upload failed for {filename}. Response: {resp_json}")
-                    except Exception as e:
-                        print(f"Error parsing response for {filename}: {str(e)}")
-                else:
-                    print(f"Failed to upload {filename}. Status code: {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            print(f"Error processing {filename}: {str(e)}")
-    else:
-        print(f"File not found: {filename}")
+if teams:
+    print(f"Uploading {len(teams)} team configuration(s)")
+    try:
+        uploaded_count = asyncio.run(upload_team_configs(backend_url, teams, user_principal_id))
+    except Exception as e:
+        print(f"Error uploading team configurations: {str(e)}")
 
-print(f"Completed uploading {uploaded_count} team configurations")
\ No newline at end of file
+print(f"Completed uploading {uploaded_count} team configurations")
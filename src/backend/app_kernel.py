@@ -19,7 +19,10 @@ from v3.api.router import app_v3
 # Azure monitoring
 
 # Semantic Kernel imports
+from v3.common.services.http_client import close_shared_session
 from v3.config.agent_registry import agent_registry
+from v3.magentic_agents.common.mcp_session_pool import get_mcp_session_pool
+from v3.magentic_agents.reasoning_search import close_search_clients
 
 
 @asynccontextmanager
@@ -38,6 +41,10 @@ async def lifespan(app: FastAPI):
         await agent_registry.cleanup_all_agents()
         logger.info("✅ Agent cleanup completed successfully")
 
+        await get_mcp_session_pool().aclose()
+        await close_shared_session()
+        await close_search_clients()
+
     except ImportError as ie:
         logger.error(f"❌ Could not import agent_registry: {ie}")
     except Exception as e:
@@ -92,6 +92,15 @@ class AppConfig:
         )
         self.AZURE_AI_SEARCH_ENDPOINT = self._get_optional("AZURE_AI_SEARCH_ENDPOINT")
         self.AZURE_AI_SEARCH_API_KEY = self._get_optional("AZURE_AI_SEARCH_API_KEY")
+        # Retrieval backend of RAG agents: "azure" (Azure AI Search) or "local"
+        # (in-process BM25 index over the dataset files, for offline use)
+        self.SEARCH_BACKEND = self._get_optional("SEARCH_BACKEND", "azure").lower()
+        self.LOCAL_SEARCH_DATA_DIR = self._get_optional(
+            "LOCAL_SEARCH_DATA_DIR", "../../data/datasets"
+        )
+        self.LOCAL_SEARCH_INDEX_PATH = self._get_optional(
+            "LOCAL_SEARCH_INDEX_PATH", ".local_search_index.json.gz"
+        )
         # self.BING_CONNECTION_NAME = self._get_optional("BING_CONNECTION_NAME")
 
         test_team_json = self._get_optional("TEST_TEAM_JSON")
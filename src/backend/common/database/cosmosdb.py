@@ -1,5 +1,6 @@
 """CosmosDB implementation of the database interface."""
 
+import asyncio
 import datetime
 import logging
 from typing import Any, Dict, List, Optional, Type
@@ -86,6 +87,15 @@ class CosmosDBClient(DatabaseBase):
             self.logger.error("Failed to Get cosmosdb container", error=str(e))
             raise
 
+    @staticmethod
+    def _to_document(item: BaseDataModel) -> Dict[str, Any]:
+        """Convert to dictionary and handle datetime serialization."""
+        document = item.model_dump()
+        for key, value in list(document.items()):
+            if isinstance(value, datetime.datetime):
+                document[key] = value.isoformat()
+        return document
+
     async def close(self) -> None:
         """Close the CosmosDB connection."""
         if self.client:
@@ -98,14 +108,7 @@ class CosmosDBClient(DatabaseBase):
         await self._ensure_initialized()
 
         try:
-            # Convert to dictionary and handle datetime serialization
-            document = item.model_dump()
-
-            for key, value in list(document.items()):
-                if isinstance(value, datetime.datetime):
-                    document[key] = value.isoformat()
-
-            await self.container.create_item(body=document)
+            await self.container.create_item(body=self._to_document(item))
         except Exception as e:
             self.logger.error("Failed to add item to CosmosDB: %s", str(e))
             raise
@@ -115,12 +118,7 @@ class CosmosDBClient(DatabaseBase):
         await self._ensure_initialized()
 
         try:
-            # Convert to dictionary and handle datetime serialization
-            document = item.model_dump()
-            for key, value in list(document.items()):
-                if isinstance(value, datetime.datetime):
-                    document[key] = value.isoformat()
-            await self.container.upsert_item(body=document)
+            await self.container.upsert_item(body=self._to_document(item))
         except Exception as e:
             self.logger.error("Failed to update item in CosmosDB: %s", str(e))
             raise
@@ -377,6 +375,36 @@ class CosmosDBClient(DatabaseBase):
         """
         await self.add_item(team)
 
+    async def add_teams(
+        self, teams: List[TeamConfiguration], max_concurrency: int = 16
+    ) -> Dict[str, str]:
+        """Add team configurations, up to max_concurrency writes at a time.
+
+        Every team has its own partition key, so each one is written with its
+        own create_item; one failed write does not affect the others.
+
+        Args:
+            teams: The TeamConfigurations to add
+            max_concurrency: Writes in flight at the same time
+
+        Returns:
+            The error of every team that was not saved, by team id
+        """
+        await self._ensure_initialized()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def write(team: TeamConfiguration) -> Optional[str]:
+            async with semaphore:
+                try:
+                    await self.container.create_item(body=self._to_document(team))
+                except Exception as e:
+                    self.logger.error("Failed to add team %s to CosmosDB: %s", team.id, str(e))
+                    return str(e) or type(e).__name__
+            return None
+
+        errors = await asyncio.gather(*(write(team) for team in teams))
+        return {team.id: error for team, error in zip(teams, errors) if error is not None}
+
     async def update_team(self, team: TeamConfiguration) -> None:
         """Update an existing team configuration in Cosmos DB.
 
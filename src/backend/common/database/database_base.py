@@ -129,6 +129,11 @@ class DatabaseBase(ABC):
         """Add a team configuration to the database."""
         pass
 
+    @abstractmethod
+    async def add_teams(self, teams: List[TeamConfiguration]) -> Dict[str, str]:
+        """Add several team configurations; returns the error of each team not saved, by id."""
+        pass
+
     @abstractmethod
     async def update_team(self, team: TeamConfiguration) -> None:
         """Update a team configuration in the database."""
@@ -202,6 +202,20 @@ class TeamConfiguration(BaseDataModel):
     user_id: str  # Who uploaded this configuration
 
 
+class TeamConfigImport(KernelBaseModel):
+    """A team configuration within a bulk import request."""
+
+    config: Dict[str, Any]
+    team_id: Optional[str] = None  # Fixed id for preset teams
+    source: str = ""  # e.g. the file name, echoed back in the report
+
+
+class TeamConfigBulkRequest(KernelBaseModel):
+    """Request model for importing several team configurations at once."""
+
+    teams: List[TeamConfigImport]
+
+
 class PlanWithSteps(Plan):
     """Plan model that includes the associated steps."""
 
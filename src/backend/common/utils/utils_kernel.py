@@ -1,5 +1,6 @@
 """Utility functions for Semantic Kernel integration and agent management."""
 
+import hashlib
 import logging
 from typing import Any, Dict
 
@@ -7,6 +8,7 @@ from typing import Any, Dict
 from semantic_kernel.agents.azure_ai.azure_ai_agent import AzureAIAgent
 from v3.magentic_agents.foundry_agent import FoundryAgentTemplate
 
+from v3.common.services.async_ttl_cache import AsyncTTLCache
 from v3.config.agent_registry import agent_registry
 
 logging.basicConfig(level=logging.INFO)
@@ -15,6 +17,10 @@ logging.basicConfig(level=logging.INFO)
 agent_instances: Dict[str, Dict[str, Any]] = {}
 azure_agent_instances: Dict[str, Dict[str, AzureAIAgent]] = {}
 
+# RAI verdicts of team configuration content by content hash. Concurrent checks of
+# the same content share one agent call; only passing verdicts are kept.
+_team_config_rai_verdicts: AsyncTTLCache[bool] = AsyncTTLCache(ttl=3600)
+
 
 async def create_RAI_agent() -> FoundryAgentTemplate:
     """Create and initialize a FoundryAgentTemplate for RAI checks."""
@@ -172,8 +178,14 @@ async def rai_validate_team_config(team_config_json: dict) -> tuple[bool, str]:
         if not combined_content.strip():
             return False, "Team configuration contains no readable text content"
 
-        # Use existing RAI validation function
-        rai_result = await rai_success(combined_content)
+        # Use existing RAI validation function, reusing earlier verdicts for the same content
+        content_key = hashlib.sha256(combined_content.encode("utf-8")).hexdigest()
+        rai_result = await _team_config_rai_verdicts.get(
+            content_key, lambda: rai_success(combined_content)
+        )
+        if not rai_result:
+            # Blocked or failed checks are not remembered, so they are re-evaluated next time
+            _team_config_rai_verdicts.invalidate(content_key)
 
         if not rai_result:
             return (
@@ -0,0 +1,93 @@
+"""
+Micro-benchmark for citation stripping.
+
+Compares the single precompiled pattern in v3.callbacks.response_handlers with
+the previous six sequential re.sub passes on transcripts shaped like real agent
+output. Run from src/backend:
+
+    python tests/benchmarks/bench_citations.py
+"""
+
+import os
+import re
+import sys
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from v3.callbacks.response_handlers import (  # noqa: E402
+    StreamingCitationFilter,
+    clean_citations,
+)
+
+
+def legacy_clean_citations(text: str) -> str:
+    """The original implementation: one regex pass per marker shape."""
+    if not text:
+        return text
+    text = re.sub(r"\[\d+:\d+\|source\]", "", text)
+    text = re.sub(r"\[\s*source\s*\]", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\[\d+\]", "", text)
+    text = re.sub(r"【[^】]*】", "", text)
+    text = re.sub(r"\(source:[^)]*\)", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\[source:[^\]]*\]", "", text, flags=re.IGNORECASE)
+    return text
+
+
+PARAGRAPH = (
+    "Based on the onboarding policy [9:0|source], new hires receive equipment on "
+    "day one [source]. Benefits enrolment closes after 30 days [3] 【4:0†handbook.pdf】. "
+    "Payroll is processed bi-weekly (Source: payroll FAQ) and laptops follow the "
+    "standard image [source: it-standards.md]. Plain text without markers follows "
+    "to keep the ratio realistic for longer answers from the agents.\n"
+)
+
+TRANSCRIPTS = {
+    "short": PARAGRAPH,
+    "medium": PARAGRAPH * 10,
+    "long": PARAGRAPH * 100,
+}
+
+
+def _stream(text: str, chunk_size: int = 8) -> str:
+    stream_filter = StreamingCitationFilter()
+    parts = [stream_filter.feed(text[i : i + chunk_size]) for i in range(0, len(text), chunk_size)]
+    parts.append(stream_filter.flush())
+    return "".join(parts)
+
+
+def _legacy_stream(text: str, chunk_size: int = 8) -> str:
+    return "".join(
+        legacy_clean_citations(text[i : i + chunk_size]) for i in range(0, len(text), chunk_size)
+    )
+
+
+def main() -> None:
+    for name, text in TRANSCRIPTS.items():
+        assert clean_citations(text) == legacy_clean_citations(text)
+        number = max(10, 20000 // len(TRANSCRIPTS[name]) * 10)
+        legacy = timeit.timeit(lambda: legacy_clean_citations(text), number=number)
+        single = timeit.timeit(lambda: clean_citations(text), number=number)
+        stream_runs = max(1, number // 10)
+        legacy_streamed = timeit.timeit(lambda: _legacy_stream(text), number=stream_runs) / stream_runs
+        streamed = timeit.timeit(lambda: _stream(text), number=stream_runs) / stream_runs
+        print(
+            f"{name:>6} ({len(text):>6} chars, {number} runs): "
+            f"legacy {legacy * 1e6 / number:8.1f} us  "
+            f"single-pass {single * 1e6 / number:8.1f} us  "
+            f"speedup {legacy / single:4.2f}x  "
+            f"| 8-char chunks: legacy {legacy_streamed * 1e6:8.1f} us  "
+            f"filter {streamed * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
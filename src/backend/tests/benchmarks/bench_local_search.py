@@ -0,0 +1,90 @@
+"""
+Benchmark for the local BM25 search backend.
+
+Builds the index over data/datasets, replicated to a few corpus sizes, and
+reports build, save/load and incremental sync times, index file size and
+query latency. Compare the query latencies with the remote Azure AI Search
+latencies that ReasoningSearch logs ("Searched <index> for ...: N results in
+X ms"). Run from src/backend:
+
+    python tests/benchmarks/bench_local_search.py
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from v3.magentic_agents.common.bm25_index import BM25Index  # noqa: E402
+
+DATASETS = Path(__file__).parent.parent.parent.parent.parent / "data" / "datasets"
+
+QUERIES = [
+    "customer churn reasons",
+    "loyalty program points balance",
+    "product return rates by category",
+    "delivery performance late orders",
+    "social media sentiment",
+    "unauthorized access attempts",
+    "email marketing open rate",
+    "competitor pricing dresses shoes",
+]
+
+
+def _replicate(target: Path, copies: int) -> None:
+    for n in range(copies):
+        for source in DATASETS.iterdir():
+            if source.is_file():
+                shutil.copyfile(source, target / f"{source.stem}_{n}{source.suffix}")
+
+
+def _timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - started) * 1e3
+
+
+def main() -> None:
+    for copies in (1, 100, 1000):
+        with tempfile.TemporaryDirectory() as temp:
+            data_dir = Path(temp) / "data"
+            data_dir.mkdir()
+            _replicate(data_dir, copies)
+            index_path = str(Path(temp) / "index.json.gz")
+            corpus_bytes = sum(f.stat().st_size for f in data_dir.iterdir())
+
+            index = BM25Index()
+            _, build_ms = _timed(index.sync_directory, str(data_dir))
+            _, save_ms = _timed(index.save, index_path)
+            loaded, load_ms = _timed(BM25Index.load, index_path)
+            _, sync_ms = _timed(loaded.sync_directory, str(data_dir))
+
+            latencies = []
+            for _ in range(20):
+                for query in QUERIES:
+                    _, elapsed_ms = _timed(loaded.search, query, 3)
+                    latencies.append(elapsed_ms)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(
+                f"x{copies:<4} {corpus_bytes / 1e6:6.2f} MB, {len(index):>5} docs: "
+                f"build {build_ms:8.1f} ms  save {save_ms:7.1f} ms  "
+                f"load {load_ms:7.1f} ms  ({os.path.getsize(index_path) / 1e6:5.2f} MB)  "
+                f"no-op sync {sync_ms:6.1f} ms  "
+                f"| query p50 {statistics.median(latencies):6.2f} ms  p95 {p95:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark for agent resolution in PlanToMPlanConverter.
+
+Compares the Aho-Corasick window scan with the previous per-name linear scan
+for generated plans of several sizes and team sizes. Run from src/backend:
+
+    python tests/benchmarks/bench_plan_agent_matching.py
+"""
+
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from v3.orchestration.helper.plan_to_mplan_converter import \
+    PlanToMPlanConverter  # noqa: E402
+
+
+class LegacyConverter(PlanToMPlanConverter):
+    """Converter using the original linear window scan."""
+
+    def _try_window_agent(self, text):
+        head_segment = text[: self.detection_window].lower()
+        for canonical in self.team:
+            if canonical.lower() in head_segment:
+                pattern = re.compile(re.escape(canonical), re.IGNORECASE)
+                cleaned = pattern.sub("", text, count=1)
+                cleaned = cleaned.replace("*", "")
+                return canonical, cleaned.strip()
+        return None, text
+
+
+def _make_case(team_size: int, steps: int, rng: random.Random):
+    team = [f"{rng.choice(['Research', 'Document', 'Hr', 'Tech', 'Sales'])}Agent{i}" for i in range(team_size)]
+    lines = []
+    for _ in range(steps):
+        agent = rng.choice(team)
+        lines.append(
+            rng.choice(
+                [
+                    f"- {agent} to gather the data for the next milestone",
+                    f"- Ask {agent.lower()} to review the draft",
+                    f"- **{agent}** to prepare the summary",
+                    "- Consolidate the findings into the final answer",
+                ]
+            )
+        )
+    return team, "\n".join(lines)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for team_size in (5, 20, 100, 500):
+        team, plan_text = _make_case(team_size, 300, rng)
+        legacy = LegacyConverter(team=team)
+        current = PlanToMPlanConverter(team=team)
+        assert legacy.parse(plan_text).steps == current.parse(plan_text).steps
+
+        number = 20
+        legacy_time = timeit.timeit(lambda: legacy.parse(plan_text), number=number) / number
+        current_time = timeit.timeit(lambda: current.parse(plan_text), number=number) / number
+        print(
+            f"team {team_size:>4}, 300 steps: legacy {legacy_time * 1e3:7.2f} ms  "
+            f"aho-corasick {current_time * 1e3:7.2f} ms  speedup {legacy_time / current_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Tests for the async TTL cache and the cached lookups of team validation.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Backend modules import each other relative to src/backend
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from v3.common.services import team_service  # noqa: E402
+from v3.common.services.async_ttl_cache import AsyncTTLCache  # noqa: E402
+
+
+def _counting_loader(values, delay=0.02):
+    """A loader returning `values` in order (raising the exceptions among them)."""
+    calls = []
+
+    async def loader():
+        calls.append(time.monotonic())
+        await asyncio.sleep(delay)
+        value = values[min(len(calls), len(values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return loader, calls
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        cache = AsyncTTLCache(ttl=60)
+        loader, calls = _counting_loader(["v1"])
+        results = await asyncio.gather(*(cache.get("k", loader) for _ in range(10)))
+        assert await cache.get("k", loader) == "v1"
+        return results, calls, cache.stats()
+
+    results, calls, stats = asyncio.run(scenario())
+    assert results == ["v1"] * 10 and len(calls) == 1
+    assert stats["loads"] == 1 and stats["shared_loads"] == 9 and stats["hits"] == 1
+
+
+def test_stale_values_are_served_while_refreshing():
+    async def scenario():
+        cache = AsyncTTLCache(ttl=0.05, stale_ttl=10)
+        loader, calls = _counting_loader(["v1", "v2"])
+        await cache.get("k", loader)
+        await asyncio.sleep(0.06)
+        stale = await cache.get("k", loader)  # returns at once, refresh runs behind
+        await asyncio.sleep(0.05)
+        return stale, await cache.get("k", loader), len(calls)
+
+    assert asyncio.run(scenario()) == ("v1", "v2", 2)
+
+
+def test_failed_loads_are_not_cached():
+    async def scenario():
+        cache = AsyncTTLCache(ttl=60)
+        loader, calls = _counting_loader([RuntimeError("down"), "v2"])
+        with pytest.raises(RuntimeError):
+            await cache.get("k", loader)
+        return await cache.get("k", loader), len(calls), cache.stats()["load_errors"]
+
+    assert asyncio.run(scenario()) == ("v2", 2, 1)
+
+
+def test_size_is_bounded_and_expired_entries_are_dropped():
+    async def scenario():
+        cache = AsyncTTLCache(ttl=0.05, max_size=2)
+
+        async def load(value):
+            return value
+
+        await cache.get("a", lambda: load(1))
+        await cache.get("b", lambda: load(2))
+        await cache.get("a", lambda: load(1))  # "b" is now the least recently used
+        await cache.get("c", lambda: load(3))
+        kept = sorted(cache._values)
+        await asyncio.sleep(0.06)
+        await cache.get("d", lambda: load(4))
+        return kept, sorted(cache._values), cache.stats()
+
+    kept, after_expiry, stats = asyncio.run(scenario())
+    assert kept == ["a", "c"] and stats["evictions"] == 1
+    assert after_expiry == ["d"] and stats["expired"] == 2 and stats["entries"] == 1
+
+
+def test_team_validation_reuses_listings_and_refreshes_on_miss(monkeypatch):
+    deployments = [[{"name": "gpt-4.1", "status": "Succeeded"}]]
+    listings = []
+
+    class FakeFoundryService:
+        async def list_model_deployments(self):
+            listings.append("deployments")
+            await asyncio.sleep(0.02)
+            return deployments[-1]
+
+    class FakeSearchIndexClient:
+        def __init__(self, endpoint, credential):
+            pass
+
+        def list_index_names(self):
+            listings.append("indexes")
+            time.sleep(0.02)
+            return ["docs"]
+
+    monkeypatch.setattr(team_service, "FoundryService", FakeFoundryService)
+    monkeypatch.setattr(team_service, "SearchIndexClient", FakeSearchIndexClient)
+    team_service._deployments_cache.invalidate()
+    team_service._index_names_cache.invalidate()
+
+    def team(model, index):
+        return {"agents": [{"deployment_name": model, "type": "RAG", "index_name": index}]}
+
+    async def scenario():
+        service = team_service.TeamService()
+        service.search_endpoint = "https://search.example.com"
+        checks = [service.validate_team_models(team("gpt-4.1", "docs")) for _ in range(5)]
+        checks += [service.validate_team_search_indexes(team("gpt-4.1", "docs")) for _ in range(5)]
+        results = await asyncio.gather(*checks)
+        shared = list(listings)
+
+        # A model deployed after the list was cached is found with one refresh
+        deployments.append(deployments[0] + [{"name": "gpt-5", "status": "Succeeded"}])
+        new_model = await service.validate_team_models(team("gpt-5", "docs"))
+        missing_index = await service.validate_team_search_indexes(team("gpt-4.1", "nope"))
+        return results, shared, new_model, missing_index
+
+    results, shared, new_model, missing_index = asyncio.run(scenario())
+    assert all(result == (True, []) for result in results)
+    assert sorted(shared) == ["deployments", "indexes"]
+    assert new_model == (True, [])
+    assert missing_index == (False, ["Search index 'nope' does not exist"])
+    assert listings.count("deployments") == 2 and listings.count("indexes") == 2
+
+
+def test_empty_deployment_listings_are_not_cached(monkeypatch):
+    listings = [[], [{"name": "gpt-4.1", "status": "Succeeded"}]]
+
+    class FakeFoundryService:
+        async def list_model_deployments(self):
+            return listings.pop(0)  # returns [] when the management API call fails
+
+    monkeypatch.setattr(team_service, "FoundryService", FakeFoundryService)
+    team_service._deployments_cache.invalidate()
+
+    async def scenario():
+        service = team_service.TeamService()
+        failed = await service.get_deployment_status_summary()
+        recovered = await service.get_deployment_status_summary()
+        return failed, recovered
+
+    failed, recovered = asyncio.run(scenario())
+    assert failed["total_deployments"] == 0
+    assert recovered["successful_deployments"] == ["gpt-4.1"] and listings == []
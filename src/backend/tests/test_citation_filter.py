@@ -0,0 +1,112 @@
+"""
+Tests for citation stripping on complete and streamed agent responses.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Backend modules import each other relative to src/backend
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from semantic_kernel.contents import StreamingChatMessageContent  # noqa: E402
+from semantic_kernel.contents.utils.author_role import AuthorRole  # noqa: E402
+from v3.callbacks import response_handlers  # noqa: E402
+from v3.callbacks.response_handlers import (  # noqa: E402
+    StreamingCitationFilter,
+    clean_citations,
+    clear_stream_filters,
+    streaming_agent_response_callback,
+)
+from v3.config.settings import ConnectionConfig  # noqa: E402
+
+SAMPLE = (
+    "Revenue grew 12% year over year [9:0|source]. Churn fell [source] to 3% [2].\n"
+    "- Hiring plan approved 【4:0†policy.pdf】 (Source: HR handbook)\n"
+    "- Budget [SOURCE: finance.xlsx] is unchanged; see [appendix] and (notes).\n"
+    "Trailing bracket [ and paren ( stay as-is."
+)
+
+
+def test_clean_citations_removes_all_marker_shapes():
+    cleaned = clean_citations(SAMPLE)
+    for marker in ("[9:0|source]", "[source]", "[2]", "【", "(Source:", "[SOURCE:"):
+        assert marker not in cleaned
+    assert "[appendix]" in cleaned
+    assert "(notes)" in cleaned
+    assert cleaned.endswith("Trailing bracket [ and paren ( stay as-is.")
+
+
+def test_clean_citations_passes_through_empty_text():
+    assert clean_citations("") == ""
+    assert clean_citations(None) is None
+
+
+def test_streamed_output_matches_batch_output_for_random_splits():
+    rng = random.Random(1234)
+    expected = clean_citations(SAMPLE)
+    for _ in range(500):
+        cuts = sorted(rng.sample(range(1, len(SAMPLE)), rng.randint(1, 40)))
+        chunks = [SAMPLE[i:j] for i, j in zip([0] + cuts, cuts + [len(SAMPLE)])]
+
+        stream_filter = StreamingCitationFilter()
+        streamed = "".join(stream_filter.feed(chunk) for chunk in chunks)
+        streamed += stream_filter.flush()
+
+        assert streamed == expected
+
+
+def test_unterminated_marker_is_released_once_carry_limit_is_exceeded():
+    stream_filter = StreamingCitationFilter()
+    stream_filter.max_carry = 8
+
+    assert stream_filter.feed("see 【") == "see "
+    assert stream_filter.feed("this is not a citation") == "【this is not a citation"
+    assert stream_filter.flush() == ""
+
+
+def test_unbalanced_brackets_may_differ_from_batch_output():
+    # Only well-formed markers are guaranteed to match clean_citations()
+    text = "(source:source【【)"
+    stream_filter = StreamingCitationFilter()
+    streamed = stream_filter.feed(text) + stream_filter.flush()
+
+    assert clean_citations(text) == ""
+    assert streamed == text
+
+
+def test_final_chunk_is_sent_even_when_only_a_citation_remains(monkeypatch):
+    connections = ConnectionConfig()
+    monkeypatch.setattr(response_handlers, "connection_config", connections)
+    queue = connections.subscribe_events("user-1")
+
+    async def stream():
+        for content, is_final in (("Done [9:", False), ("0|source]", True)):
+            chunk = StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT, choice_index=0, name="HRAgent", content=content
+            )
+            await streaming_agent_response_callback(chunk, is_final, user_id="user-1")
+
+    asyncio.run(stream())
+    sent = [json.loads(queue.get_nowait()[2])["data"] for _ in range(queue.qsize())]
+    assert [(m["content"], m["is_final"]) for m in sent] == [("Done ", False), ("", True)]
+
+
+def test_stream_filters_of_a_user_are_cleared():
+    response_handlers._stream_filters[("user-2", "HRAgent")] = StreamingCitationFilter()
+    response_handlers._stream_filters[("user-3", "HRAgent")] = StreamingCitationFilter()
+    clear_stream_filters("user-2")
+    assert list(response_handlers._stream_filters) == [("user-3", "HRAgent")]
+    clear_stream_filters("user-3")
@@ -0,0 +1,121 @@
+"""
+Tests for the shared WebSocket / Server-Sent Events fan-out in ConnectionConfig.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Backend modules import each other relative to src/backend
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from v3.config.settings import ConnectionConfig  # noqa: E402
+from v3.models.messages import AgentMessage, WebsocketMessageType  # noqa: E402
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_websocket_and_sse_share_one_payload():
+    connections = ConnectionConfig()
+    websocket = FakeWebSocket()
+    connections.add_connection("proc-1", websocket, user_id="user-1")
+    queue = connections.subscribe_events("user-1")
+
+    message = AgentMessage(agent_name="HRAgent", timestamp="1", content="hello")
+    await connections.send_status_update_async(
+        message, "user-1", message_type=WebsocketMessageType.AGENT_MESSAGE
+    )
+
+    event_id, event_type, payload = queue.get_nowait()
+    assert event_type == "agent_message"
+    assert websocket.sent == [payload]
+    assert json.loads(payload)["data"]["content"] == "hello"
+    assert connections.metrics["events_published"] == 1
+    assert connections.metrics["websocket_messages_sent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sse_only_user_receives_events_without_websocket():
+    connections = ConnectionConfig()
+    queue = connections.subscribe_events("user-2")
+
+    await connections.send_status_update_async({"status": "ok"}, "user-2")
+
+    _, event_type, payload = queue.get_nowait()
+    assert event_type == "system_message"
+    assert json.loads(payload) == {"type": "system_message", "data": {"status": "ok"}}
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_only_newer_events():
+    connections = ConnectionConfig()
+    for i in range(5):
+        await connections.send_status_update_async({"n": i}, "user-3")
+
+    history = connections.get_event_history("user-3")
+    resume_after = history[2][0]
+
+    queue = connections.subscribe_events("user-3", last_event_id=resume_after)
+    replayed = [json.loads(queue.get_nowait()[2])["data"]["n"] for _ in range(queue.qsize())]
+    assert replayed == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events():
+    connections = ConnectionConfig()
+    connections.subscriber_queue_size = 2
+    queue = connections.subscribe_events("user-4")
+
+    for i in range(3):
+        await connections.send_status_update_async({"n": i}, "user-4")
+
+    remaining = [json.loads(queue.get_nowait()[2])["data"]["n"] for _ in range(queue.qsize())]
+    assert remaining == [1, 2]
+    assert connections.metrics["events_dropped"] == 1
+
+    connections.unsubscribe_events("user-4", queue)
+    assert not connections.has_event_subscribers("user-4")
+
+
+@pytest.mark.asyncio
+async def test_event_history_is_dropped_on_close_and_after_ttl():
+    connections = ConnectionConfig()
+    connections.add_connection("proc-5", FakeWebSocket(), user_id="user-5")
+    await connections.send_status_update_async({"n": 0}, "user-5")
+    await connections.close_connection("proc-5")
+    assert connections.get_event_history("user-5") == []
+
+    connections.event_history_ttl = 0.0
+    queue = connections.subscribe_events("user-6")
+    await connections.send_status_update_async({"n": 0}, "user-6")
+    await connections.send_status_update_async({"n": 0}, "user-7")
+    await connections.send_status_update_async({"n": 1}, "user-6")
+    # user-7 has no subscriber and expired; user-6 is still subscribed
+    assert connections.get_event_history("user-7") == []
+    assert len(connections.get_event_history("user-6")) == 2
+
+    connections.unsubscribe_events("user-6", queue)
+    await connections.send_status_update_async({"n": 0}, "user-8")
+    assert connections.get_event_history("user-6") == []
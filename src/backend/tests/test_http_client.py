@@ -0,0 +1,119 @@
+"""
+Tests for the shared HTTP client: retries, Retry-After, circuit breaking and release.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Backend modules import each other relative to src/backend
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from v3.common.services import http_client  # noqa: E402
+from v3.common.services.base_api_service import BaseAPIService  # noqa: E402
+from v3.common.services.http_client import CircuitOpenError, RetryPolicy, retry_after_seconds  # noqa: E402
+
+FAST = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_max=0.01)
+
+
+def _serve(responses, scenario):
+    """Serve `responses` (status, headers) in order on /x, then 200s; run scenario(base_url, hits)."""
+    hits = []
+
+    async def handler(request):
+        hits.append(request.method)
+        status, headers = responses[len(hits) - 1] if len(hits) <= len(responses) else (200, {})
+        return web.json_response({"hit": len(hits)}, status=status, headers=headers)
+
+    async def main():
+        http_client._breakers.clear()
+        http_client._metrics.clear()
+        app = web.Application()
+        app.router.add_route("*", "/x", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(f"http://127.0.0.1:{port}", hits)
+        finally:
+            await http_client.close_shared_session()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_retries_5xx_and_honors_retry_after():
+    async def scenario(base_url, hits):
+        service = BaseAPIService(base_url, retry_policy=FAST)
+        body = await service.get_json("x")
+        return body, hits, http_client.http_metrics()
+
+    body, hits, metrics = _serve([(503, {}), (429, {"Retry-After": "0"})], scenario)
+    assert body == {"hit": 3} and hits == ["GET"] * 3
+    (endpoint,) = metrics["endpoints"].values()
+    assert endpoint["requests"] == 3 and endpoint["retries"] == 2 and endpoint["failures"] == 1
+
+
+def test_posts_retry_only_when_refused():
+    async def scenario(base_url, hits):
+        service = BaseAPIService(base_url, retry_policy=FAST)
+        assert await service.post_json("x", json={}) == {"hit": 2}  # 429: not processed, retried
+        with pytest.raises(Exception) as raised:
+            await service.post_json("x", json={})  # 500 may have been processed
+        return raised.value.status, hits
+
+    status, hits = _serve([(429, {}), (200, {}), (500, {})], scenario)
+    assert status == 500 and len(hits) == 3
+
+
+def test_circuit_opens_after_repeated_failures_and_recovers():
+    async def scenario(base_url, hits):
+        breaker = http_client.get_breaker(base_url.split("//")[1])
+        breaker.failure_threshold, breaker.reset_timeout = 2, 0.05
+        service = BaseAPIService(base_url, retry_policy=RetryPolicy(max_attempts=1))
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await service.get_json("x")
+        with pytest.raises(CircuitOpenError):
+            await service.get_json("x")
+        sent_while_open = len(hits)
+        await asyncio.sleep(0.06)
+        body = await service.get_json("x")  # the half-open probe succeeds
+        return sent_while_open, body, breaker.state
+
+    sent_while_open, body, state = _serve([(500, {}), (500, {})], scenario)
+    assert sent_while_open == 2 and body == {"hit": 3} and state == "closed"
+
+
+def test_responses_are_released_and_connections_reused():
+    async def scenario(base_url, hits):
+        service = BaseAPIService(base_url, retry_policy=FAST)
+        for _ in range(5):
+            with pytest.raises(Exception):
+                await service.get_json("x")  # 404s raise before the body is read
+        connector = http_client.get_shared_session().connector
+        return sum(len(c) for c in connector._conns.values()), len(connector._acquired)
+
+    idle, acquired = _serve([(404, {})] * 5, scenario)
+    assert acquired == 0 and idle == 1  # one kept-alive connection, nothing leaked
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds("2.5") == 2.5
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after_seconds("soon") is None and retry_after_seconds(None) is None
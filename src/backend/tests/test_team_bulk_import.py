@@ -0,0 +1,133 @@
+"""
+Tests for the bulk team configuration import and batched Cosmos DB writes.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Backend modules import each other relative to src/backend
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from common.database.cosmosdb import CosmosDBClient  # noqa: E402
+from common.models.messages_kernel import TeamConfigImport  # noqa: E402
+from v3.common.services.team_service import TeamService  # noqa: E402
+
+
+def _config(name, model="gpt-4o"):
+    return {
+        "name": name,
+        "status": "visible",
+        "agents": [{"input_key": "a", "type": "t", "name": "Agent", "icon": "i", "deployment_name": model}],
+        "starting_tasks": [
+            {"id": "1", "name": "Task", "prompt": "Do it", "created": "", "creator": "", "logo": ""}
+        ],
+    }
+
+
+class FakeDatabase:
+    def __init__(self, existing_ids=()):
+        self.existing_ids = set(existing_ids)
+        self.saved = []
+
+    async def get_team(self, team_id):
+        return type("Team", (), {"team_id": team_id})() if team_id in self.existing_ids else None
+
+    async def add_teams(self, teams):
+        self.saved.append(teams)
+        return {team.id: "Conflict (409)" for team in teams if team.name == "unlucky"}
+
+
+def test_import_reports_each_team_and_saves_valid_ones_together(monkeypatch):
+    checked = []
+
+    async def content_check(config):
+        checked.append(config["name"])
+        return config["name"] != "rude", "inappropriate"
+
+    async def validate_models(self, config):
+        model = config.get("agents", [{}])[0].get("deployment_name")
+        return model != "missing", [model] if model == "missing" else []
+
+    async def validate_indexes(self, config):
+        return True, []
+
+    monkeypatch.setattr(TeamService, "validate_team_models", validate_models)
+    monkeypatch.setattr(TeamService, "validate_team_search_indexes", validate_indexes)
+    database = FakeDatabase(existing_ids={"preset-1"})
+    imports = [
+        TeamConfigImport(source="hr.json", team_id="preset-1", config=_config("HR")),
+        TeamConfigImport(source="new.json", team_id="preset-2", config=_config("New")),
+        TeamConfigImport(source="again.json", team_id="preset-2", config=_config("New")),
+        TeamConfigImport(source="mine.json", config=_config("Mine")),
+        TeamConfigImport(source="rude.json", config=_config("rude")),
+        TeamConfigImport(source="model.json", config=_config("Model", model="missing")),
+        TeamConfigImport(source="broken.json", config={"name": "Broken"}),
+        TeamConfigImport(source="unlucky.json", config=_config("unlucky")),
+        TeamConfigImport(source="sneaky.json", team_id="any-id", config=_config("rude")),
+    ]
+
+    reports = asyncio.run(
+        TeamService(database).import_team_configurations(imports, "user-1", content_check)
+    )
+
+    statuses = [report["status"] for report in reports]
+    assert statuses == [
+        "exists", "created", "duplicate", "created", "invalid", "invalid", "invalid", "failed", "invalid"
+    ]
+    assert reports[1]["team_id"] == "preset-2" and reports[3]["team_id"]
+    assert reports[4]["errors"] == ["inappropriate"]
+    assert "missing" in reports[5]["errors"][0]
+    assert "Missing required field: status" in reports[6]["errors"][0]
+    assert reports[7]["errors"] == ["Failed to save configuration: Conflict (409)"]
+    # A team_id does not skip the RAI check; teams that are not saved anyway are not checked
+    assert reports[8]["errors"] == ["inappropriate"]
+    assert sorted(checked) == ["Broken", "Mine", "Model", "New", "rude", "rude", "unlucky"]
+    # All valid teams go to the database in one call
+    (saved,) = database.saved
+    assert [team.name for team in saved] == ["New", "Mine", "unlucky"]
+    assert len({team.session_id for team in saved}) == 3
+
+
+def test_add_teams_writes_each_team_with_bounded_concurrency():
+    class FakeContainer:
+        def __init__(self):
+            self.documents = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def create_item(self, body):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0)
+                if body["name"] == "T3":
+                    raise RuntimeError("Conflict (409)")
+                self.documents.append(body)
+            finally:
+                self.in_flight -= 1
+
+    service = TeamService()
+    teams = [
+        asyncio.run(service.validate_and_parse_team_config(_config(f"T{i}"), "user-1")) for i in range(10)
+    ]
+    client = CosmosDBClient("https://cosmos", None, "db", "container")
+    client.container, client._initialized = FakeContainer(), True
+
+    failed = asyncio.run(client.add_teams(teams, max_concurrency=4))
+
+    # A failed write only fails its own team, with the error Cosmos DB returned
+    assert failed == {teams[3].id: "Conflict (409)"}
+    assert len(client.container.documents) == 9 and client.container.max_in_flight == 4
+    assert len({document["session_id"] for document in client.container.documents}) == 9
+    assert isinstance(client.container.documents[0]["timestamp"], str)
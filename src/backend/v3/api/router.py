@@ -11,6 +11,7 @@ from common.models.messages_kernel import (
     InputTask,
     Plan,
     PlanStatus,
+    TeamConfigBulkRequest,
     TeamSelectionRequest,
 )
 from common.utils.event_utils import track_event_if_configured
@@ -19,6 +20,7 @@ from fastapi import (
     APIRouter,
     BackgroundTasks,
     File,
+    Header,
     HTTPException,
     Query,
     Request,
@@ -26,6 +28,8 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
+from fastapi.responses import StreamingResponse
+from v3.callbacks.response_handlers import clear_stream_filters
 from v3.common.services.plan_service import PlanService
 from v3.common.services.team_service import TeamService
 from v3.config.settings import (
@@ -87,6 +91,108 @@ async def start_comms(
     finally:
         # Always clean up the connection
         await connection_config.close_connection(process_id=process_id)
+        clear_stream_filters(user_id)
+
+
+# Seconds between SSE heartbeat comments; keeps proxies from closing idle streams
+SSE_HEARTBEAT_SECONDS = 15.0
+
+
+def _format_sse_event(event_id: int, event_type: str, payload: str) -> str:
+    """Format a single Server-Sent Event frame."""
+    data_lines = "".join(f"data: {line}\n" for line in payload.splitlines() or [""])
+    return f"id: {event_id}\nevent: {event_type}\n{data_lines}\n"
+
+
+@app_v3.get("/events")
+async def stream_events(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    resume_from: Optional[int] = Query(None),
+):
+    """
+    Server-Sent Events endpoint for real-time process status updates.
+
+    Streams the same WebsocketMessageType events as the WebSocket endpoint for
+    clients whose network path does not support long-lived WebSockets. Events
+    are per user, so the stream carries all of the user's processes.
+
+    ---
+    tags:
+      - Events
+    parameters:
+      - name: user_principal_id
+        in: header
+        type: string
+        required: true
+        description: User ID extracted from the authentication header
+      - name: Last-Event-ID
+        in: header
+        type: string
+        required: false
+        description: Resume the stream after this event id (sent automatically by EventSource on reconnect)
+      - name: resume_from
+        in: query
+        type: integer
+        required: false
+        description: Same as Last-Event-ID, for clients that cannot set headers
+    responses:
+      200:
+        description: text/event-stream of status updates
+      401:
+        description: Missing or invalid user information
+    """
+    authenticated_user = get_authenticated_user_details(request_headers=request.headers)
+    user_id = authenticated_user["user_principal_id"]
+    if not user_id:
+        raise HTTPException(
+            status_code=401, detail="Missing or invalid user information"
+        )
+
+    resume_id = resume_from
+    if last_event_id:
+        try:
+            resume_id = int(last_event_id)
+        except ValueError:
+            logger.warning("Ignoring invalid Last-Event-ID header: %s", last_event_id)
+
+    queue = connection_config.subscribe_events(user_id, last_event_id=resume_id)
+    track_event_if_configured(
+        "SSEConnectionAccepted", {"user_id": user_id}
+    )
+
+    async def event_generator():
+        try:
+            # Tell EventSource how long to wait before reconnecting
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event_id, event_type, payload = await asyncio.wait_for(
+                        queue.get(), timeout=SSE_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": heartbeat\n\n"
+                    continue
+                connection_config.metrics["sse_events_sent"] += 1
+                yield _format_sse_event(event_id, event_type, payload)
+        finally:
+            connection_config.unsubscribe_events(user_id, queue)
+            track_event_if_configured(
+                "SSEDisconnect", {"user_id": user_id}
+            )
+            logger.info(f"SSE client disconnected for user {user_id}")
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @app_v3.get("/init_team")
@@ -819,6 +925,110 @@ async def upload_team_config(
         raise HTTPException(status_code=500, detail="Internal server error occurred")
 
 
+@app_v3.post("/team_configs/bulk")
+async def bulk_upload_team_configs(body: TeamConfigBulkRequest, request: Request):
+    """
+    Validate and save several team configurations in one request.
+
+    Validation is shared across the teams (one deployment listing, one index
+    listing, cached RAI verdicts) and runs concurrently; valid teams are
+    written concurrently, each on its own, so one failed write only fails
+    that team's report.
+
+    ---
+    tags:
+      - Team Configuration
+    parameters:
+      - name: user_principal_id
+        in: header
+        type: string
+        required: true
+        description: User ID extracted from the authentication header
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            teams:
+              type: array
+              items:
+                type: object
+                properties:
+                  config:
+                    type: object
+                    description: Team configuration, as for upload_team_config
+                  team_id:
+                    type: string
+                    description: Fixed team ID; existing teams are skipped
+                  source:
+                    type: string
+                    description: Label echoed in the report, e.g. the file name
+    responses:
+      200:
+        description: Per-team report
+        schema:
+          type: object
+          properties:
+            summary:
+              type: object
+              description: Number of teams per status
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  source:
+                    type: string
+                  team_id:
+                    type: string
+                  name:
+                    type: string
+                  status:
+                    type: string
+                    description: created, exists, duplicate, invalid or failed
+                  errors:
+                    type: array
+                    items:
+                      type: string
+      400:
+        description: No team configurations provided
+      401:
+        description: Missing or invalid user information
+      500:
+        description: Internal server error
+    """
+    # Validate user authentication
+    authenticated_user = get_authenticated_user_details(request_headers=request.headers)
+    user_id = authenticated_user["user_principal_id"]
+    if not user_id:
+        raise HTTPException(
+            status_code=401, detail="Missing or invalid user information"
+        )
+
+    if not body.teams:
+        raise HTTPException(status_code=400, detail="No team configurations provided")
+
+    try:
+        memory_store = await DatabaseFactory.get_database(user_id=user_id)
+        team_service = TeamService(memory_store)
+        results = await team_service.import_team_configurations(
+            body.teams, user_id, content_check=rai_validate_team_config
+        )
+    except Exception as e:
+        logging.error(f"Unexpected error importing team configurations: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error occurred")
+
+    summary: dict = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    track_event_if_configured(
+        "Team configurations bulk uploaded",
+        {"user_id": user_id, "teams_count": len(results), **summary},
+    )
+    return {"summary": summary, "results": results}
+
+
 @app_v3.get("/team_configs")
 async def get_team_configs(request: Request):
     """
@@ -5,8 +5,10 @@ Provides detailed monitoring and response handling for different agent types.
 
 import asyncio
 import logging
-import time
 import re
+import time
+from typing import Dict, Tuple
+
 from semantic_kernel.contents import ChatMessageContent, StreamingChatMessageContent
 from v3.config.settings import connection_config
 from v3.models.messages import (
@@ -18,22 +20,78 @@ from v3.models.messages import (
 )
 
 
+# All citation marker shapes, combined into one precompiled pattern so each
+# message is scanned in a single pass:
+#   [9:0|source]  [source]  [9]  【4:0†source】  (source: ...)  [source: ...]
+CITATION_PATTERN = re.compile(
+    r"\[(?:\d+(?::\d+\|source)?\]|(?i:\s*source\s*\]|source:[^\]]*\]))"
+    r"|【[^】]*】"
+    r"|\((?i:source:)[^)]*\)"
+)
+
+# Trailing text that may be the beginning of a citation marker whose remainder
+# has not been streamed yet (e.g. "[9:", "【4:0†sou", "(sour").
+PARTIAL_CITATION_PATTERN = re.compile(
+    r"\[(?:\d+(?::\d*(?:\|[a-z]{0,6})?)?"
+    r"|(?i:\s*(?:s(?:o(?:u(?:r(?:c(?:e\s*(?::[^\]]*)?)?)?)?)?)?)?))$"
+    r"|【[^】]*$"
+    r"|\((?i:s(?:o(?:u(?:r(?:c(?:e(?::[^)]*)?)?)?)?)?)?)?$"
+)
+
+
 def clean_citations(text: str) -> str:
     """Remove citation markers from agent responses while preserving formatting."""
     if not text:
         return text
 
-    # Remove citation patterns like [9:0|source], [9:1|source], etc.
-    text = re.sub(r'\[\d+:\d+\|source\]', '', text)
+    return CITATION_PATTERN.sub("", text)
+
+
+class StreamingCitationFilter:
+    """
+    Remove citation markers from a stream of text chunks.
+
+    A marker split across chunk boundaries (e.g. "[9:" + "0|source]") is held
+    back in a small carry-over buffer until it can be classified, so for
+    well-formed markers the concatenated output matches clean_citations() on
+    the full text. Text with unbalanced brackets around a marker (e.g.
+    "(source:x【【)") can come out differently: the open "【" is held and
+    released as text, and the enclosing marker is never seen whole.
+    """
+
+    # Held text longer than this cannot be a citation marker and is released
+    max_carry: int = 256
+
+    def __init__(self) -> None:
+        self._carry = ""
 
-    # Remove other common citation pattern
-    text = re.sub(r'\[\s*source\s*\]', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\[\d+\]', '', text)
-    text = re.sub(r'【[^】]*】', '', text)  # Unicode brackets
-    text = re.sub(r'\(source:[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\[source:[^\]]*\]', '', text, flags=re.IGNORECASE)
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the text that is safe to emit."""
+        if not chunk:
+            return ""
+        text = self._carry + chunk
+        partial = PARTIAL_CITATION_PATTERN.search(text, max(0, len(text) - self.max_carry))
+        if partial:
+            self._carry = text[partial.start() :]
+            text = text[: partial.start()]
+        else:
+            self._carry = ""
+        return CITATION_PATTERN.sub("", text)
 
-    return text
+    def flush(self) -> str:
+        """Return whatever is still buffered at the end of the stream."""
+        text, self._carry = self._carry, ""
+        return CITATION_PATTERN.sub("", text)
+
+
+# One filter per (user, agent) stream so split markers are tracked per stream
+_stream_filters: Dict[Tuple[str, str], StreamingCitationFilter] = {}
+
+
+def clear_stream_filters(user_id: str) -> None:
+    """Forget a user's stream filters, e.g. for streams cut off before their final chunk."""
+    for stream_key in [key for key in _stream_filters if key[0] == user_id]:
+        del _stream_filters[stream_key]
 
 
 def agent_response_callback(message: ChatMessageContent, user_id: str = None) -> None:
@@ -92,21 +150,36 @@ async def streaming_agent_response_callback(
     streaming_message: StreamingChatMessageContent, is_final: bool, user_id: str = None
 ) -> None:
     """Simple streaming callback to show real-time agent responses."""
+    if not user_id:
+        return
+
+    agent_name = streaming_message.name or "Unknown Agent"
+    stream_key = (user_id, agent_name)
+    stream_filter = _stream_filters.get(stream_key)
+    if stream_filter is None:
+        stream_filter = _stream_filters[stream_key] = StreamingCitationFilter()
+
     # process only content messages
-    if hasattr(streaming_message, "content") and streaming_message.content:
-        if user_id:
-            try:
-                message = AgentMessageStreaming(
-                    agent_name=streaming_message.name or "Unknown Agent",
-                    content=clean_citations(streaming_message.content),
-                    is_final=is_final,
-                )
-                await connection_config.send_status_update_async(
-                    message,
-                    user_id,
-                    message_type=WebsocketMessageType.AGENT_MESSAGE_STREAMING,
-                )
-            except Exception as e:
-                logging.error(
-                    f"Response_callback: Error sending streaming WebSocket message: {e}"
-                )
+    content = getattr(streaming_message, "content", None) or ""
+    text = stream_filter.feed(content)
+    if is_final:
+        text += stream_filter.flush()
+        _stream_filters.pop(stream_key, None)
+
+    # The final chunk is always sent, even if only a citation was left to strip
+    if text or is_final:
+        try:
+            message = AgentMessageStreaming(
+                agent_name=agent_name,
+                content=text,
+                is_final=is_final,
+            )
+            await connection_config.send_status_update_async(
+                message,
+                user_id,
+                message_type=WebsocketMessageType.AGENT_MESSAGE_STREAMING,
+            )
+        except Exception as e:
+            logging.error(
+                f"Response_callback: Error sending streaming WebSocket message: {e}"
+            )
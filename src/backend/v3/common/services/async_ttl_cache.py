@@ -0,0 +1,108 @@
+"""Small async TTL cache with single-flight loading and background refresh.
+
+- a fresh value (younger than `ttl`) is returned as is
+- a stale value (younger than `ttl + stale_ttl`) is returned immediately and
+  refreshed in the background
+- otherwise the caller waits for a load; concurrent callers of the same key
+  share that one load instead of each fetching
+- failed loads are not cached; the error goes to every waiting caller
+- at most `max_size` keys are kept, least recently used first out; storing a
+  value also drops the entries that are past `ttl + stale_ttl`
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _consume_error(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class AsyncTTLCache(Generic[T]):
+    """Values per key with a time to live; see the module docstring."""
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, max_size: int = 1024) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self._values: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._loads: Dict[Hashable, "asyncio.Future[T]"] = {}
+        self.metrics: Dict[str, int] = defaultdict(int)
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        force_refresh: bool = False,
+    ) -> T:
+        cached = self._values.get(key)
+        if cached is not None and not force_refresh:
+            self._values.move_to_end(key)
+            age = time.monotonic() - cached[0]
+            if age < self.ttl:
+                self.metrics["hits"] += 1
+                return cached[1]
+            if age < self.ttl + self.stale_ttl:
+                self.metrics["stale_hits"] += 1
+                # Refresh behind the caller; on failure the stale value is kept
+                self._load(key, loader).add_done_callback(_consume_error)
+                return cached[1]
+        self.metrics["misses"] += 1
+        return await asyncio.shield(self._load(key, loader))
+
+    def age(self, key: Hashable) -> float:
+        """Seconds since `key` was loaded (infinite if it never was)."""
+        cached = self._values.get(key)
+        return time.monotonic() - cached[0] if cached else float("inf")
+
+    def invalidate(self, key: Hashable = None) -> None:
+        if key is None:
+            self._values.clear()
+        else:
+            self._values.pop(key, None)
+
+    def _load(
+        self, key: Hashable, loader: Callable[[], Awaitable[T]]
+    ) -> "asyncio.Future[T]":
+        load = self._loads.get(key)
+        if load is not None:
+            self.metrics["shared_loads"] += 1
+            return load
+        load = self._loads[key] = asyncio.ensure_future(self._run(key, loader))
+        return load
+
+    async def _run(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        self.metrics["loads"] += 1
+        try:
+            value = await loader()
+            self._store(key, value)
+            return value
+        except Exception as e:
+            self.metrics["load_errors"] += 1
+            logger.warning("Loading %r failed: %s", key, e)
+            raise
+        finally:
+            del self._loads[key]
+
+    def _store(self, key: Hashable, value: T) -> None:
+        now = time.monotonic()
+        expired = [k for k, (loaded_at, _) in self._values.items() if now - loaded_at >= self.ttl + self.stale_ttl]
+        for k in expired:
+            del self._values[k]
+        self.metrics["expired"] += len(expired)
+        self._values[key] = (now, value)
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._values), **self.metrics}
@@ -1,14 +1,19 @@
-from typing import Any, Dict, Optional, Union
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
 import aiohttp
 from common.config.app_config import config
 
+from .http_client import DEFAULT_RETRY_POLICY, RetryPolicy, get_shared_session, send
+
 
 class BaseAPIService:
     """Minimal async HTTP API service.
 
     - Reads base endpoints from AppConfig using `from_config` factory.
     - Provides simple GET/POST helpers with JSON payloads.
+    - Sends through the shared connection pool with retries and a per-host
+      circuit breaker (see http_client); pass `session` to use your own.
     - Designed to be subclassed (e.g., MCPService, FoundryService).
     """
 
@@ -19,12 +24,14 @@ class BaseAPIService:
         default_headers: Optional[Dict[str, str]] = None,
         timeout_seconds: int = 30,
         session: Optional[aiohttp.ClientSession] = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
     ) -> None:
         if not base_url:
             raise ValueError("base_url is required")
         self.base_url = base_url.rstrip("/")
         self.default_headers = default_headers or {}
         self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self.retry_policy = retry_policy
         self._session_external = session is not None
         self._session: Optional[aiohttp.ClientSession] = session
 
@@ -51,9 +58,9 @@ class BaseAPIService:
         return cls(base_url, **kwargs)
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-        return self._session
+        if self._session_external:
+            return self._session
+        return get_shared_session()
 
     def _url(self, path: str) -> str:
         path = path or ""
@@ -61,6 +68,7 @@ class BaseAPIService:
             return self.base_url
         return f"{self.base_url}/{path.lstrip('/')}"
 
+    @asynccontextmanager
     async def _request(
         self,
         method: str,
@@ -69,13 +77,22 @@ class BaseAPIService:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Union[str, int, float]]] = None,
         json: Optional[Dict[str, Any]] = None,
-    ) -> aiohttp.ClientResponse:
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Yield the response; it is released when the block exits."""
         session = await self._ensure_session()
         url = self._url(path)
         merged_headers = {**self.default_headers, **(headers or {})}
-        return await session.request(
-            method.upper(), url, headers=merged_headers, params=params, json=json
-        )
+        async with send(
+            method,
+            url,
+            session=session,
+            retry_policy=self.retry_policy,
+            headers=merged_headers,
+            params=params,
+            json=json,
+            timeout=self.timeout,
+        ) as resp:
+            yield resp
 
     async def get_json(
         self,
@@ -84,9 +101,9 @@ class BaseAPIService:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Union[str, int, float]]] = None,
     ) -> Any:
-        resp = await self._request("GET", path, headers=headers, params=params)
-        resp.raise_for_status()
-        return await resp.json()
+        async with self._request("GET", path, headers=headers, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.json()
 
     async def post_json(
         self,
@@ -96,15 +113,16 @@ class BaseAPIService:
         params: Optional[Dict[str, Union[str, int, float]]] = None,
         json: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        resp = await self._request(
+        async with self._request(
             "POST", path, headers=headers, params=params, json=json
-        )
-        resp.raise_for_status()
-        return await resp.json()
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.json()
 
     async def close(self) -> None:
-        if self._session and not self._session.closed and not self._session_external:
-            await self._session.close()
+        # The shared pool outlives services and external sessions belong to
+        # the caller, so there is nothing to close here
+        return None
 
     async def __aenter__(self) -> "BaseAPIService":
         await self._ensure_session()
@@ -3,10 +3,11 @@ import re
 from typing import Any, Dict, List
 
 # from git import List
-import aiohttp
 from azure.ai.projects.aio import AIProjectClient
 from common.config.app_config import config
 
+from .http_client import send
+
 
 class FoundryService:
     """Helper around Azure AI Foundry's AIProjectClient.
@@ -83,34 +84,33 @@ class FoundryService:
             }
             params = {"api-version": "2024-10-01"}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        deployments = data.get("value", [])
-                        deployment_info: List[Dict[str, Any]] = []
-                        for deployment in deployments:
-                            deployment_info.append(
-                                {
-                                    "name": deployment.get("name"),
-                                    "model": deployment.get("properties", {}).get(
-                                        "model", {}
-                                    ),
-                                    "status": deployment.get("properties", {}).get(
-                                        "provisioningState"
-                                    ),
-                                    "endpoint_uri": deployment.get(
-                                        "properties", {}
-                                    ).get("scoringUri"),
-                                }
-                            )
-                        return deployment_info
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(
-                            f"Failed to list deployments. Status: {response.status}, Error: {error_text}"
+            async with send("GET", url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    deployments = data.get("value", [])
+                    deployment_info: List[Dict[str, Any]] = []
+                    for deployment in deployments:
+                        deployment_info.append(
+                            {
+                                "name": deployment.get("name"),
+                                "model": deployment.get("properties", {}).get(
+                                    "model", {}
+                                ),
+                                "status": deployment.get("properties", {}).get(
+                                    "provisioningState"
+                                ),
+                                "endpoint_uri": deployment.get(
+                                    "properties", {}
+                                ).get("scoringUri"),
+                            }
                         )
-                        return []
+                    return deployment_info
+                else:
+                    error_text = await response.text()
+                    self.logger.error(
+                        f"Failed to list deployments. Status: {response.status}, Error: {error_text}"
+                    )
+                    return []
         except Exception as e:
             self.logger.error(f"Error listing model deployments: {e}")
             return []
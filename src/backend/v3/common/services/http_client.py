@@ -0,0 +1,233 @@
+"""Shared outbound HTTP plumbing for the v3 services.
+
+- one pooled aiohttp session per event loop, with a tuned connector
+  (per-host connection limit, DNS cache, keep-alive) instead of a session per call
+- retries with exponential backoff and full jitter on 429/5xx and connection
+  errors, honoring Retry-After; non-idempotent requests are only retried
+  when they were never sent or the server refused them outright (429/503)
+- a circuit breaker per host that fails fast after repeated failures
+- responses are always released, also on error paths
+- per-endpoint latency and retry metrics (see http_metrics())
+"""
+
+import asyncio
+import logging
+import random
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised without sending when the target host's circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_base: float = 0.25  # seconds; attempt n waits up to base * 2**n
+    backoff_max: float = 8.0
+    max_retry_after: float = 30.0  # longer Retry-After values are not waited for
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    unsent_statuses: FrozenSet[int] = frozenset({429, 503})  # safe to retry for any method
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures; one probe is let through after `reset_timeout`."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        # A probe that never reported back (e.g. cancelled) does not block the circuit forever
+        if state == "half_open" and (self._probe_started is None or now - self._probe_started >= self.reset_timeout):
+            self._probe_started = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probe_started is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._probe_started = None
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_metrics: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+# aiohttp sessions are bound to the event loop they were created on
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker()
+    return breaker
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """The pooled session of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        )
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+async def close_shared_session() -> None:
+    """Close the running loop's pooled session (application shutdown)."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def http_metrics() -> Dict[str, Any]:
+    """Per-endpoint counters plus the state of every host's circuit."""
+    endpoints = {}
+    for endpoint, counters in _metrics.items():
+        requests = counters["requests"]
+        endpoints[endpoint] = {
+            "requests": int(requests),
+            "retries": int(counters["retries"]),
+            "failures": int(counters["failures"]),
+            "rejected": int(counters["rejected"]),
+            "latency_avg_ms": round(counters["latency_total_ms"] / requests, 1) if requests else 0.0,
+            "latency_max_ms": round(counters["latency_max_ms"], 1),
+        }
+    return {
+        "endpoints": endpoints,
+        "circuits": {host: breaker.state for host, breaker in _breakers.items()},
+    }
+
+
+def _record(endpoint: str, started: float, failed: bool) -> None:
+    counters = _metrics[endpoint]
+    elapsed_ms = (time.perf_counter() - started) * 1e3
+    counters["requests"] += 1
+    counters["latency_total_ms"] += elapsed_ms
+    counters["latency_max_ms"] = max(counters["latency_max_ms"], elapsed_ms)
+    if failed:
+        counters["failures"] += 1
+
+
+@asynccontextmanager
+async def send(
+    method: str,
+    url: str,
+    *,
+    session: Optional[aiohttp.ClientSession] = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    **kwargs: Any,
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Send a request with retries and circuit breaking; the response is released on exit.
+
+    The yielded response is the last attempt's, whatever its status;
+    connection errors of the last attempt are raised.
+    """
+    method = method.upper()
+    parts = urlsplit(url)
+    endpoint = f"{method} {parts.netloc}{parts.path}"
+    breaker = get_breaker(parts.netloc)
+    session = session or get_shared_session()
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            _metrics[endpoint]["rejected"] += 1
+            raise CircuitOpenError(f"Circuit open for {parts.netloc}; not sending {method} {parts.path}")
+        last_attempt = attempt + 1 >= retry_policy.max_attempts
+        started = time.perf_counter()
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            _record(endpoint, started, failed=True)
+            breaker.record_failure()
+            # Failing to connect means nothing was sent, so any method may retry
+            unsent = isinstance(e, aiohttp.ClientConnectorError)
+            if last_attempt or not (unsent or method in IDEMPOTENT_METHODS):
+                raise
+            delay = retry_policy.backoff(attempt)
+            logger.warning("%s failed (%s); retry %d in %.2fs", endpoint, e, attempt + 1, delay)
+        else:
+            status = response.status
+            _record(endpoint, started, failed=status >= 500)
+            if status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            retryable = status in retry_policy.retry_statuses and (
+                method in IDEMPOTENT_METHODS or status in retry_policy.unsent_statuses
+            )
+            retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+            too_long = retry_after is not None and retry_after > retry_policy.max_retry_after
+            if last_attempt or not retryable or too_long:
+                try:
+                    yield response
+                finally:
+                    response.release()
+                return
+            response.release()
+            delay = retry_after if retry_after is not None else retry_policy.backoff(attempt)
+            logger.warning("%s returned %d; retry %d in %.2fs", endpoint, status, attempt + 1, delay)
+        _metrics[endpoint]["retries"] += 1
+        attempt += 1
+        await asyncio.sleep(delay)
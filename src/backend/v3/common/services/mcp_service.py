@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from common.config.app_config import config
 
@@ -35,3 +35,22 @@ class MCPService(BaseAPIService):
         self, tool_name: str, payload: Dict[str, Any]
     ) -> Dict[str, Any]:
         return await self.post_json(f"tools/{tool_name}", json=payload)
+
+    async def invoke_tools_batch(
+        self, calls: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Invoke independent tools in one round trip; the server runs them concurrently.
+
+        Returns one result per call, in order. A failed call comes back as
+        {"tool": name, "error": message} without failing the others.
+        """
+        if not calls:
+            return []
+        payload = {
+            "calls": [
+                {"tool": tool_name, "arguments": arguments or {}}
+                for tool_name, arguments in calls
+            ]
+        }
+        response = await self.post_json("tools/batch", json=payload)
+        return response["results"]
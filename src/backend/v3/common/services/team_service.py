@@ -1,7 +1,8 @@
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from azure.core.exceptions import (
     ClientAuthenticationError,
@@ -14,11 +15,29 @@ from common.database.database_base import DatabaseBase
 from common.models.messages_kernel import (
     StartingTask,
     TeamAgent,
+    TeamConfigImport,
     TeamConfiguration,
     UserCurrentTeam,
 )
+from v3.common.services.async_ttl_cache import AsyncTTLCache
 from v3.common.services.foundry_service import FoundryService
 
+# Shared by all TeamService instances, so uploads and the summary endpoints reuse
+# one deployment / index listing instead of calling the management and search
+# APIs each time. Entries refresh in the background for up to 10 minutes after
+# they expire; validations that find something missing re-check with a fresh list.
+_deployments_cache: AsyncTTLCache[List[Dict[str, Any]]] = AsyncTTLCache(
+    ttl=300, stale_ttl=600
+)
+_index_names_cache: AsyncTTLCache[List[str]] = AsyncTTLCache(ttl=300, stale_ttl=600)
+
+
+class _EmptyDeploymentListing(Exception):
+    """Raised by the deployments loader so that an empty (or failed) listing is not cached."""
+
+    def __str__(self) -> str:
+        return "no model deployments listed"
+
 
 class TeamService:
     """Service for handling JSON team configuration operations."""
@@ -186,6 +205,121 @@ class TeamService:
             self.logger.error("Error saving team configuration: %s", str(e))
             raise ValueError(f"Failed to save team configuration: {str(e)}") from e
 
+    async def import_team_configurations(
+        self,
+        imports: List[TeamConfigImport],
+        user_id: str,
+        content_check: Callable[[Dict[str, Any]], Awaitable[Tuple[bool, str]]],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate and save several team configurations.
+
+        Teams are validated concurrently and share the cached deployment and
+        index listings; the valid ones are saved together with add_teams. Every
+        team goes through the content check, whether or not it carries a
+        team_id. Preset teams (with a team_id) that already exist or repeat are
+        skipped.
+
+        Args:
+            imports: Team configurations to import
+            user_id: User ID who uploaded the configurations
+            content_check: RAI check run on every team that is saved
+            max_concurrency: Teams validated at the same time
+
+        Returns:
+            One report per import, in request order, with its status: "created",
+            "exists", "duplicate", "invalid" or "failed"
+        """
+        reports: List[Dict[str, Any]] = [
+            {
+                "source": item.source,
+                "team_id": item.team_id,
+                "name": item.config.get("name", ""),
+                "status": "",
+                "errors": [],
+            }
+            for item in imports
+        ]
+
+        preset_ids = {item.team_id for item in imports if item.team_id}
+        found = await asyncio.gather(
+            *(self.memory_context.get_team(team_id) for team_id in preset_ids)
+        )
+        existing_ids = {team.team_id for team in found if team}
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def validate(item: TeamConfigImport) -> Tuple[Optional[TeamConfiguration], List[str]]:
+            async with semaphore:
+                # team_id comes from the request body, so it does not exempt a team from the check
+                rai_valid, rai_error = await content_check(item.config)
+                if not rai_valid:
+                    return None, [rai_error]
+                (models_valid, missing_models), (search_valid, search_errors) = (
+                    await asyncio.gather(
+                        self.validate_team_models(item.config),
+                        self.validate_team_search_indexes(item.config),
+                    )
+                )
+                errors: List[str] = []
+                if not models_valid:
+                    errors.append(
+                        "The following required models are not deployed in your "
+                        f"Azure AI project: {', '.join(missing_models)}"
+                    )
+                if not search_valid:
+                    errors.extend(search_errors)
+                if errors:
+                    return None, errors
+                try:
+                    team = await self.validate_and_parse_team_config(item.config, user_id)
+                except ValueError as e:
+                    return None, [str(e)]
+                if item.team_id:
+                    team.team_id = item.team_id
+                    team.id = item.team_id
+                return team, []
+
+        pending: Dict[int, TeamConfigImport] = {}
+        seen_ids = set()
+        for i, item in enumerate(imports):
+            if item.team_id in existing_ids:
+                reports[i]["status"] = "exists"
+            elif item.team_id and item.team_id in seen_ids:
+                reports[i]["status"] = "duplicate"
+            else:
+                seen_ids.add(item.team_id)
+                pending[i] = item
+
+        results = await asyncio.gather(*(validate(item) for item in pending.values()))
+        teams: Dict[int, TeamConfiguration] = {}
+        for i, (team, errors) in zip(pending, results):
+            if team is None:
+                reports[i].update(status="invalid", errors=errors)
+            else:
+                teams[i] = team
+
+        failed: Dict[str, str] = {}
+        if teams:
+            failed = await self.memory_context.add_teams(list(teams.values()))
+        for i, team in teams.items():
+            reports[i]["team_id"] = team.team_id
+            if team.id in failed:
+                reports[i].update(
+                    status="failed",
+                    errors=[f"Failed to save configuration: {failed[team.id]}"],
+                )
+            else:
+                reports[i]["status"] = "created"
+
+        self.logger.info(
+            "Imported %d of %d team configurations",
+            len(teams) - len(failed),
+            len(imports),
+        )
+        return reports
+
     async def get_team_configuration(
         self, team_id: str, user_id: str
     ) -> Optional[TeamConfiguration]:
@@ -373,13 +507,8 @@ class TeamService:
     ) -> Tuple[bool, List[str]]:
         """Validate that all models required by agents in the team config are deployed."""
         try:
-            foundry_service = FoundryService()
-            deployments = await foundry_service.list_model_deployments()
-            available_models = [
-                d.get("name", "").lower()
-                for d in deployments
-                if d.get("status") == "Succeeded"
-            ]
+            deployments = await self.get_model_deployments()
+            available_models = self._available_models(deployments)
 
             required_models: set = set()
             agents = team_config.get("agents", [])
@@ -394,13 +523,12 @@ class TeamService:
                 default_model = config.AZURE_OPENAI_DEPLOYMENT_NAME
                 required_models.add(default_model.lower())
 
-            missing_models: List[str] = []
-            for model in required_models:
-                # Temporary bypass for known deployed models
-                if model.lower() in ["gpt-4o", "o3", "gpt-4", "gpt-35-turbo"]:
-                    continue
-                if model not in available_models:
-                    missing_models.append(model)
+            missing_models = self._missing_models(required_models, available_models)
+            if missing_models:
+                # The cached list may predate a new deployment: re-check a fresh one
+                deployments = await self.get_model_deployments(force_refresh=True)
+                available_models = self._available_models(deployments)
+                missing_models = self._missing_models(required_models, available_models)
 
             is_valid = len(missing_models) == 0
             if not is_valid:
@@ -411,11 +539,53 @@ class TeamService:
             self.logger.error(f"Error validating team models: {e}")
             return True, []
 
+    async def get_model_deployments(
+        self, force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Model deployments of the configured project, from the shared TTL cache."""
+        key = (
+            config.AZURE_AI_SUBSCRIPTION_ID,
+            config.AZURE_AI_RESOURCE_GROUP,
+            config.AZURE_AI_PROJECT_NAME,
+        )
+
+        async def load() -> List[Dict[str, Any]]:
+            deployments = await FoundryService().list_model_deployments()
+            if not deployments:
+                # list_model_deployments also returns [] when the call failed
+                raise _EmptyDeploymentListing()
+            return deployments
+
+        try:
+            return await _deployments_cache.get(key, load, force_refresh=force_refresh)
+        except _EmptyDeploymentListing:
+            return []
+
+    @staticmethod
+    def _available_models(deployments: List[Dict[str, Any]]) -> List[str]:
+        return [
+            d.get("name", "").lower()
+            for d in deployments
+            if d.get("status") == "Succeeded"
+        ]
+
+    @staticmethod
+    def _missing_models(
+        required_models: set, available_models: List[str]
+    ) -> List[str]:
+        missing_models: List[str] = []
+        for model in required_models:
+            # Temporary bypass for known deployed models
+            if model.lower() in ["gpt-4o", "o3", "gpt-4", "gpt-35-turbo"]:
+                continue
+            if model not in available_models:
+                missing_models.append(model)
+        return missing_models
+
     async def get_deployment_status_summary(self) -> Dict[str, Any]:
         """Get a summary of deployment status for debugging/monitoring."""
         try:
-            foundry_service = FoundryService()
-            deployments = await foundry_service.list_model_deployments()
+            deployments = await self.get_model_deployments()
             summary: Dict[str, Any] = {
                 "total_deployments": len(deployments),
                 "successful_deployments": [],
@@ -475,6 +645,12 @@ class TeamService:
                 )
                 return True, []
 
+            if config.SEARCH_BACKEND == "local":
+                self.logger.info(
+                    "RAG agents use the local search index - skipping search validation"
+                )
+                return True, []
+
             if not self.search_endpoint:
                 if index_names or has_rag_agents:
                     error_msg = "Team configuration references search indexes but no Azure Search endpoint is configured"
@@ -490,19 +666,53 @@ class TeamService:
                 return True, []
 
             validation_errors: List[str] = []
-            unique_indexes = set(index_names)
+            unique_indexes = sorted(set(index_names))
             self.logger.info(
-                f"Validating {len(unique_indexes)} search indexes: {list(unique_indexes)}"
+                f"Validating {len(unique_indexes)} search indexes: {unique_indexes}"
             )
+            try:
+                available = set(await self.get_search_index_names())
+                if not available.issuperset(unique_indexes):
+                    # The cached list may predate a new index: re-check a fresh one
+                    available = set(
+                        await self.get_search_index_names(force_refresh=True)
+                    )
+            except Exception as e:
+                # Listing is not permitted or failed: look each index up instead
+                self.logger.warning(f"Could not list search indexes: {e}")
+                results = await asyncio.gather(
+                    *(self.validate_single_index(name) for name in unique_indexes)
+                )
+                validation_errors = [
+                    message for is_valid, message in results if not is_valid
+                ]
+                return len(validation_errors) == 0, validation_errors
+
             for index_name in unique_indexes:
-                is_valid, error_message = await self.validate_single_index(index_name)
-                if not is_valid:
-                    validation_errors.append(error_message)
+                if index_name not in available:
+                    error_msg = f"Search index '{index_name}' does not exist"
+                    self.logger.error(error_msg)
+                    validation_errors.append(error_msg)
             return len(validation_errors) == 0, validation_errors
         except Exception as e:
             self.logger.error(f"Error validating search indexes: {str(e)}")
             return False, [f"Search index validation error: {str(e)}"]
 
+    async def get_search_index_names(self, force_refresh: bool = False) -> List[str]:
+        """Index names on the configured search service, from the shared TTL cache."""
+
+        def list_index_names() -> List[str]:
+            index_client = SearchIndexClient(
+                endpoint=self.search_endpoint, credential=self.search_credential
+            )
+            return list(index_client.list_index_names())
+
+        return await _index_names_cache.get(
+            self.search_endpoint,
+            lambda: asyncio.to_thread(list_index_names),
+            force_refresh=force_refresh,
+        )
+
     def extract_index_names(self, team_config: Dict[str, Any]) -> List[str]:
         """Extract all index names from RAG agents in the team configuration."""
         index_names: List[str] = []
@@ -532,7 +742,7 @@ class TeamService:
             index_client = SearchIndexClient(
                 endpoint=self.search_endpoint, credential=self.search_credential
             )
-            index = index_client.get_index(index_name)
+            index = await asyncio.to_thread(index_client.get_index, index_name)
             if index:
                 self.logger.info(f"Search index '{index_name}' found and accessible")
                 return True, ""
@@ -566,14 +776,11 @@ class TeamService:
         try:
             if not self.search_endpoint:
                 return {"error": "No Azure Search endpoint configured"}
-            index_client = SearchIndexClient(
-                endpoint=self.search_endpoint, credential=self.search_credential
-            )
-            indexes = list(index_client.list_indexes())
+            index_names = await self.get_search_index_names()
             summary = {
                 "search_endpoint": self.search_endpoint,
-                "total_indexes": len(indexes),
-                "available_indexes": [index.name for index in indexes],
+                "total_indexes": len(index_names),
+                "available_indexes": list(index_names),
             }
             return summary
         except Exception as e:
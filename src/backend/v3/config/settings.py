@@ -4,9 +4,12 @@ Handles Azure OpenAI, MCP, and environment setup.
 """
 
 import asyncio
+import itertools
 import json
 import logging
-from typing import Dict, Optional
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
 from common.config.app_config import config
 from common.models.messages_kernel import TeamConfiguration
@@ -248,6 +251,21 @@ class ConnectionConfig:
         # Map user_id to process_id for context-based messaging
         self.user_to_process: Dict[str, str] = {}
 
+        # Outbound event fan-out shared by the WebSocket and SSE transports.
+        # Every message gets a monotonically increasing event id and is kept in a
+        # short per-user history so SSE clients can resume with Last-Event-ID.
+        # Histories of users without a subscriber are dropped after
+        # event_history_ttl seconds, and right away when their WebSocket closes.
+        self.event_history_size: int = 200
+        self.event_history_ttl: float = 300.0
+        self.subscriber_queue_size: int = 500
+        self._event_ids = itertools.count(1)
+        self._event_history: Dict[str, Deque[Tuple[int, str, str]]] = {}
+        self._event_history_used: Dict[str, float] = {}
+        self._last_history_prune: float = 0.0
+        self._event_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.metrics: Dict[str, int] = defaultdict(int)
+
     def add_connection(
         self, process_id: str, connection: WebSocket, user_id: str = None
     ):
@@ -307,6 +325,13 @@ class ConnectionConfig:
 
     async def close_connection(self, process_id):
         """Remove a connection."""
+        for user_id, mapped_process_id in list(self.user_to_process.items()):
+            if mapped_process_id == str(process_id):
+                # WebSocket clients do not resume, so only SSE subscribers need the history
+                if not self.has_event_subscribers(user_id):
+                    self.clear_event_history(user_id)
+                break
+
         connection = self.get_connection(process_id)
         if connection:
             try:
@@ -321,26 +346,12 @@ class ConnectionConfig:
         self.remove_connection(process_id)
         logger.info("Connection removed for batch ID: %s", process_id)
 
-    async def send_status_update_async(
+    def serialize_message(
         self,
         message: any,
-        user_id: str,
         message_type: WebsocketMessageType = WebsocketMessageType.SYSTEM_MESSAGE,
-    ):
-        """Send a status update to a specific client."""
-
-        if not user_id:
-            logger.warning("No user_id available for WebSocket message")
-            return
-
-        process_id = self.user_to_process.get(user_id)
-        if not process_id:
-            logger.warning("No active WebSocket process found for user ID: %s", user_id)
-            logger.debug(
-                f"Available user mappings: {list(self.user_to_process.keys())}"
-            )
-            return
-
+    ) -> str:
+        """Serialize a message into the JSON envelope sent to the frontend."""
         # Convert message to proper format for frontend
         try:
             if hasattr(message, "to_dict"):
@@ -360,13 +371,137 @@ class ConnectionConfig:
             message_data = str(message)
 
         standard_message = {"type": message_type, "data": message_data}
+        return json.dumps(standard_message, default=str)
+
+    def subscribe_events(
+        self, user_id: str, last_event_id: Optional[int] = None
+    ) -> asyncio.Queue:
+        """
+        Register an event stream subscriber (e.g. an SSE client) for a user.
+
+        Args:
+            user_id: The user whose events should be delivered
+            last_event_id: Replay buffered events newer than this id (resume)
+
+        Returns:
+            A queue receiving (event_id, event_type, payload) tuples
+        """
+        user_id = str(user_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        if last_event_id is not None:
+            for event in self._event_history.get(user_id, ()):
+                if event[0] > last_event_id:
+                    self._offer_event(queue, event)
+        self._event_subscribers.setdefault(user_id, set()).add(queue)
+        self.metrics["subscribers_opened"] += 1
+        logger.info(f"Event stream subscribed for user: {user_id}")
+        return queue
+
+    def unsubscribe_events(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Remove an event stream subscriber."""
+        user_id = str(user_id)
+        subscribers = self._event_subscribers.get(user_id)
+        if subscribers:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._event_subscribers[user_id]
+                # Keep the history for event_history_ttl so the client can resume
+                self._event_history_used[user_id] = time.monotonic()
+        self.metrics["subscribers_closed"] += 1
+
+    def has_event_subscribers(self, user_id: str) -> bool:
+        """Check whether a user has any active event stream subscribers."""
+        return bool(self._event_subscribers.get(str(user_id)))
+
+    def get_event_history(self, user_id: str) -> List[Tuple[int, str, str]]:
+        """Return the buffered (event_id, event_type, payload) tuples for a user."""
+        return list(self._event_history.get(str(user_id), ()))
+
+    def clear_event_history(self, user_id: str) -> None:
+        """Drop the buffered events of a user."""
+        user_id = str(user_id)
+        self._event_history.pop(user_id, None)
+        self._event_history_used.pop(user_id, None)
+
+    def _prune_event_history(self, now: float) -> None:
+        """Drop histories unused for event_history_ttl by users without subscribers."""
+        if now - self._last_history_prune < self.event_history_ttl / 10:
+            return
+        self._last_history_prune = now
+        for user_id, used in list(self._event_history_used.items()):
+            if (
+                now - used > self.event_history_ttl
+                and user_id not in self._event_subscribers
+            ):
+                self.clear_event_history(user_id)
+                self.metrics["event_histories_expired"] += 1
+
+    def _offer_event(self, queue: asyncio.Queue, event: Tuple[int, str, str]) -> None:
+        """Put an event on a subscriber queue, dropping the oldest one if it is full."""
+        if queue.full():
+            try:
+                queue.get_nowait()
+                self.metrics["events_dropped"] += 1
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(event)
+
+    def _publish_event(
+        self, user_id: str, message_type: WebsocketMessageType, payload: str
+    ) -> int:
+        """Record an outbound event and fan it out to the event stream subscribers."""
+        event_type = getattr(message_type, "value", str(message_type))
+        event = (next(self._event_ids), event_type, payload)
+        history = self._event_history.get(user_id)
+        if history is None:
+            history = deque(maxlen=self.event_history_size)
+            self._event_history[user_id] = history
+        history.append(event)
+        now = time.monotonic()
+        self._event_history_used[user_id] = now
+        self._prune_event_history(now)
+        self.metrics["events_published"] += 1
+
+        for queue in list(self._event_subscribers.get(user_id, ())):
+            self._offer_event(queue, event)
+            self.metrics["sse_events_queued"] += 1
+        return event[0]
+
+    async def send_status_update_async(
+        self,
+        message: any,
+        user_id: str,
+        message_type: WebsocketMessageType = WebsocketMessageType.SYSTEM_MESSAGE,
+    ):
+        """Send a status update to a specific client over every active transport."""
+
+        if not user_id:
+            logger.warning("No user_id available for WebSocket message")
+            return
+
+        user_id = str(user_id)
+        str_message = self.serialize_message(message, message_type)
+        self._publish_event(user_id, message_type, str_message)
+
+        process_id = self.user_to_process.get(user_id)
+        if not process_id:
+            if not self.has_event_subscribers(user_id):
+                logger.warning(
+                    "No active WebSocket process found for user ID: %s", user_id
+                )
+                logger.debug(
+                    f"Available user mappings: {list(self.user_to_process.keys())}"
+                )
+            return
+
         connection = self.get_connection(process_id)
         if connection:
             try:
-                str_message = json.dumps(standard_message, default=str)
                 await connection.send_text(str_message)
+                self.metrics["websocket_messages_sent"] += 1
                 logger.debug(f"Message sent to user {user_id} via process {process_id}")
             except Exception as e:
+                self.metrics["websocket_send_failures"] += 1
                 logger.error(f"Failed to send message to user {user_id}: {e}")
                 # Clean up stale connection
                 self.remove_connection(process_id)
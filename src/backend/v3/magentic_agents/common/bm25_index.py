@@ -0,0 +1,212 @@
+"""In-process full-text index with BM25 ranking, the local stand-in for Azure AI Search.
+
+Documents come from the dataset files of a directory (data/datasets); large
+files are split into chunks at line boundaries, and CSV chunks repeat the
+header row. sync_directory() re-indexes only files that changed since the
+last sync. The index persists as gzip-compressed JSON holding the postings,
+so loading it does not re-tokenize the corpus.
+"""
+
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+FORMAT_VERSION = 1
+INDEXED_EXTENSIONS = (".csv", ".json", ".txt", ".md")
+
+# Words and numbers; underscores split, so file names yield their words
+_TOKEN = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def document_terms(content: str, source: str = "") -> List[str]:
+    """Terms of a document: its source file name (the title) and its content."""
+    return tokenize(os.path.splitext(source)[0]) + tokenize(content)
+
+
+def chunk_lines(text: str, max_chars: int, header: str = "") -> List[str]:
+    """Split text at line boundaries into chunks of about max_chars, each starting with header."""
+    budget = max(1, max_chars - len(header))
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in text.splitlines(keepends=True):
+        if current and size + len(line) > budget:
+            chunks.append(header + "".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current or not chunks:
+        chunks.append(header + "".join(current))
+    return chunks
+
+
+def file_chunks(name: str, text: str, max_chars: int) -> List[str]:
+    header = ""
+    if name.endswith(".csv"):
+        first_line, newline, rest = text.partition("\n")
+        if rest:
+            header, text = first_line + newline, rest
+    return chunk_lines(text, max_chars, header)
+
+
+class BM25Index:
+    """Inverted index over text documents, ranked with Okapi BM25."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, chunk_chars: int = 4000) -> None:
+        self.k1 = k1
+        self.b = b
+        self.chunk_chars = chunk_chars
+        # doc id -> (content, source file, token count)
+        self._documents: Dict[str, Tuple[str, str, int]] = {}
+        # term -> {doc id: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        # source file -> fingerprint and doc ids, for incremental syncs
+        self._sources: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def upsert(self, doc_id: str, content: str, source: str = "") -> None:
+        with self._lock:
+            self.remove(doc_id)
+            counts = Counter(document_terms(content, source))
+            length = sum(counts.values())
+            self._documents[doc_id] = (content, source, length)
+            self._total_length += length
+            for term, frequency in counts.items():
+                self._postings.setdefault(term, {})[doc_id] = frequency
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            document = self._documents.pop(doc_id, None)
+            if document is None:
+                return
+            content, source, length = document
+            self._total_length -= length
+            for term in set(document_terms(content, source)):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[term]
+
+    def search(self, query: str, top: int = 3) -> List[Tuple[str, float, str]]:
+        """The top documents for query as (doc id, score, content), best first."""
+        with self._lock:
+            count = len(self._documents)
+            if not count:
+                return []
+            average_length = self._total_length / count
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    length = self._documents[doc_id][2]
+                    norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+            best = heapq.nlargest(top, scores.items(), key=lambda item: (item[1], item[0]))
+            return [(doc_id, score, self._documents[doc_id][0]) for doc_id, score in best]
+
+    def sync_directory(self, directory: str) -> Dict[str, int]:
+        """Bring the index in line with the dataset files of directory.
+
+        Files are re-read only when their size or modification time changed,
+        and re-indexed only when their content hash did.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._lock:
+            seen = set()
+            for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+                if not entry.is_file() or not entry.name.endswith(INDEXED_EXTENSIONS):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                known = self._sources.get(entry.name)
+                if known and (known["size"], known["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                    stats["unchanged"] += 1
+                    continue
+                with open(entry.path, "rb") as f:
+                    data = f.read()
+                sha256 = hashlib.sha256(data).hexdigest()
+                fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+                if known and known["sha256"] == sha256:
+                    known.update(fingerprint)
+                    stats["unchanged"] += 1
+                    continue
+                self._index_file(entry.name, data.decode("utf-8", errors="replace"), fingerprint)
+                stats["updated" if known else "added"] += 1
+            for name in set(self._sources) - seen:
+                for doc_id in self._sources.pop(name)["ids"]:
+                    self.remove(doc_id)
+                stats["removed"] += 1
+        return stats
+
+    def _index_file(self, name: str, text: str, fingerprint: Dict) -> None:
+        for doc_id in self._sources.get(name, {}).get("ids", []):
+            self.remove(doc_id)
+        ids = []
+        for n, chunk in enumerate(file_chunks(name, text, self.chunk_chars)):
+            doc_id = f"{name}#{n}"
+            self.upsert(doc_id, chunk, source=name)
+            ids.append(doc_id)
+        self._sources[name] = {**fingerprint, "ids": ids}
+
+    def save(self, path: str) -> None:
+        """Write the index atomically as gzip-compressed JSON."""
+        with self._lock:
+            doc_ids = list(self._documents)
+            positions = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+            payload = {
+                "version": FORMAT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "chunk_chars": self.chunk_chars,
+                "documents": [[doc_id, *self._documents[doc_id]] for doc_id in doc_ids],
+                # Postings as flat [position, frequency, ...] lists
+                "postings": {
+                    term: [value for doc_id, frequency in postings.items() for value in (positions[doc_id], frequency)]
+                    for term, postings in self._postings.items()
+                },
+                "sources": self._sources,
+            }
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, "wt", compresslevel=6, encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BM25Index"]:
+        """Read an index written by save(); None if missing, unreadable or of another format."""
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != FORMAT_VERSION:
+            return None
+        index = cls(k1=payload["k1"], b=payload["b"], chunk_chars=payload["chunk_chars"])
+        doc_ids = []
+        for doc_id, content, source, length in payload["documents"]:
+            index._documents[doc_id] = (content, source, length)
+            index._total_length += length
+            doc_ids.append(doc_id)
+        for term, flat in payload["postings"].items():
+            index._postings[term] = {doc_ids[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)}
+        index._sources = payload["sources"]
+        return index
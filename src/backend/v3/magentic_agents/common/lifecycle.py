@@ -5,14 +5,16 @@ from azure.ai.projects.aio import AIProjectClient
 from azure.identity.aio import DefaultAzureCredential
 from semantic_kernel.agents.azure_ai.azure_ai_agent import AzureAIAgent
 from semantic_kernel.connectors.mcp import MCPStreamableHttpPlugin
+from v3.magentic_agents.common.mcp_session_pool import get_mcp_session_pool
 from v3.magentic_agents.models.agent_models import MCPConfig
 from v3.config.agent_registry import agent_registry
 
 
 class MCPEnabledBase:
     """
-    Base that owns an AsyncExitStack and, if configured, enters the MCP plugin
-    as an async context. Subclasses build the actual agent in _after_open().
+    Base that owns an AsyncExitStack and, if configured, leases a shared MCP
+    plugin from the process-wide session pool. Subclasses build the actual
+    agent in _after_open().
     """
 
     def __init__(self, mcp: MCPConfig | None = None) -> None:
@@ -76,16 +78,17 @@ class MCPEnabledBase:
         if not self.mcp_cfg:
             return
         # headers = self._build_mcp_headers()
-        plugin = MCPStreamableHttpPlugin(
+        lease = get_mcp_session_pool().lease(
+            url=self.mcp_cfg.url,
             name=self.mcp_cfg.name,
             description=self.mcp_cfg.description,
-            url=self.mcp_cfg.url,
             # headers=headers,
         )
-        # Enter MCP async context via the stack to ensure correct LIFO cleanup
+        # Hold the lease via the stack to ensure correct LIFO cleanup; the
+        # session itself stays open in the pool for the next agent
         if self._stack is None:
             self._stack = AsyncExitStack()
-        self.mcp_plugin = await self._stack.enter_async_context(plugin)
+        self.mcp_plugin = await self._stack.enter_async_context(lease)
 
 
 class AzureAgentBase(MCPEnabledBase):
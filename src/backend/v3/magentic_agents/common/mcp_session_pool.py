@@ -0,0 +1,214 @@
+"""
+Process-wide pool of MCP client sessions shared by all agents.
+
+Without the pool every agent opening with an MCPConfig did its own session
+handshake and tool listing and held its own HTTP connection, so a team of
+five agents per user meant five sessions per user. Agents now lease a
+connected plugin keyed by server URL and headers. The MCP ClientSession
+matches responses to request ids, so concurrent tool calls from many agents
+multiplex over the one session, and the tool catalog is listed once per
+session instead of once per agent.
+
+Sessions stay open while leased and for `idle_seconds` after the last lease
+ends. A session that has been quiet for `health_check_seconds` is pinged
+before it is handed out again, and a session whose ping or tool call failed
+at the transport level is reconnected in place, so plugins already bound to
+agent kernels keep working.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from mcp.shared.exceptions import McpError
+from semantic_kernel.connectors.mcp import MCPStreamableHttpPlugin
+from v3.magentic_agents.common.mcp_tool_catalog import fetch_catalog_version, tool_catalog_cache
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class PooledMCPPlugin(MCPStreamableHttpPlugin):
+    """Streamable HTTP plugin that counts its tool calls and notices dead transports."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self.errors = 0
+        self.healthy = False
+        self.tool_names: list[str] = []
+        self.catalog_version: Optional[str] = None
+
+    async def load_tools(self) -> None:
+        # Rebuild the tool functions from metadata cached for this catalog
+        # version when possible instead of listing and parsing the tools again
+        self.catalog_version = await fetch_catalog_version(self.url, self.headers)
+        if not (self.catalog_version and tool_catalog_cache.install(self.catalog_version, self)):
+            await super().load_tools()
+            if self.catalog_version:
+                tool_catalog_cache.store(self.catalog_version, self)
+        self.tool_names = sorted(
+            name for name, value in vars(self).items() if hasattr(value, "__kernel_function__")
+        )
+
+    async def call_tool(self, tool_name: str, **kwargs: Any):
+        self.calls += 1
+        try:
+            return await super().call_tool(tool_name, **kwargs)
+        except McpError:
+            # The server answered with a tool error; the session itself is fine
+            self.errors += 1
+            raise
+        except Exception:
+            self.errors += 1
+            self.healthy = False
+            raise
+
+
+class _Entry:
+    def __init__(self, plugin: PooledMCPPlugin) -> None:
+        self.plugin = plugin
+        self.leases = 0
+        self.opened_at = time.time()
+        self.last_used = time.monotonic()
+        self.reconnects = 0
+        self.lock = asyncio.Lock()
+
+
+class MCPSessionPool:
+    """Shared, lazily connected MCP sessions keyed by (url, headers)."""
+
+    def __init__(self, idle_seconds: float = 300.0, health_check_seconds: float = 30.0, ping_timeout: float = 5.0):
+        self.idle_seconds = idle_seconds
+        self.health_check_seconds = health_check_seconds
+        self.ping_timeout = ping_timeout
+        self._entries: Dict[PoolKey, _Entry] = {}
+        self._lock = asyncio.Lock()
+        self.metrics: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def key(url: str, headers: Optional[Dict[str, Any]] = None) -> PoolKey:
+        return url, tuple(sorted((str(k), str(v)) for k, v in (headers or {}).items()))
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        url: str,
+        name: str,
+        description: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[PooledMCPPlugin]:
+        """Yield a connected plugin for `url`; the session outlives the lease.
+
+        The plugin name and description come from the first lease of a
+        session, since all leases of it share one plugin object.
+        """
+        entry = await self._acquire(self.key(url, headers), url, name, description, headers)
+        try:
+            yield entry.plugin
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+
+    async def _acquire(self, key: PoolKey, url: str, name: str, description: Optional[str], headers) -> _Entry:
+        async with self._lock:
+            await self._close_idle(keep=key)
+            entry = self._entries.get(key)
+            if entry is None:
+                plugin = PooledMCPPlugin(name=name, description=description, url=url, headers=headers)
+                entry = self._entries[key] = _Entry(plugin)
+            entry.leases += 1
+        try:
+            async with entry.lock:
+                await self._ensure_connected(entry)
+        except BaseException:
+            entry.leases -= 1
+            raise
+        entry.last_used = time.monotonic()
+        self.metrics["leases"] += 1
+        return entry
+
+    async def _ensure_connected(self, entry: _Entry) -> None:
+        plugin = entry.plugin
+        if plugin.healthy and plugin.session is not None:
+            if time.monotonic() - entry.last_used < self.health_check_seconds:
+                return
+            try:
+                await asyncio.wait_for(plugin.session.send_ping(), self.ping_timeout)
+                return
+            except Exception as e:
+                self.metrics["health_check_failures"] += 1
+                logger.warning("MCP session to %s failed its health check: %s", plugin.url, e)
+        if plugin.session is not None or plugin.healthy:
+            await self._disconnect(plugin)
+            entry.reconnects += 1
+            self.metrics["reconnects"] += 1
+        await plugin.connect()
+        plugin.healthy = True
+        entry.opened_at = time.time()
+        self.metrics["sessions_opened"] += 1
+        logger.info("Opened MCP session to %s with %d tools", plugin.url, len(plugin.tool_names))
+
+    @staticmethod
+    async def _disconnect(plugin: PooledMCPPlugin) -> None:
+        plugin.healthy = False
+        try:
+            await plugin.close()
+        except Exception as e:  # the transport is already gone; nothing left to release
+            logger.debug("Ignoring error while closing MCP session to %s: %s", plugin.url, e)
+        plugin.session = None
+
+    async def _close_idle(self, keep: Optional[PoolKey] = None) -> None:
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if key == keep or entry.leases or now - entry.last_used < self.idle_seconds:
+                continue
+            del self._entries[key]
+            await self._disconnect(entry.plugin)
+            self.metrics["sessions_closed"] += 1
+
+    async def aclose(self) -> None:
+        """Close every session, leased or not (application shutdown)."""
+        async with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+            for entry in entries:
+                await self._disconnect(entry.plugin)
+                self.metrics["sessions_closed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            "catalog_cache": dict(tool_catalog_cache.metrics),
+            "sessions": [
+                {
+                    "url": entry.plugin.url,
+                    "healthy": entry.plugin.healthy,
+                    "leases": entry.leases,
+                    "calls": entry.plugin.calls,
+                    "errors": entry.plugin.errors,
+                    "reconnects": entry.reconnects,
+                    "tools": len(entry.plugin.tool_names),
+                    "catalog_version": entry.plugin.catalog_version,
+                    "opened_at": entry.opened_at,
+                }
+                for entry in self._entries.values()
+            ],
+        }
+
+
+# asyncio primitives and MCP sessions belong to one event loop
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MCPSessionPool]" = weakref.WeakKeyDictionary()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """The session pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = MCPSessionPool()
+    return pool
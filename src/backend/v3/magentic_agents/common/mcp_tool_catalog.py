@@ -0,0 +1,99 @@
+"""
+Kernel function metadata of MCP tools, cached by the server's catalog version.
+
+Loading tools into an MCP plugin means a list_tools round trip plus building
+a kernel function (signature parsing, JSON schema to parameter metadata) per
+tool. The MCP server publishes a hash of its tool schemas at GET /catalog,
+which only changes on redeploy. Plugins that connect to a server whose hash
+was seen before rebuild their kernel functions from the cached metadata and
+skip both steps. Servers without the endpoint are listed as before.
+"""
+
+import logging
+from collections import OrderedDict, defaultdict
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from v3.common.services.http_client import RetryPolicy, send
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = "/catalog"
+CATALOG_RETRY_POLICY = RetryPolicy(max_attempts=1)
+
+# (tool name, plugin attribute, __kernel_function_*__ attributes)
+CachedTool = Tuple[str, str, Dict[str, Any]]
+
+
+def catalog_url(mcp_url: str) -> str:
+    """GET /catalog lives at the root of the server that serves the MCP endpoint."""
+    parts = urlsplit(mcp_url)
+    return urlunsplit((parts.scheme, parts.netloc, CATALOG_PATH, "", ""))
+
+
+async def fetch_catalog_version(
+    mcp_url: str, headers: Optional[Dict[str, Any]] = None, timeout_seconds: float = 5.0
+) -> Optional[str]:
+    """The server's catalog hash, or None if it does not publish one."""
+    try:
+        # Sent over the pooled session; the hash is only a shortcut, so a failure is not retried
+        async with send(
+            "GET",
+            catalog_url(mcp_url),
+            headers=headers or None,
+            timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+            retry_policy=CATALOG_RETRY_POLICY,
+        ) as resp:
+            resp.raise_for_status()
+            return (await resp.json()).get("version") or None
+    except Exception as e:
+        logger.debug("No MCP catalog version from %s: %s", mcp_url, e)
+        return None
+
+
+class ToolCatalogCache:
+    """Kernel function metadata per catalog version (a few recent versions are kept)."""
+
+    def __init__(self, max_versions: int = 8) -> None:
+        self.max_versions = max_versions
+        self._catalogs: "OrderedDict[str, List[CachedTool]]" = OrderedDict()
+        self.metrics: Dict[str, int] = defaultdict(int)
+
+    def store(self, version: str, plugin: Any) -> None:
+        """Remember the tool functions load_tools() put on the plugin."""
+        tools = []
+        for attribute, value in vars(plugin).items():
+            is_tool = isinstance(value, partial) and value.func == plugin.call_tool
+            if is_tool and getattr(value, "__kernel_function__", False):
+                kernel_attributes = {
+                    key: item for key, item in vars(value).items() if key.startswith("__kernel_function")
+                }
+                tools.append((value.args[0], attribute, kernel_attributes))
+        self._catalogs[version] = tools
+        self._catalogs.move_to_end(version)
+        while len(self._catalogs) > self.max_versions:
+            self._catalogs.popitem(last=False)
+
+    def install(self, version: str, plugin: Any) -> bool:
+        """Put the cached tool functions of `version` on the plugin; False if unknown."""
+        tools = self._catalogs.get(version)
+        if tools is None:
+            self.metrics["misses"] += 1
+            return False
+        self._catalogs.move_to_end(version)
+        for tool_name, attribute, kernel_attributes in tools:
+            func = partial(plugin.call_tool, tool_name)
+            for key, item in kernel_attributes.items():
+                setattr(func, key, item)
+            setattr(plugin, attribute, func)
+        self.metrics["hits"] += 1
+        return True
+
+    def clear(self) -> None:
+        self._catalogs.clear()
+
+
+tool_catalog_cache = ToolCatalogCache()
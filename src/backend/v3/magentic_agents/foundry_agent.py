@@ -7,6 +7,7 @@ from azure.ai.agents.models import AzureAISearchTool, CodeInterpreterToolDefinit
 from semantic_kernel.agents import Agent, AzureAIAgent  # pylint: disable=E0611
 from v3.magentic_agents.common.lifecycle import AzureAgentBase
 from v3.magentic_agents.models.agent_models import MCPConfig, SearchConfig
+from v3.magentic_agents.reasoning_search import ReasoningSearch
 
 from v3.config.agent_registry import agent_registry
 
@@ -172,6 +173,12 @@ class FoundryAgentTemplate(AzureAgentBase):
         # Add MCP plugins if available
         plugins = [self.mcp_plugin] if self.mcp_plugin else []
 
+        # The local search index is not reachable from Foundry, so it is offered as a plugin
+        if self.search and self.search.backend == "local":
+            local_search = ReasoningSearch(self.search)
+            if await local_search.connect():
+                plugins.append(local_search)
+
         try:
             self._agent = AzureAIAgent(
                 client=self.client,
@@ -56,15 +56,26 @@ class MCPConfig:
 
 @dataclass(slots=True)
 class SearchConfig:
-    """Configuration for connecting to Azure AI Search."""
+    """Configuration for connecting to Azure AI Search, or for the local search index."""
 
     connection_name: str | None = None
     endpoint: str | None = None
     index_name: str | None = None
     api_key: str | None = None  # API key for Azure AI Search
+    backend: str = "azure"  # "azure", or "local" for the in-process BM25 index
+    data_dir: str = ""  # local: directory of the dataset files to index
+    index_path: str = ""  # local: file the index is kept in ("" keeps it in memory)
 
     @classmethod
     def from_env(cls) -> "SearchConfig":
+        if config.SEARCH_BACKEND == "local":
+            return cls(
+                index_name=config.AZURE_AI_SEARCH_INDEX_NAME or "local",
+                backend="local",
+                data_dir=config.LOCAL_SEARCH_DATA_DIR,
+                index_path=config.LOCAL_SEARCH_INDEX_PATH,
+            )
+
         connection_name = config.AZURE_AI_SEARCH_CONNECTION_NAME
         index_name = config.AZURE_AI_SEARCH_INDEX_NAME
         endpoint = config.AZURE_AI_SEARCH_ENDPOINT
@@ -1,86 +1,252 @@
 """
-RAG search capabilities for ReasoningAgentTemplate using AzureAISearchCollection.
+RAG search capabilities for ReasoningAgentTemplate using Azure AI Search.
 Based on Semantic Kernel text search patterns.
+
+Searches go through the async SearchClient, shared per index within an event
+loop, so lookups never block other users' streams. Results are cached for a
+few minutes by a hash of the index and query.
+
+With SearchConfig.backend "local" the same plugin searches an in-process BM25
+index over the dataset files instead (see common/bm25_index.py).
 """
 
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Annotated, Dict, List, Tuple
+
 from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient
 from semantic_kernel import Kernel
 from semantic_kernel.functions import kernel_function
+from v3.common.services.async_ttl_cache import AsyncTTLCache
+from v3.magentic_agents.common.bm25_index import BM25Index
 from v3.magentic_agents.models.agent_models import SearchConfig
 
+logger = logging.getLogger(__name__)
+
+# Async clients are bound to the event loop they were created on
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, str], SearchClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Search results by query hash, shared by all agents searching the same index
+_results_cache: AsyncTTLCache[List[str]] = AsyncTTLCache(ttl=300, max_size=256)
+# Local indexes by (data directory, index file), shared by all agents
+_local_indexes: Dict[Tuple[str, str], BM25Index] = {}
+_local_indexes_lock = threading.Lock()
+
+
+def get_search_client(endpoint: str, index_name: str, api_key: str | None) -> SearchClient:
+    """The running loop's client for an index, created on first use."""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    key = (endpoint, index_name, api_key or "")
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = SearchClient(
+            endpoint=endpoint,
+            credential=AzureKeyCredential(api_key),
+            index_name=index_name,
+        )
+    return client
+
+
+async def close_search_clients() -> None:
+    """Close the running loop's search clients (application shutdown)."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def get_local_index(data_dir: str, index_path: str = "") -> BM25Index:
+    """The shared local index of data_dir, loaded from index_path and synced with the files.
+
+    Only files changed since the last sync are re-indexed; the index file is
+    rewritten when anything changed.
+    """
+    with _local_indexes_lock:
+        key = (os.path.abspath(data_dir), index_path)
+        index = _local_indexes.get(key)
+        if index is None and index_path:
+            index = BM25Index.load(index_path)
+        if index is None:
+            index = BM25Index()
+        stats = index.sync_directory(data_dir)
+        if index_path and (stats["added"] or stats["updated"] or stats["removed"]):
+            index.save(index_path)
+        logger.info("Local search index of %s: %d documents, %s", data_dir, len(index), stats)
+        _local_indexes[key] = index
+        return index
+
+
+class SearchBackend(ABC):
+    """Where ReasoningSearch sends its queries."""
+
+    @abstractmethod
+    async def search(self, query: str, limit: int) -> List[str]:
+        """Contents of the best matching documents, best first."""
+
+
+class AzureSearchBackend(SearchBackend):
+    """An Azure AI Search index, through the loop's shared async client."""
+
+    def __init__(self, search_config: SearchConfig):
+        self.client = get_search_client(
+            search_config.endpoint, search_config.index_name, search_config.api_key
+        )
+
+    async def search(self, query: str, limit: int) -> List[str]:
+        results = await self.client.search(
+            search_text=query,
+            query_type="simple",
+            select=["content"],
+            top=limit,
+        )
+        return [result["content"] async for result in results]
+
+
+class LocalSearchBackend(SearchBackend):
+    """The in-process BM25 index; scoring runs in a worker thread."""
+
+    def __init__(self, index: BM25Index):
+        self.index = index
+
+    async def search(self, query: str, limit: int) -> List[str]:
+        results = await asyncio.to_thread(self.index.search, query, limit)
+        return [content for _, _, content in results]
+
+
+async def create_search_backend(search_config: SearchConfig) -> SearchBackend:
+    if search_config.backend == "local":
+        index = await asyncio.to_thread(
+            get_local_index, search_config.data_dir, search_config.index_path
+        )
+        return LocalSearchBackend(index)
+    return AzureSearchBackend(search_config)
+
 
 class ReasoningSearch:
-    """Handles Azure AI Search integration for reasoning agents."""
+    """Knowledge search plugin for reasoning agents.
+
+    Queries go to the backend named by SearchConfig.backend: an Azure AI
+    Search index ("azure") or the in-process BM25 index ("local").
+    """
 
     def __init__(self, search_config: SearchConfig | None = None):
         self.search_config = search_config
-        self.search_client: SearchClient | None = None
+        self.backend: SearchBackend | None = None
+        self.metrics: Dict[str, float] = defaultdict(float)
 
     async def initialize(self, kernel: Kernel) -> bool:
-        """Initialize the search collection with embeddings and add it to the kernel."""
-        if (
-            not self.search_config
-            or not self.search_config.endpoint
-            or not self.search_config.index_name
-        ):
-            print("Search configuration not available")
+        """Set up the search backend and add this class to the kernel as a plugin."""
+        if not await self.connect():
             return False
 
         try:
-
-            self.search_client = SearchClient(
-                endpoint=self.search_config.endpoint,
-                credential=AzureKeyCredential(self.search_config.api_key),
-                index_name=self.search_config.index_name,
-            )
-
             # Add this class as a plugin so the agent can call search_documents
             kernel.add_plugin(self, plugin_name="knowledge_search")
 
             print(
-                f"Added Azure AI Search plugin for index: {self.search_config.index_name}"
+                f"Added {self.search_config.backend} search plugin for index: {self.search_config.index_name}"
             )
             return True
 
         except Exception as ex:
-            print(f"Could not initialize Azure AI Search: {ex}")
+            print(f"Could not initialize {self.search_config.backend} search plugin: {ex}")
+            return False
+
+    async def connect(self) -> bool:
+        """Set up the configured search backend."""
+        config = self.search_config
+        if config and config.backend == "local":
+            configured = bool(config.data_dir)
+        else:
+            configured = bool(config and config.endpoint and config.index_name)
+        if not configured:
+            print("Search configuration not available")
+            return False
+
+        try:
+            self.backend = await create_search_backend(config)
+            return True
+        except Exception as ex:
+            print(f"Could not initialize {config.backend} search: {ex}")
             return False
 
     @kernel_function(
         name="search_documents",
-        description="Search the knowledge base for relevant documents and information. Use this when you need to find specific information from internal documents or data.",
+        description="Search the knowledge base for relevant documents and information. Use this when you need to find specific information from internal documents or data. To look up several things at once, pass the other queries in 'queries'.",
     )
-    async def search_documents(self, query: str, limit: str = "3") -> str:
+    async def search_documents(
+        self,
+        query: str,
+        limit: str = "3",
+        queries: Annotated[
+            list[str] | None, "Further queries, searched at the same time as query"
+        ] = None,
+    ) -> str:
         """Search function that the agent can invoke to find relevant documents."""
-        if not self.search_client:
+        if not self.backend:
             return "Search service is not available."
 
         try:
             limit_int = int(limit)
-            search_results = []
-
-            results = self.search_client.search(
-                search_text=query,
-                query_type="simple",
-                select=["content"],
-                top=limit_int,
+            all_queries = list(dict.fromkeys([query, *(queries or [])]))
+            result_lists = await asyncio.gather(
+                *(self._search(q, limit_int) for q in all_queries)
+            )
+            # Documents found by several queries are returned once
+            search_results = list(
+                dict.fromkeys(result for results in result_lists for result in results)
             )
-
-            for result in results:
-                search_results.append(f"content: {result['content']}")
 
             if not search_results:
-                return f"No relevant documents found for query: '{query}'"
+                searched = "', '".join(all_queries)
+                return f"No relevant documents found for query: '{searched}'"
 
             return search_results
 
         except Exception as ex:
             return f"Search failed: {str(ex)}"
 
+    async def _search(self, query: str, limit: int) -> List[str]:
+        config = self.search_config
+        self.metrics["queries"] += 1
+        if config.backend == "local":
+            # Cheap to query, and caching would hide updates from the next sync
+            return await self._fetch(query, limit)
+        key = hashlib.sha256(
+            f"{config.endpoint}\n{config.index_name}\n{limit}\n{query}".encode("utf-8")
+        ).hexdigest()
+        return await _results_cache.get(key, lambda: self._fetch(query, limit))
+
+    async def _fetch(self, query: str, limit: int) -> List[str]:
+        started = time.perf_counter()
+        contents = [
+            f"content: {content}" for content in await self.backend.search(query, limit)
+        ]
+        elapsed_ms = (time.perf_counter() - started) * 1e3
+
+        self.metrics["searches"] += 1
+        self.metrics["search_ms_total"] += elapsed_ms
+        self.metrics["search_ms_max"] = max(self.metrics["search_ms_max"], elapsed_ms)
+        logger.info(
+            "Searched %s for %r: %d results in %.0f ms",
+            self.search_config.index_name,
+            query,
+            len(contents),
+            elapsed_ms,
+        )
+        return contents
+
     def is_available(self) -> bool:
         """Check if search functionality is available."""
-        return self.search_client is not None
+        return self.backend is not None
 
 
 # Simple factory function
@@ -83,6 +83,20 @@ class PlanApprovalRequest:
     context: dict | None = None
 
 
+@dataclass(slots=True)
+class PlanStepStreaming:
+    """A plan step sent to the frontend while the rest of the plan is still being generated."""
+
+    m_plan_id: str
+    step_index: int
+    agent: str
+    action: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the PlanStepStreaming to a dictionary for JSON serialization."""
+        return asdict(self)
+
+
 @dataclass(slots=True)
 class PlanApprovalResponse:
     """Response for plan approval from the frontend."""
@@ -102,6 +116,21 @@ class ReplanApprovalRequest:
     context: dict | None = None
 
 
+@dataclass(slots=True)
+class ReplanDiff:
+    """Changes between the current plan and a replanned one, sent instead of the full plan."""
+
+    m_plan_id: str
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    facts: str | None = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the ReplanDiff to a dictionary for JSON serialization."""
+        return asdict(self)
+
+
 @dataclass(slots=True)
 class ReplanApprovalResponse:
     """Response for replan approval from the frontend."""
@@ -207,7 +236,9 @@ class WebsocketMessageType(str, Enum):
     AGENT_MESSAGE_STREAMING = "agent_message_streaming"
     AGENT_TOOL_MESSAGE = "agent_tool_message"
     PLAN_APPROVAL_REQUEST = "plan_approval_request"
+    PLAN_STEP_STREAMING = "plan_step_streaming"
     PLAN_APPROVAL_RESPONSE = "plan_approval_response"
+    REPLAN = "replan"
     REPLAN_APPROVAL_REQUEST = "replan_approval_request"
     REPLAN_APPROVAL_RESPONSE = "replan_approval_response"
     USER_CLARIFICATION_REQUEST = "user_clarification_request"
@@ -0,0 +1,99 @@
+import functools
+from typing import Dict, List, Optional, Tuple
+
+
+class AgentNameMatcher:
+    """
+    Aho-Corasick automaton over the (lower-cased) agent names of a team.
+
+    find_first() scans a text once and returns the team name with the lowest
+    team index that occurs anywhere in it, i.e. the same answer as
+
+        next((name for name in team if name.lower() in text), None)
+
+    but in O(len(text)) instead of O(len(team) * len(text)).
+
+    Build through get_agent_name_matcher() so each team is compiled only once.
+    """
+
+    # For small teams the C-level substring checks beat a Python-level scan
+    linear_scan_max_team: int = 32
+
+    def __init__(self, team: Tuple[str, ...]):
+        self.team = team
+        self._lowered = tuple(name.lower() for name in team)
+        # Trie stored as parallel lists indexed by node id (0 = root)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Lowest team index among patterns ending at this node or along its fail chain
+        self._best: List[Optional[int]] = [None]
+
+        for index, name in enumerate(team):
+            node = 0
+            for char in name.lower():
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best.append(None)
+                node = next_node
+            if self._best[node] is None or index < self._best[node]:
+                self._best[node] = index
+
+        self._build_fail_links()
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._best[child] = _min_index(self._best[child], self._best[self._fail[child]])
+
+    def find_first(self, text: str) -> Optional[str]:
+        """Return the earliest team member (by team order) named in text, or None."""
+        if len(self.team) <= self.linear_scan_max_team:
+            for name, lowered in zip(self.team, self._lowered):
+                if lowered in text:
+                    return name
+            return None
+
+        goto = self._goto
+        fail = self._fail
+        best_by_node = self._best
+
+        best = best_by_node[0]  # an empty name matches every text
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found = best_by_node[node]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+
+        return None if best is None else self.team[best]
+
+
+def _min_index(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+@functools.lru_cache(maxsize=64)
+def get_agent_name_matcher(team: Tuple[str, ...]) -> AgentNameMatcher:
+    """Return the shared matcher for a team, building it on first use."""
+    return AgentNameMatcher(team)
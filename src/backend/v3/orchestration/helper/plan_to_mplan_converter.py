@@ -1,11 +1,21 @@
+import difflib
+import hashlib
+import json
 import logging
 import re
-from typing import Iterable, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from v3.models.models import MPlan, MStep
+from v3.orchestration.helper.agent_name_matcher import get_agent_name_matcher
 
 logger = logging.getLogger(__name__)
 
+# Parsed steps keyed by a hash of the plan text, team and parsing options.
+# Replans frequently regenerate the same plan text, which then skips parsing.
+PARSE_CACHE_SIZE = 128
+_parse_cache: "OrderedDict[str, Tuple[Tuple[MStep, ...], Tuple[int, ...]]]" = OrderedDict()
+
 
 class PlanToMPlanConverter:
     """
@@ -59,6 +69,9 @@ class PlanToMPlanConverter:
 
         # Map for faster case-insensitive lookups while preserving canonical form
         self._team_lookup = {t.lower(): t for t in self.team}
+        # Multi-pattern matcher for the window scan, shared by every converter for this team
+        self._agent_matcher = get_agent_name_matcher(tuple(self.team))
+        self._removal_patterns = {}
 
     # ---------------- Public API ---------------- #
 
@@ -77,38 +90,80 @@ class PlanToMPlanConverter:
         mplan.user_request = self.task or mplan.user_request
         mplan.facts = self.facts or mplan.facts
 
-        lines = self._preprocess_lines(plan_text)
+        cache_key = self._cache_key(plan_text)
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            _parse_cache.move_to_end(cache_key)
+            steps, step_levels = cached
+        else:
+            steps, step_levels = self._parse_steps(plan_text)
+            self._store_parse(cache_key, steps, step_levels)
 
-        step_levels: List[int] = []
-        for raw_line in lines:
-            bullet_match = self.BULLET_RE.match(raw_line)
-            if not bullet_match:
-                continue  # ignore non-bullet lines entirely
+        # Copies, so callers can mutate the plan without touching the cache
+        mplan.steps = [step.model_copy() for step in steps]
+
+        if self.enable_sub_bullets:
+            # Expose levels so caller can correlate (parallel list)
+            self.last_step_levels = list(step_levels)  # type: ignore[attr-defined]
 
-            indent = bullet_match.group("indent") or ""
-            body = bullet_match.group("body").strip()
+        return mplan
 
-            level = 0
-            if self.enable_sub_bullets and indent:
-                # Simple heuristic: any indentation => level 1 (could extend to deeper)
-                level = 1
+    def stream(self) -> "StreamingPlanParser":
+        """
+        Start an incremental parse for plan text that arrives in chunks.
+
+        Example:
+            parser = converter.stream()
+            async for chunk in llm_stream:
+                for step in parser.feed(chunk):
+                    ...  # push the step to the client
+            mplan = parser.finish()
+        """
+        return StreamingPlanParser(self)
 
-            agent, action = self._extract_agent_and_action(body)
+    # ---------------- Internal Helpers ---------------- #
 
-            if not action:
+    def _parse_steps(self, plan_text: str) -> Tuple[Tuple[MStep, ...], Tuple[int, ...]]:
+        steps: List[MStep] = []
+        step_levels: List[int] = []
+        for raw_line in self._preprocess_lines(plan_text):
+            parsed = self._parse_line(raw_line)
+            if parsed is None:
                 continue
 
-            mplan.steps.append(MStep(agent=agent, action=action))
+            step, level = parsed
+            steps.append(step)
             if self.enable_sub_bullets:
                 step_levels.append(level)
+        return tuple(steps), tuple(step_levels)
 
-        if self.enable_sub_bullets:
-            # Expose levels so caller can correlate (parallel list)
-            self.last_step_levels = step_levels  # type: ignore[attr-defined]
-
-        return mplan
+    def _cache_key(self, plan_text: str) -> str:
+        """
+        Hash of everything that determines the parsed steps. Task and facts are
+        copied onto the MPlan as-is, so they are not part of the key.
+        """
+        payload = json.dumps(
+            [
+                plan_text,
+                self.team,
+                self.detection_window,
+                self.fallback_agent,
+                self.enable_sub_bullets,
+                self.trim_actions,
+                self.collapse_internal_whitespace,
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    # ---------------- Internal Helpers ---------------- #
+    @staticmethod
+    def _store_parse(cache_key: str, steps, step_levels) -> None:
+        _parse_cache[cache_key] = (
+            tuple(step.model_copy() for step in steps),
+            tuple(step_levels),
+        )
+        _parse_cache.move_to_end(cache_key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
 
     def _preprocess_lines(self, plan_text: str) -> List[str]:
         lines = plan_text.splitlines()
@@ -119,6 +174,30 @@ class PlanToMPlanConverter:
                 cleaned.append(stripped)
         return cleaned
 
+    def _parse_line(self, raw_line: str) -> Optional[Tuple[MStep, int]]:
+        """
+        Parse one preprocessed line into (step, level).
+        Returns None for non-bullet lines and bullets with a blank action.
+        """
+        bullet_match = self.BULLET_RE.match(raw_line)
+        if not bullet_match:
+            return None  # ignore non-bullet lines entirely
+
+        indent = bullet_match.group("indent") or ""
+        body = bullet_match.group("body").strip()
+
+        level = 0
+        if self.enable_sub_bullets and indent:
+            # Simple heuristic: any indentation => level 1 (could extend to deeper)
+            level = 1
+
+        agent, action = self._extract_agent_and_action(body)
+
+        if not action:
+            return None
+
+        return MStep(agent=agent, action=action), level
+
     def _extract_agent_and_action(self, body: str) -> (str, str):
         """
         Apply bold-first strategy, then window scan fallback.
@@ -156,14 +235,20 @@ class PlanToMPlanConverter:
 
     def _try_window_agent(self, text: str) -> (Optional[str], str):
         head_segment = text[: self.detection_window].lower()
-        for canonical in self.team:
-            if canonical.lower() in head_segment:
-                # Remove first occurrence (case-insensitive)
-                pattern = re.compile(re.escape(canonical), re.IGNORECASE)
-                cleaned = pattern.sub("", text, count=1)
-                cleaned = cleaned.replace("*", "")
-                return canonical, cleaned.strip()
-        return None, text
+        # Earliest team member (in team order) named within the window
+        canonical = self._agent_matcher.find_first(head_segment)
+        if canonical is None:
+            return None, text
+
+        # Remove first occurrence (case-insensitive)
+        pattern = self._removal_patterns.get(canonical)
+        if pattern is None:
+            pattern = self._removal_patterns[canonical] = re.compile(
+                re.escape(canonical), re.IGNORECASE
+            )
+        cleaned = pattern.sub("", text, count=1)
+        cleaned = cleaned.replace("*", "")
+        return canonical, cleaned.strip()
 
     def _finalize_action(self, action: str) -> str:
         if self.trim_actions:
@@ -192,3 +277,120 @@ class PlanToMPlanConverter:
             facts=facts,
             **kwargs,
         ).parse(plan_text)
+
+
+class StreamingPlanParser:
+    """
+    Incremental counterpart of PlanToMPlanConverter.parse.
+
+    Plan text is fed in arbitrary chunks as it streams from the model. A step is
+    emitted as soon as its line is complete (a line break has been seen), and
+    finish() parses the trailing line and returns the MPlan. The resulting plan
+    has the same steps, team, user_request and facts as parse() on the full text.
+
+    The MPlan is created up front so its id can be sent with partial step events
+    before the plan is complete.
+    """
+
+    def __init__(self, converter: PlanToMPlanConverter):
+        self.converter = converter
+        self.mplan = MPlan()
+        self.mplan.team = converter.team.copy()
+        self.mplan.user_request = converter.task or self.mplan.user_request
+        self.mplan.facts = converter.facts or self.mplan.facts
+        self.step_levels: List[int] = []
+        self._pending = ""
+        self._text: List[str] = []
+        self._finished = False
+
+    def feed(self, chunk: str) -> List[MStep]:
+        """Add a chunk of plan text; return the steps completed by it."""
+        if self._finished:
+            raise ValueError("Cannot feed a StreamingPlanParser after finish()")
+        if not chunk:
+            return []
+
+        self._text.append(chunk)
+        self._pending += chunk
+        lines = self._pending.splitlines(keepends=True)
+        # The last line is complete only if it ends in a line break. A lone
+        # trailing "\r" may still become "\r\n", so keep it pending as well.
+        last = lines[-1]
+        if last.endswith("\r") or last.splitlines()[0] == last:
+            self._pending = lines.pop()
+        else:
+            self._pending = ""
+
+        return self._consume(lines)
+
+    def finish(self) -> MPlan:
+        """Parse any trailing text and return the completed MPlan."""
+        if not self._finished:
+            self._consume([self._pending])
+            self._pending = ""
+            self._finished = True
+            # A later parse() of the same text (e.g. an unchanged replan) reuses this result
+            self.converter._store_parse(
+                self.converter._cache_key("".join(self._text)),
+                self.mplan.steps,
+                self.step_levels,
+            )
+            if self.converter.enable_sub_bullets:
+                self.converter.last_step_levels = list(self.step_levels)  # type: ignore[attr-defined]
+        return self.mplan
+
+    def _consume(self, lines: List[str]) -> List[MStep]:
+        new_steps: List[MStep] = []
+        for line in lines:
+            for raw_line in self.converter._preprocess_lines(line):
+                parsed = self.converter._parse_line(raw_line)
+                if parsed is None:
+                    continue
+                step, level = parsed
+                self.mplan.steps.append(step)
+                if self.converter.enable_sub_bullets:
+                    self.step_levels.append(level)
+                new_steps.append(step)
+        return new_steps
+
+
+def diff_plan_steps(old_steps: List[MStep], new_steps: List[MStep]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Structural diff between the steps of two successive plans.
+
+    Steps are compared by (agent, action). Returns a dict with:
+      - added:   [{"index", "agent", "action"}]       (index into new_steps)
+      - removed: [{"index", "agent", "action"}]       (index into old_steps)
+      - changed: [{"old_index", "index", "agent", "action", "old_agent", "old_action"}]
+    Replaced runs are paired up as changed steps; any surplus on either side is
+    reported as added or removed.
+    """
+    old_keys = [(step.agent, step.action) for step in old_steps]
+    new_keys = [(step.agent, step.action) for step in new_steps]
+    matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+
+    added: List[Dict[str, Any]] = []
+    removed: List[Dict[str, Any]] = []
+    changed: List[Dict[str, Any]] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            old_step, new_step = old_steps[i1 + offset], new_steps[j1 + offset]
+            changed.append(
+                {
+                    "old_index": i1 + offset,
+                    "index": j1 + offset,
+                    "agent": new_step.agent,
+                    "action": new_step.action,
+                    "old_agent": old_step.agent,
+                    "old_action": old_step.action,
+                }
+            )
+        for index in range(i1 + paired, i2):
+            removed.append({"index": index, "agent": old_steps[index].agent, "action": old_steps[index].action})
+        for index in range(j1 + paired, j2):
+            added.append({"index": index, "agent": new_steps[index].agent, "action": new_steps[index].action})
+
+    return {"added": added, "removed": removed, "changed": changed}
@@ -0,0 +1,58 @@
+"""
+Chat completion service wrapper that streams the plan completion of the Magentic manager.
+
+StandardMagenticManager.plan requests the plan with get_chat_message_content.
+While this wrapper stands in for the manager's chat service, that request is
+answered from the streaming API instead, and each chunk is handed to a callback
+as it arrives. Planning itself still runs through the public plan() method.
+"""
+
+from typing import Any, Awaitable, Callable
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import \
+    ChatCompletionClientBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import \
+    PromptExecutionSettings
+from semantic_kernel.contents import ChatHistory, ChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+
+class StreamingPlanChatService(ChatCompletionClientBase):
+    """
+    Delegates to another chat completion service.
+
+    A request whose last message is plan_prompt is streamed, and on_plan_chunk
+    is awaited with every chunk of text; the joined text is returned as the
+    reply. Every other request is passed to the service unchanged.
+    """
+
+    service: ChatCompletionClientBase
+    plan_prompt: str
+    on_plan_chunk: Callable[[str], Awaitable[None]]
+
+    def __init__(self, service: ChatCompletionClientBase, plan_prompt: str, on_plan_chunk):
+        super().__init__(
+            ai_model_id=service.ai_model_id,
+            service_id=service.service_id,
+            service=service,
+            plan_prompt=plan_prompt,
+            on_plan_chunk=on_plan_chunk,
+        )
+
+    async def get_chat_message_content(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings, **kwargs: Any
+    ) -> ChatMessageContent | None:
+        messages = chat_history.messages
+        if not messages or messages[-1].content != self.plan_prompt:
+            return await self.service.get_chat_message_content(chat_history, settings, **kwargs)
+
+        chunks = []
+        async for responses in self.service.get_streaming_chat_message_contents(
+            chat_history, settings, **kwargs
+        ):
+            for response in responses:
+                if not response.content:
+                    continue
+                chunks.append(response.content)
+                await self.on_plan_chunk(response.content)
+        return ChatMessageContent(role=AuthorRole.ASSISTANT, content="".join(chunks))
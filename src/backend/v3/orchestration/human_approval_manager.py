@@ -20,10 +20,18 @@ from semantic_kernel.agents.orchestration.prompts._magentic_prompts import (
     ORCHESTRATOR_TASK_LEDGER_PLAN_UPDATE_PROMPT,
 )
 from semantic_kernel.contents import ChatMessageContent
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.prompt_template.kernel_prompt_template import \
+    KernelPromptTemplate
+from semantic_kernel.prompt_template.prompt_template_config import \
+    PromptTemplateConfig
 from v3.config.settings import connection_config, orchestration_config
 from v3.models.models import MPlan
-from v3.orchestration.helper.plan_to_mplan_converter import \
-    PlanToMPlanConverter
+from v3.orchestration.helper.plan_to_mplan_converter import (
+    PlanToMPlanConverter, diff_plan_steps)
+from v3.orchestration.helper.streaming_plan_chat_service import \
+    StreamingPlanChatService
 
 # Using a module level logger to avoid pydantic issues around inherited fields
 logger = logging.getLogger(__name__)
@@ -104,15 +112,11 @@ Here is an example of a well-structured plan:
         logger.info("   Task: %s", task_text)
         logger.info("-" * 60)
 
-        # First, let the parent create the actual plan
+        # Let the parent create the plan, pushing each step to the user as soon as it is generated
         logger.info(" Creating execution plan...")
-        plan = await super().plan(magentic_context)
+        plan = await self._plan_streaming_steps(magentic_context)
         logger.info(" Plan created: %s", plan)
 
-        self.magentic_plan = self.plan_to_obj(magentic_context, self.task_ledger)
-
-        self.magentic_plan.user_id = self.current_user_id
-
         # Request approval from the user before executing the plan
         approval_message = messages.PlanApprovalRequest(
             plan=self.magentic_plan,
@@ -157,16 +161,118 @@ Here is an example of a well-structured plan:
             )
             raise Exception("Plan execution cancelled by user")
 
+    async def _plan_streaming_steps(self, magentic_context: MagenticContext) -> Any:
+        """
+        Run the parent's plan() with the plan completion streamed, sending each step
+        to the user as a PLAN_STEP_STREAMING message while the rest of the plan is
+        still being generated. Sets self.magentic_plan.
+
+        Returns:
+            The task ledger returned by StandardMagenticManager.plan.
+        """
+        plan_prompt = await KernelPromptTemplate(
+            prompt_template_config=PromptTemplateConfig(template=self.task_ledger_plan_prompt)
+        ).render(Kernel(), KernelArguments(team=magentic_context.participant_descriptions))
+        parser = PlanToMPlanConverter(
+            team=list(magentic_context.participant_descriptions.keys()),
+            task=magentic_context.task,
+        ).stream()
+
+        async def on_plan_chunk(chunk: str) -> None:
+            await self._send_plan_steps(parser, parser.feed(chunk))
+
+        service = self.chat_completion_service
+        self.chat_completion_service = StreamingPlanChatService(service, plan_prompt, on_plan_chunk)
+        try:
+            plan = await super().plan(magentic_context)
+        finally:
+            self.chat_completion_service = service
+
+        step_count = len(parser.mplan.steps)
+        parser.finish()
+        await self._send_plan_steps(parser, parser.mplan.steps[step_count:])
+
+        # Same steps as the streamed ones (the parse is cached), under the id they were sent with
+        self.magentic_plan = self.plan_to_obj(magentic_context, self.task_ledger)
+        self.magentic_plan.id = parser.mplan.id
+        self.magentic_plan.user_id = self.current_user_id
+        return plan
+
+    async def _send_plan_steps(self, parser, steps) -> None:
+        """Send newly parsed plan steps to the user's WebSocket / event stream."""
+        first_index = len(parser.mplan.steps) - len(steps)
+        for offset, step in enumerate(steps):
+            try:
+                await connection_config.send_status_update_async(
+                    message=messages.PlanStepStreaming(
+                        m_plan_id=parser.mplan.id,
+                        step_index=first_index + offset,
+                        agent=step.agent,
+                        action=step.action,
+                    ),
+                    user_id=self.current_user_id,
+                    message_type=messages.WebsocketMessageType.PLAN_STEP_STREAMING,
+                )
+            except Exception as e:
+                logger.error("Error sending streamed plan step: %s", e)
+
     async def replan(self, magentic_context: MagenticContext) -> Any:
         """
         Override to add websocket messages for replanning events.
+        Only the steps that changed are sent to the user, as a REPLAN message.
         """
 
         logger.info("\nHuman-in-the-Loop Magentic Manager replanned:")
         replan = await super().replan(magentic_context=magentic_context)
         logger.info("Replanned: %s", replan)
+
+        await self._send_replan_diff(magentic_context)
         return replan
 
+    async def _send_replan_diff(self, magentic_context: MagenticContext) -> None:
+        """Parse the updated ledger and send the diff against the current plan."""
+        try:
+            new_plan = self.plan_to_obj(magentic_context, self.task_ledger)
+        except Exception as e:
+            logger.error("Error parsing replanned ledger: %s", e)
+            return
+
+        previous_plan = self.magentic_plan
+        if previous_plan is None:
+            new_plan.user_id = self.current_user_id
+            self.magentic_plan = new_plan
+            return
+
+        # The replanned steps replace the current plan in place, under the same id
+        new_plan.id = previous_plan.id
+        new_plan.user_id = previous_plan.user_id
+        new_plan.team_id = previous_plan.team_id
+        new_plan.plan_id = previous_plan.plan_id
+        new_plan.overall_status = previous_plan.overall_status
+
+        diff = diff_plan_steps(previous_plan.steps, new_plan.steps)
+        self.magentic_plan = new_plan
+        orchestration_config.plans[new_plan.id] = new_plan
+
+        if not any(diff.values()) and new_plan.facts == previous_plan.facts:
+            logger.info("Replan produced an unchanged plan; nothing to send")
+            return
+
+        try:
+            await connection_config.send_status_update_async(
+                message=messages.ReplanDiff(
+                    m_plan_id=new_plan.id,
+                    added=diff["added"],
+                    removed=diff["removed"],
+                    changed=diff["changed"],
+                    facts=new_plan.facts if new_plan.facts != previous_plan.facts else None,
+                ),
+                user_id=self.current_user_id,
+                message_type=messages.WebsocketMessageType.REPLAN,
+            )
+        except Exception as e:
+            logger.error("Error sending replan diff: %s", e)
+
     async def create_progress_ledger(
         self, magentic_context: MagenticContext
     ) -> ProgressLedger:
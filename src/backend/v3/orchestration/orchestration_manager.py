@@ -16,6 +16,7 @@ from semantic_kernel.connectors.ai.open_ai import (
 from semantic_kernel.contents import (ChatMessageContent,
                                       StreamingChatMessageContent)
 from v3.callbacks.response_handlers import (agent_response_callback,
+                                            clear_stream_filters,
                                             streaming_agent_response_callback)
 from v3.config.settings import connection_config, orchestration_config
 from v3.magentic_agents.magentic_agent_factory import MagenticAgentFactory
@@ -178,3 +179,4 @@ class OrchestrationManager:
             self.logger.error(f"Unexpected error: {e}")
         finally:
             await runtime.stop_when_idle()
+            clear_stream_filters(user_id)
@@ -38,6 +38,7 @@ interface SimplifiedPlanChatProps extends PlanChatProps {
   onPlanReceived?: (planData: MPlanData) => void;
   initialTask?: string;
   planApprovalRequest: MPlanData | null;
+  streamedPlan?: MPlanData | null;
   waitingForPlan: boolean;
   messagesContainerRef: React.RefObject<HTMLDivElement>;
   streamingMessageBuffer: string;
@@ -61,6 +62,7 @@ const PlanChat: React.FC<SimplifiedPlanChatProps> = ({
   onPlanReceived,
   initialTask,
   planApprovalRequest,
+  streamedPlan = null,
   waitingForPlan,
   messagesContainerRef,
   streamingMessageBuffer,
@@ -102,7 +104,7 @@ const PlanChat: React.FC<SimplifiedPlanChatProps> = ({
         {renderUserPlanMessage(planApprovalRequest, initialTask, planData)}
 
         {/* AI thinking state */}
-        {renderThinkingState(waitingForPlan)}
+        {renderThinkingState(waitingForPlan, streamedPlan)}
 
         {/* Plan response with all information */}
         {renderPlanResponse(planApprovalRequest, handleApprovePlan, handleRejectPlan, processingApproval, showApprovalButtons)}
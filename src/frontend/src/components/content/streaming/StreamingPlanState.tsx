@@ -1,8 +1,10 @@
 import { Spinner } from "@fluentui/react-components";
+import { MPlanData } from "@/models";
 
-// Simple thinking message to show while creating plan
-const renderThinkingState = (waitingForPlan: boolean) => {
+// Simple thinking message to show while creating plan, with the steps generated so far
+const renderThinkingState = (waitingForPlan: boolean, streamedPlan: MPlanData | null = null) => {
     if (!waitingForPlan) return null;
+    const streamedSteps = (streamedPlan?.steps || []).filter(step => step.cleanAction.length > 0);
 
     return (
         <div style={{
@@ -47,6 +49,22 @@ const renderThinkingState = (waitingForPlan: boolean) => {
                         <Spinner size="small" />
                         <span>Creating your plan...</span>
                     </div>
+                    {streamedSteps.length > 0 && (
+                        <ol style={{
+                            margin: 0,
+                            paddingLeft: '20px',
+                            color: 'var(--colorNeutralForeground2)',
+                            fontSize: '14px',
+                            lineHeight: '1.5'
+                        }}>
+                            {streamedSteps.map(step => (
+                                <li key={step.id}>
+                                    {step.agent && <strong>{step.agent}: </strong>}
+                                    {step.cleanAction}
+                                </li>
+                            ))}
+                        </ol>
+                    )}
                 </div>
             </div>
         </div>
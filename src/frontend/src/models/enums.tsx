@@ -247,7 +247,9 @@ export enum WebsocketMessageType {
     AGENT_MESSAGE_STREAMING = "agent_message_streaming",
     AGENT_TOOL_MESSAGE = "agent_tool_message",
     PLAN_APPROVAL_REQUEST = "plan_approval_request",
+    PLAN_STEP_STREAMING = "plan_step_streaming",
     PLAN_APPROVAL_RESPONSE = "plan_approval_response",
+    REPLAN = "replan",
     REPLAN_APPROVAL_REQUEST = "replan_approval_request",
     REPLAN_APPROVAL_RESPONSE = "replan_approval_response",
     USER_CLARIFICATION_REQUEST = "user_clarification_request",
@@ -146,6 +146,33 @@ export interface ParsedPlanApprovalRequest {
     rawData: string;
 }
 
+// A plan step sent while the rest of the plan is still being generated
+export interface PlanStepStreamingData {
+    m_plan_id: string;
+    step_index: number;
+    agent: string;
+    action: string;
+}
+
+// A step of a replan diff; index points into the new plan, old_index into the previous one
+export interface ReplanStepChange {
+    index: number;
+    agent: string;
+    action: string;
+    old_index?: number;
+    old_agent?: string;
+    old_action?: string;
+}
+
+// Changes between the current plan and a replanned one
+export interface ReplanDiffData {
+    m_plan_id: string;
+    added: ReplanStepChange[];
+    removed: ReplanStepChange[];
+    changed: ReplanStepChange[];
+    facts: string | null;
+}
+
 export interface ParsedUserClarification {
     type: WebsocketMessageType.USER_CLARIFICATION_REQUEST;
     question: string;
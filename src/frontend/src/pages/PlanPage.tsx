@@ -45,6 +45,8 @@ const PlanPage: React.FC = () => {
     const [clarificationMessage, setClarificationMessage] = useState<ParsedUserClarification | null>(null);
     const [processingApproval, setProcessingApproval] = useState<boolean>(false);
     const [planApprovalRequest, setPlanApprovalRequest] = useState<MPlanData | null>(null);
+    // Steps received while the plan is still being generated
+    const [streamedPlan, setStreamedPlan] = useState<MPlanData | null>(null);
     const [reloadLeftList, setReloadLeftList] = useState<boolean>(true);
     const [waitingForPlan, setWaitingForPlan] = useState<boolean>(true);
     const [showProcessingPlanSpinner, setShowProcessingPlanSpinner] = useState<boolean>(false);
@@ -172,6 +174,7 @@ const PlanPage: React.FC = () => {
         setClarificationMessage(null);
         setProcessingApproval(false);
         setPlanApprovalRequest(null);
+        setStreamedPlan(null);
         setReloadLeftList(true);
         setWaitingForPlan(true);
         setShowProcessingPlanSpinner(false);
@@ -191,6 +194,7 @@ const PlanPage: React.FC = () => {
         setClarificationMessage,
         setProcessingApproval,
         setPlanApprovalRequest,
+        setStreamedPlan,
         setReloadLeftList,
         setWaitingForPlan,
         setShowProcessingPlanSpinner,
@@ -246,6 +250,7 @@ const PlanPage: React.FC = () => {
             if (mPlanData) {
                 console.log('✅ Parsed plan data:', mPlanData);
                 setPlanApprovalRequest(mPlanData);
+                setStreamedPlan(null);
                 setWaitingForPlan(false);
                 setShowProcessingPlanSpinner(false);
                 scrollToBottom();
@@ -257,6 +262,27 @@ const PlanPage: React.FC = () => {
         return () => unsubscribe();
     }, [scrollToBottom]);
 
+    //WebsocketMessageType.PLAN_STEP_STREAMING
+    useEffect(() => {
+        const unsubscribe = webSocketService.onPlanStepStreaming((step) => {
+            setStreamedPlan(prev => PlanDataService.addStreamedPlanStep(prev, step));
+        });
+
+        return () => unsubscribe();
+    }, []);
+
+    //WebsocketMessageType.REPLAN
+    useEffect(() => {
+        const unsubscribe = webSocketService.onReplan((diff) => {
+            console.log('📋 Replan', diff);
+            setPlanApprovalRequest(prev =>
+                prev && prev.id === diff.m_plan_id ? PlanDataService.applyReplanDiff(prev, diff) : prev
+            );
+        });
+
+        return () => unsubscribe();
+    }, []);
+
     //(WebsocketMessageType.AGENT_MESSAGE_STREAMING
     useEffect(() => {
         const unsubscribe = webSocketService.on(WebsocketMessageType.AGENT_MESSAGE_STREAMING, (streamingMessage: any) => {
@@ -724,6 +750,7 @@ const PlanPage: React.FC = () => {
                                 wsConnected={wsConnected}
                                 onPlanApproval={(approved) => setPlanApproved(approved)}
                                 planApprovalRequest={planApprovalRequest}
+                                streamedPlan={streamedPlan}
                                 waitingForPlan={waitingForPlan}
                                 messagesContainerRef={messagesContainerRef}
                                 streamingMessageBuffer={streamingMessageBuffer}
@@ -743,7 +770,7 @@ const PlanPage: React.FC = () => {
                 <PlanPanelRight
                     planData={planData}
                     loading={loading}
-                    planApprovalRequest={planApprovalRequest}
+                    planApprovalRequest={planApprovalRequest || streamedPlan}
                 />
             </CoralShellRow>
 
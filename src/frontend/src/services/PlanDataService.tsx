@@ -21,7 +21,10 @@ import {
   AgentMessageResponse,
   FinalMessage,
   StreamingMessage,
-  UserRequestObject
+  UserRequestObject,
+  PlanStepStreamingData,
+  ReplanDiffData,
+  ReplanStepChange
 } from "@/models";
 import { apiService } from "@/api";
 
@@ -883,6 +886,114 @@ export class PlanDataService {
     }
   }
 
+  /**
+   * Strip markdown and model preamble from a plan step action
+   */
+  static cleanStepAction(action: string): string {
+    return (action || '')
+      .replace(/\*\*/g, '')
+      .replace(/^Certainly!\s*/i, '')
+      .replace(/^Given the team composition and the available facts,?\s*/i, '')
+      .replace(/^here is a (?:concise )?plan to[^.]*\.\s*/i, '')
+      .replace(/^\*\*([^*]+)\*\*:?\s*/g, '$1: ')
+      .replace(/^[-•]\s*/, '')
+      .replace(/\s+/g, ' ')
+      .trim();
+  }
+
+  /**
+   * Parse a plan_step_streaming payload: { m_plan_id, step_index, agent, action }
+   */
+  static parsePlanStepStreaming(rawData: any): PlanStepStreamingData | null {
+    if (!rawData || typeof rawData !== 'object') return null;
+    if (typeof rawData.m_plan_id !== 'string' || typeof rawData.step_index !== 'number') return null;
+    return {
+      m_plan_id: rawData.m_plan_id,
+      step_index: rawData.step_index,
+      agent: rawData.agent || 'System',
+      action: rawData.action || ''
+    };
+  }
+
+  /**
+   * Add a streamed step to the plan that is still being generated.
+   * The plan is started by its first step; steps are placed by step_index,
+   * so a repeated event replaces its step instead of adding it twice.
+   */
+  static addStreamedPlanStep(plan: MPlanData | null, step: PlanStepStreamingData): MPlanData {
+    const current: MPlanData = plan && plan.id === step.m_plan_id ? plan : {
+      id: step.m_plan_id,
+      status: 'GENERATING',
+      user_request: '',
+      team: [],
+      facts: '',
+      steps: [],
+      context: { task: '', participant_descriptions: {} }
+    };
+    const id = step.step_index + 1;
+    const steps = current.steps.filter(s => s.id !== id);
+    steps.push({ id, action: step.action, cleanAction: this.cleanStepAction(step.action), agent: step.agent });
+    steps.sort((a, b) => a.id - b.id);
+    return { ...current, steps };
+  }
+
+  /**
+   * Parse a replan payload: { m_plan_id, added, removed, changed, facts }
+   */
+  static parseReplanDiff(rawData: any): ReplanDiffData | null {
+    if (!rawData || typeof rawData !== 'object' || typeof rawData.m_plan_id !== 'string') return null;
+    const list = (value: any) => (Array.isArray(value) ? value : []);
+    return {
+      m_plan_id: rawData.m_plan_id,
+      added: list(rawData.added),
+      removed: list(rawData.removed),
+      changed: list(rawData.changed),
+      facts: typeof rawData.facts === 'string' ? rawData.facts : null
+    };
+  }
+
+  /**
+   * Apply a replan diff to the displayed plan.
+   * The displayed steps skip preamble and duplicate lines, so steps are matched by
+   * agent and cleaned action; the backend index only decides where added steps go.
+   */
+  static applyReplanDiff(plan: MPlanData, diff: ReplanDiffData): MPlanData {
+    const key = (agent: string | undefined, action: string) =>
+      `${agent || ''}|${this.cleanStepAction(action).toLowerCase()}`;
+    const toStep = (change: { agent: string; action: string }) => ({
+      id: 0,
+      action: change.action,
+      cleanAction: this.cleanStepAction(change.action),
+      agent: change.agent
+    });
+    const steps = [...plan.steps];
+    const findStep = (agent: string | undefined, action: string) =>
+      steps.findIndex(step => key(step.agent, step.action) === key(agent, action));
+    const insert = (change: ReplanStepChange) =>
+      steps.splice(Math.min(change.index, steps.length), 0, toStep(change));
+
+    diff.removed.forEach(change => {
+      const position = findStep(change.agent, change.action);
+      if (position >= 0) steps.splice(position, 1);
+    });
+    const added = [...diff.added];
+    diff.changed.forEach(change => {
+      const position = findStep(change.old_agent, change.old_action || '');
+      if (position >= 0) {
+        steps[position] = toStep(change);
+      } else {
+        added.push(change);
+      }
+    });
+    added.sort((a, b) => a.index - b.index).forEach(insert);
+
+    return {
+      ...plan,
+      facts: diff.facts ?? plan.facts,
+      steps: steps.map((step, i) => ({ ...step, id: i + 1 }))
+    };
+  }
+
   static simplifyHumanClarification(line: string): string {
     if (
       typeof line !== 'string' ||
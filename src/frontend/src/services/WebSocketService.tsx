@@ -1,6 +1,6 @@
 import { getApiUrl, getUserId, headerBuilder } from '../api/config';
 import { PlanDataService } from './PlanDataService';
-import { MPlanData, ParsedPlanApprovalRequest, StreamingPlanUpdate, StreamMessage, WebsocketMessageType } from '../models';
+import { MPlanData, ParsedPlanApprovalRequest, PlanStepStreamingData, ReplanDiffData, StreamingPlanUpdate, StreamMessage, WebsocketMessageType } from '../models';
 
 
 class WebSocketService {
@@ -160,6 +160,18 @@ class WebSocketService {
         });
     }
 
+    onPlanStepStreaming(callback: (step: PlanStepStreamingData) => void): () => void {
+        return this.on(WebsocketMessageType.PLAN_STEP_STREAMING, (message: StreamMessage) => {
+            if (message.data) callback(message.data);
+        });
+    }
+
+    onReplan(callback: (diff: ReplanDiffData) => void): () => void {
+        return this.on(WebsocketMessageType.REPLAN, (message: StreamMessage) => {
+            if (message.data) callback(message.data);
+        });
+    }
+
     onPlanApprovalResponse(callback: (response: any) => void): () => void {
         return this.on(WebsocketMessageType.PLAN_APPROVAL_RESPONSE, (message: StreamMessage) => {
             if (message.data) callback(message.data);
@@ -200,6 +212,26 @@ class WebSocketService {
                 break;
             }
 
+            case WebsocketMessageType.PLAN_STEP_STREAMING: {
+                const step = PlanDataService.parsePlanStepStreaming(message.data);
+                if (step) {
+                    this.emit(WebsocketMessageType.PLAN_STEP_STREAMING, step);
+                } else {
+                    console.warn('Ignoring malformed plan step:', message);
+                }
+                break;
+            }
+
+            case WebsocketMessageType.REPLAN: {
+                const diff = PlanDataService.parseReplanDiff(message.data);
+                if (diff) {
+                    this.emit(WebsocketMessageType.REPLAN, diff);
+                } else {
+                    console.warn('Ignoring malformed replan:', message);
+                }
+                break;
+            }
+
             case WebsocketMessageType.AGENT_MESSAGE: {
                 console.log("Message Agent':", message);
                 if (message.data) {
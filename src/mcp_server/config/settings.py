@@ -34,8 +34,35 @@ class MCPServerConfig(BaseSettings):
     server_name: str = Field(default="MacaeMcpServer")
     enable_auth: bool = Field(default=True)
     
+    # Tool services to load, comma separated (see core.service_registry)
+    enabled_services: str = Field(default="hr,tech_support,marketing,product,workflow")
+
     # Dataset path - added to handle the environment variable
     dataset_path: str = Field(default="./datasets")
+    dataset_poll_interval: float = Field(default=5.0)
+    dataset_cache_dir: Optional[str] = Field(default=None)  # columnar cache, off when unset
+
+    # Multi-worker HTTP mode (see mcp_server.run_workers)
+    workers: int = Field(default=1)
+    worker_transport: str = Field(default="streamable-http")
+    worker_state_dir: Optional[str] = Field(default=None)  # heartbeats; defaults to a temp dir per port
+    worker_heartbeat_interval: float = Field(default=5.0)
+
+    # Pools for blocking / CPU-bound tools (see core.tool_executor)
+    tool_io_workers: int = Field(default=8)
+    tool_cpu_workers: Optional[int] = Field(default=None)  # defaults to the CPU count
+
+    # Result cache for tools marked cached() (see core.result_cache); 0 entries disables it
+    tool_cache_max_entries: int = Field(default=1024)
+    tool_cache_max_bytes: int = Field(default=64 * 1024 * 1024)
+
+    # POST <mcp path>/tools/batch (see core.tool_batch)
+    tool_batch_max_calls: int = Field(default=64)
+    tool_batch_max_concurrency: int = Field(default=16)
+
+    # run_workflow step concurrency per blueprint domain, e.g. "hr=4,tech_support=2"
+    workflow_domain_concurrency: str = Field(default="")
+    workflow_default_concurrency: int = Field(default=4)
 
 
 # Global configuration instance
@@ -0,0 +1,171 @@
+"""
+On-disk columnar cache of the dataset tables.
+
+Each CSV is converted once into a directory of .npy arrays (one file per column
+array) plus a meta.json, and later loads memory-map those arrays instead of
+parsing the CSV again. Mapped pages live in the OS page cache, so every worker
+process serving the same cache directory shares a single physical copy.
+
+Layout under cache_dir:
+  <filename>.json                  pointer: source size/mtime/sha256 -> data dir
+  <filename>.<sha256[:16]>/        immutable converted table
+      meta.json                    name, row count, column kinds and order
+      <i>.values.npy, <i>.nulls.npy, <i>.categories.npy
+
+A pointer is trusted while the source size and mtime match it. If either
+changes, the source is re-hashed: same content (e.g. a touched or re-copied
+file) just refreshes the pointer, new content is converted again. Data
+directories are written under a temporary name and renamed into place, so a
+reader never sees a half-written table and concurrent workers converting the
+same file do not clash.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from core.dataset_catalog import DatasetEntry
+from core.table_store import Column, Table, load_csv
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+def file_sha256(path: str) -> str:
+    """Hex sha256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ColumnCache:
+    """Converts dataset CSVs to memory-mapped columnar tables, keyed by source content."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ---------------- Public API ---------------- #
+
+    def load(self, entry: DatasetEntry) -> Table:
+        """Return the memory-mapped table for a catalog entry, converting the CSV if needed."""
+        pointer = self._read_json(self._pointer_path(entry.filename))
+        if pointer and pointer.get("size") == entry.size and pointer.get("mtime") == entry.mtime:
+            table = self._open(pointer.get("dir", ""), entry)
+            if table is not None:
+                return table
+
+        sha256 = file_sha256(entry.path)
+        data_dir = f"{entry.filename}.{sha256[:16]}"
+        table = self._open(data_dir, entry)
+        if table is None:
+            logger.info("Converting '%s' to the columnar cache", entry.filename)
+            self._write(load_csv(entry.path, name=entry.filename[:-4]), data_dir)
+            table = self._open(data_dir, entry)
+            if table is None:
+                raise OSError(f"Columnar cache for '{entry.filename}' could not be read back")
+
+        self._write_json(
+            self._pointer_path(entry.filename),
+            {"size": entry.size, "mtime": entry.mtime, "sha256": sha256, "dir": data_dir},
+        )
+        self._remove_stale(entry.filename, keep=data_dir)
+        return table
+
+    # ---------------- Internal Helpers ---------------- #
+
+    def _pointer_path(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, f"{filename}.json")
+
+    def _open(self, data_dir: str, entry: DatasetEntry) -> Optional[Table]:
+        """Map a converted table, or return None if it is missing or unreadable."""
+        path = os.path.join(self.cache_dir, data_dir)
+        meta = self._read_json(os.path.join(path, "meta.json")) if data_dir else None
+        if not meta or meta.get("format") != FORMAT_VERSION:
+            return None
+
+        def mapped(index: int, part: str) -> np.ndarray:
+            # np.asarray drops the memmap subclass but keeps the zero-copy mapping
+            return np.asarray(np.load(os.path.join(path, f"{index}.{part}.npy"), mmap_mode="r"))
+
+        try:
+            columns: Dict[str, Column] = {}
+            for index, spec in enumerate(meta["columns"]):
+                columns[spec["name"]] = Column(
+                    name=spec["name"],
+                    kind=spec["kind"],
+                    values=mapped(index, "values"),
+                    nulls=mapped(index, "nulls"),
+                    categories=mapped(index, "categories") if spec["kind"] == "str" else None,
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable columnar cache '%s': %s", path, e)
+            return None
+
+        return Table(
+            name=meta["name"],
+            columns=columns,
+            num_rows=meta["num_rows"],
+            source_mtime=entry.mtime,
+            source_size=entry.size,
+            column_order=[spec["name"] for spec in meta["columns"]],
+        )
+
+    def _write(self, table: Table, data_dir: str) -> None:
+        """Write a table under a temporary name and rename it into place."""
+        staging = tempfile.mkdtemp(prefix=f".{data_dir}.", dir=self.cache_dir)
+        try:
+            specs = []
+            for index, name in enumerate(table.column_order):
+                column = table.columns[name]
+                np.save(os.path.join(staging, f"{index}.values.npy"), column.values)
+                np.save(os.path.join(staging, f"{index}.nulls.npy"), column.nulls)
+                if column.kind == "str":
+                    np.save(os.path.join(staging, f"{index}.categories.npy"), column.categories)
+                specs.append({"name": name, "kind": column.kind})
+            meta = {"format": FORMAT_VERSION, "name": table.name, "num_rows": table.num_rows, "columns": specs}
+            with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as file:
+                json.dump(meta, file)
+            try:
+                os.rename(staging, os.path.join(self.cache_dir, data_dir))
+            except OSError:
+                # Another worker converted the same content first; its copy is identical
+                if not os.path.isdir(os.path.join(self.cache_dir, data_dir)):
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _remove_stale(self, filename: str, keep: str) -> None:
+        """Delete converted copies of older versions of a file (mapped copies stay valid until unmapped)."""
+        prefix = f"{filename}."
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name != keep and not name.endswith(".json"):
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path: str, data: Dict[str, Any]) -> None:
+        descriptor, staging = tempfile.mkstemp(prefix=".pointer.", dir=self.cache_dir)
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(staging, path)
+        except OSError:
+            if os.path.exists(staging):
+                os.remove(staging)
+            raise
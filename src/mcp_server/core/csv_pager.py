@@ -0,0 +1,120 @@
+"""
+Page-by-page reads of a CSV file with an opaque continuation cursor.
+
+A page is read by seeking to a byte offset and consuming whole records, so the
+memory used by one call is bounded by the page limits, not by the file size.
+The cursor encodes that offset, the index of the next data row and the file
+version (size and mtime), so a stale cursor is rejected instead of returning
+rows from the middle of a record of a rewritten file.
+"""
+
+import base64
+import binascii
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.dataset_catalog import DatasetEntry
+from core.table_query import QueryError
+
+# Caps per page, whatever page_size the caller asks for
+MAX_PAGE_ROWS = 1000
+MAX_PAGE_BYTES = 1 << 20
+
+
+def _version(entry: DatasetEntry) -> str:
+    return f"{entry.size}:{entry.mtime!r}"
+
+
+def encode_cursor(offset: int, row: int, version: str) -> str:
+    payload = json.dumps({"o": offset, "r": row, "v": version}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int, str]:
+    """Return (byte offset, next row index, file version); raises QueryError for a malformed cursor."""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return int(state["o"]), int(state["r"]), str(state["v"])
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise QueryError("Invalid cursor; pass the next_cursor returned by the previous page") from None
+
+
+def _read_record(file) -> bytes:
+    """Read one CSV record, which spans several lines when a quoted field contains newlines."""
+    record = file.readline()
+    # A record is complete once its quotes balance ("" escapes count as two)
+    while record and record.count(b'"') % 2:
+        line = file.readline()
+        if not line:
+            break
+        record += line
+    return record
+
+
+def _parse(records: List[bytes]) -> List[List[str]]:
+    text = b"".join(records).decode("utf-8")
+    return [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+
+
+def _only_blank_lines_left(file) -> bool:
+    """True when the rest of the file holds no record; the file position is left unchanged."""
+    position = file.tell()
+    try:
+        for line in iter(file.readline, b""):
+            if line.strip():
+                return False
+        return True
+    finally:
+        file.seek(position)
+
+
+def read_page(
+    entry: DatasetEntry,
+    cursor: Optional[str] = None,
+    page_size: int = 200,
+    max_bytes: int = MAX_PAGE_BYTES,
+) -> Dict[str, Any]:
+    """Read the next page of rows of a CSV file; returns a compact JSON-ready result."""
+    page_size = max(1, min(int(page_size), MAX_PAGE_ROWS))
+    version = _version(entry)
+
+    with open(entry.path, "rb") as file:
+        header_record = _read_record(file)
+        header = _parse([header_record])
+        columns = [column.strip() or f"column_{i}" for i, column in enumerate(header[0] if header else [])]
+
+        if cursor:
+            offset, start_row, cursor_version = decode_cursor(cursor)
+            if cursor_version != version:
+                raise QueryError("Table changed since this cursor was issued; start again without a cursor")
+            file.seek(offset)
+        else:
+            offset, start_row = len(header_record), 0
+
+        records: List[bytes] = []
+        size = 0
+        while len(records) < page_size and size < max_bytes:
+            record = _read_record(file)
+            if not record:
+                break
+            offset += len(record)
+            if record.strip():
+                records.append(record)
+                size += len(record)
+        done = _only_blank_lines_left(file)
+
+    rows = _parse(records)
+    width = len(columns)
+    rows = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+    next_row = start_row + len(rows)
+    return {
+        "table": entry.filename[:-4],
+        "columns": columns,
+        "rows": rows,
+        "start_row": start_row,
+        "returned_rows": len(rows),
+        "total_rows": entry.row_count,
+        "next_cursor": None if done or not rows else encode_cursor(offset, next_row, version),
+    }
@@ -0,0 +1,190 @@
+"""
+In-memory index of the dataset files served by the data tools.
+"""
+
+import csv
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DatasetEntry:
+    """A dataset file known to the catalog."""
+
+    filename: str
+    path: str
+    size: int
+    mtime: float
+    row_count: int
+
+
+def count_rows(path: str) -> int:
+    """
+    Count the data records of a CSV file (records after the header).
+
+    Counted like load_csv reads them: quoted fields may span lines, and blank
+    lines are not records.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as file:
+        records = sum(1 for row in csv.reader(file) if row)
+    return max(records - 1, 0)
+
+
+class DatasetCatalog:
+    """
+    Filename -> DatasetEntry index over a dataset directory tree.
+
+    The tree is walked once when the catalog is built. Afterwards, at most once
+    per poll_interval seconds, a lookup stats the indexed directories and files:
+      - a changed directory mtime (file added, removed or renamed) triggers a re-walk
+      - a changed file size/mtime refreshes just that entry
+    Every change bumps `version`, which callers can use to invalidate derived caches.
+
+    Like the original os.walk lookup, names are matched exactly (case-sensitive) and
+    the first match in walk order wins when a name occurs in several directories.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        allowed_files: Optional[Iterable[str]] = None,
+        poll_interval: float = 5.0,
+    ):
+        self.root = root
+        self.allowed_files = set(allowed_files) if allowed_files is not None else None
+        self.poll_interval = poll_interval
+        self.version = 0
+        self._entries: Dict[str, DatasetEntry] = {}
+        self._dir_mtimes: Dict[str, float] = {}
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self.rebuild()
+
+    # ---------------- Public API ---------------- #
+
+    def get(self, filename: str) -> Optional[DatasetEntry]:
+        """Return the entry for an exact filename, or None if it is not in the tree."""
+        self._maybe_refresh()
+        return self._entries.get(filename)
+
+    def find(self, filename: str) -> Optional[str]:
+        """Return the full path for an exact filename, or None."""
+        entry = self.get(filename)
+        return entry.path if entry else None
+
+    def entries(self) -> List[DatasetEntry]:
+        """Return all indexed entries, sorted by filename."""
+        self._maybe_refresh()
+        return [self._entries[name] for name in sorted(self._entries)]
+
+    def version_nowait(self) -> int:
+        """
+        Return `version` without touching the file system.
+
+        When a poll is due it runs in a background thread, so the caller (e.g. a
+        cache lookup on the event loop) never waits for a stat pass or a re-walk;
+        changes show up in `version` at most one poll later.
+        """
+        if time.monotonic() - self._last_check >= self.poll_interval and not self._refresh_lock.locked():
+            threading.Thread(target=self._maybe_refresh, name="dataset-catalog-poll", daemon=True).start()
+        return self.version
+
+    def rebuild(self) -> None:
+        """Walk the dataset tree and rebuild the index from scratch."""
+        entries: Dict[str, DatasetEntry] = {}
+        dir_mtimes: Dict[str, float] = {}
+        for root, _, files in os.walk(self.root):
+            try:
+                dir_mtimes[root] = os.stat(root).st_mtime
+            except OSError:
+                continue
+            for filename in files:
+                if filename in entries:
+                    continue  # keep the first match in walk order
+                if self.allowed_files is not None and filename not in self.allowed_files:
+                    continue
+                entry = self._stat_entry(filename, os.path.join(root, filename))
+                if entry:
+                    entries[filename] = entry
+
+        with self._lock:
+            changed = entries != self._entries
+            self._entries = entries
+            self._dir_mtimes = dir_mtimes
+            self._last_check = time.monotonic()
+            if changed or not self.version:
+                self.version += 1
+
+        logger.info(
+            "Dataset catalog for '%s': %d files in %d directories (version %d)",
+            self.root,
+            len(entries),
+            len(dir_mtimes),
+            self.version,
+        )
+
+    # ---------------- Internal Helpers ---------------- #
+
+    def _stat_entry(self, filename: str, path: str) -> Optional[DatasetEntry]:
+        try:
+            stat = os.stat(path)
+            row_count = count_rows(path)
+        except (OSError, csv.Error) as e:
+            logger.warning("Could not index dataset file '%s': %s", path, e)
+            return None
+        return DatasetEntry(
+            filename=filename,
+            path=path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            row_count=row_count,
+        )
+
+    def _maybe_refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._last_check < self.poll_interval:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # another thread is polling; serve the current index meanwhile
+        try:
+            self._last_check = now
+            self._poll()
+        finally:
+            self._refresh_lock.release()
+
+    def _poll(self) -> None:
+        for directory, mtime in list(self._dir_mtimes.items()):
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    break
+            except OSError:
+                break
+        else:
+            self._refresh_changed_files()
+            return
+
+        logger.info("Dataset directory changed under '%s'; re-indexing", self.root)
+        self.rebuild()
+
+    def _refresh_changed_files(self) -> None:
+        for filename, entry in list(self._entries.items()):
+            try:
+                stat = os.stat(entry.path)
+            except OSError:
+                self.rebuild()
+                return
+            if stat.st_mtime != entry.mtime or stat.st_size != entry.size:
+                updated = self._stat_entry(filename, entry.path)
+                with self._lock:
+                    if updated:
+                        self._entries[filename] = updated
+                    else:
+                        self._entries.pop(filename, None)
+                    self.version += 1
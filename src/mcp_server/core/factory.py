@@ -2,11 +2,22 @@
 Core MCP server components and factory patterns.
 """
 
+import hashlib
+import inspect
+import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from enum import Enum
 from fastmcp import FastMCP
 
+from .result_cache import CachePolicy, ToolResultCache
+from .service_registry import available_services, load_service_class
+from .tool_executor import ToolExecutor, get_default_executor
+
+logger = logging.getLogger(__name__)
+
 
 class Domain(Enum):
     """Service domains for organizing MCP tools."""
@@ -19,6 +30,7 @@ class Domain(Enum):
     RETAIL = "retail"
     GENERAL = "general"
     DATA = "data"
+    WORKFLOW = "workflow"
 
 
 class MCPToolBase(ABC):
@@ -27,6 +39,45 @@ class MCPToolBase(ABC):
     def __init__(self, domain: Domain):
         self.domain = domain
         self.tools = []
+        self.executor: Optional[ToolExecutor] = None
+        self.cache_policies: Dict[str, CachePolicy] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "MCPToolBase":
+        """Create the service from server settings; services needing settings override this."""
+        return cls()
+
+    def cached(
+        self,
+        ttl: float,
+        normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        version: Optional[Callable[[], Any]] = None,
+    ) -> Callable[[Callable], Callable]:
+        """Mark a deterministic tool whose results may be reused for ttl seconds.
+
+        Use below @mcp.tool(). normalize maps bound arguments to a canonical form;
+        version returns a value that invalidates cached results when it changes.
+        The cache is applied by MCPToolFactory.create_mcp_server.
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            self.cache_policies[fn.__name__] = CachePolicy(
+                ttl=ttl, signature=inspect.signature(fn), normalize=normalize, version=version
+            )
+            return fn
+
+        return decorator
+
+    def blocking(self, max_concurrency: Optional[int] = None) -> Callable[[Callable], Callable]:
+        """Mark a synchronous tool as blocking I/O: it runs on the I/O thread pool, off the event loop.
+
+        Use below @mcp.tool(); max_concurrency caps simultaneous calls of this tool.
+        """
+        return (self.executor or get_default_executor()).offload("io", max_concurrency)
+
+    def cpu_bound(self, max_concurrency: Optional[int] = None) -> Callable[[Callable], Callable]:
+        """Mark a synchronous tool as CPU-bound: it runs on the CPU pool, off the event loop."""
+        return (self.executor or get_default_executor()).offload("cpu", max_concurrency)
 
     @abstractmethod
     def register_tools(self, mcp: FastMCP) -> None:
@@ -43,21 +94,72 @@ class MCPToolBase(ABC):
 class MCPToolFactory:
     """Factory for creating and managing MCP tools."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[ToolExecutor] = None,
+        cache_max_entries: int = 1024,
+        cache_max_bytes: int = 64 << 20,
+    ):
         self._services: Dict[Domain, MCPToolBase] = {}
         self._mcp_server: Optional[FastMCP] = None
+        self.executor = executor
+        self.cache_max_entries = cache_max_entries
+        self.cache_max_bytes = cache_max_bytes
+        self.result_cache: Optional[ToolResultCache] = None
+        # Per-service startup timings in ms: import, init and register
+        self.startup_profile: Dict[str, Dict[str, float]] = {}
+        self._catalog_version: Optional[str] = None
+
+    def load_services(self, names: List[str], config: Any = None) -> None:
+        """Import, create and register the named services (see core.service_registry)."""
+        services = available_services()
+        unknown = [name for name in names if name not in services]
+        if unknown:
+            raise ValueError(
+                f"Unknown service(s): {', '.join(unknown)}. Available: {', '.join(sorted(services))}"
+            )
+
+        for name in names:
+            started = time.perf_counter()
+            service_class = load_service_class(name, services[name])
+            imported = time.perf_counter()
+            service = service_class.from_config(config)
+            created = time.perf_counter()
+            self.register_service(service)
+            self.startup_profile[service.domain.value] = {
+                "import_ms": (imported - started) * 1e3,
+                "init_ms": (created - imported) * 1e3,
+            }
 
     def register_service(self, service: MCPToolBase) -> None:
         """Register a tool service with the factory."""
+        if service.executor is None:
+            service.executor = self.executor
         self._services[service.domain] = service
 
     def create_mcp_server(self, name: str = "MACAE MCP Server", auth=None) -> FastMCP:
         """Create and configure the MCP server with all registered services."""
         self._mcp_server = FastMCP(name, auth=auth)
+        self._catalog_version = None
 
         # Register all tools from all services
         for service in self._services.values():
+            started = time.perf_counter()
             service.register_tools(self._mcp_server)
+            profile = self.startup_profile.setdefault(service.domain.value, {})
+            profile["register_ms"] = (time.perf_counter() - started) * 1e3
+
+        # Serve repeated calls of tools marked cached() from memory (0 entries disables)
+        policies = {
+            name: policy
+            for service in self._services.values()
+            for name, policy in service.cache_policies.items()
+        }
+        if policies and self.cache_max_entries > 0:
+            self.result_cache = ToolResultCache(
+                policies, max_entries=self.cache_max_entries, max_bytes=self.cache_max_bytes
+            )
+            self._mcp_server.add_middleware(self.result_cache)
 
         return self._mcp_server
 
@@ -69,6 +171,10 @@ class MCPToolFactory:
         """Get all registered services."""
         return self._services.copy()
 
+    def get_executor_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Queue-wait and run-time counters of the tools running off the event loop."""
+        return (self.executor or get_default_executor()).metrics()
+
     def get_tool_summary(self) -> Dict[str, Any]:
         """Get a summary of all tools and services."""
         summary = {
@@ -86,3 +192,24 @@ class MCPToolFactory:
             }
 
         return summary
+
+    async def get_catalog_version(self) -> str:
+        """Hash of the tool summary and every tool's MCP schema.
+
+        It only changes when the set of tools or their schemas change (i.e. on
+        redeploy), so clients can cache what they derive from list_tools by it.
+        """
+        if self._catalog_version is None:
+            if self._mcp_server is None:
+                raise RuntimeError("create_mcp_server() must be called first")
+            tools = await self._mcp_server.get_tools()
+            catalog = {
+                "summary": self.get_tool_summary(),
+                "tools": [
+                    tools[key].to_mcp_tool(name=key).model_dump(mode="json", exclude_none=True)
+                    for key in sorted(tools)
+                ],
+            }
+            encoded = json.dumps(catalog, sort_keys=True, separators=(",", ":")).encode()
+            self._catalog_version = hashlib.sha256(encoded).hexdigest()
+        return self._catalog_version
@@ -0,0 +1,147 @@
+"""
+Opt-in result cache for deterministic MCP tools.
+
+Services mark a tool with MCPToolBase.cached(ttl=...); the factory then
+installs ToolResultCache as FastMCP middleware in front of those tools:
+  - arguments are canonicalized (bound to the tool signature with defaults
+    applied, optionally normalized by the tool, serialized with sorted keys),
+    so equivalent calls share one entry
+  - entries expire after the tool's TTL and are evicted least recently used
+    once the entry or byte budget is exceeded
+  - a tool can supply a version callable (e.g. the dataset catalog version);
+    entries stored under another version are treated as misses
+Every response of a cached tool carries its cache status in the `_meta` of
+its content blocks under CACHE_META_KEY, e.g.
+  {"status": "hit", "age_seconds": 1.2, "ttl_seconds": 300}
+"""
+
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_META_KEY = "macae/cache"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How one tool's results are cached."""
+
+    ttl: float
+    signature: Optional[inspect.Signature] = None
+    normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    version: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class _Entry:
+    result: ToolResult
+    version: Any
+    stored_at: float
+    expires_at: float
+    size: int
+
+
+def canonical_arguments(policy: CachePolicy, arguments: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Stable cache key for a call's arguments, or None if they do not fit the tool signature."""
+    arguments = dict(arguments or {})
+    if policy.signature is not None:
+        try:
+            bound = policy.signature.bind(**arguments)
+        except TypeError:
+            return None  # let the tool report the invalid call
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    if policy.normalize is not None:
+        try:
+            arguments = policy.normalize(arguments)
+        except (TypeError, ValueError, AttributeError, KeyError):
+            return None
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _result_size(result: ToolResult) -> int:
+    # Approximate: text of the content blocks, which structured content mirrors
+    return sum(len(getattr(block, "text", "") or "") for block in result.content) * 2
+
+
+def _with_meta(result: ToolResult, status: Dict[str, Any]) -> ToolResult:
+    content = [
+        block.model_copy(update={"meta": {**(block.meta or {}), CACHE_META_KEY: status}}) for block in result.content
+    ]
+    return ToolResult(content=content, structured_content=result.structured_content)
+
+
+class ToolResultCache(Middleware):
+    """Size-bounded LRU of tool results for the tools that have a CachePolicy."""
+
+    def __init__(
+        self,
+        policies: Dict[str, CachePolicy],
+        max_entries: int = 1024,
+        max_bytes: int = 64 << 20,
+    ):
+        self.policies = dict(policies)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        name = context.message.name
+        policy = self.policies.get(name)
+        if policy is None:
+            return await call_next(context)
+        arguments = canonical_arguments(policy, context.message.arguments)
+        if arguments is None:
+            return await call_next(context)
+
+        key = (name, arguments)
+        version = policy.version() if policy.version else None
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > now and entry.version == version:
+            self._entries.move_to_end(key)
+            self.hits[name] = self.hits.get(name, 0) + 1
+            age = round(now - entry.stored_at, 3)
+            return _with_meta(entry.result, {"status": "hit", "age_seconds": age, "ttl_seconds": policy.ttl})
+
+        self.misses[name] = self.misses.get(name, 0) + 1
+        result = await call_next(context)
+        self._store(key, _Entry(result, version, now, now + policy.ttl, _result_size(result)))
+        return _with_meta(result, {"status": "miss", "age_seconds": 0.0, "ttl_seconds": policy.ttl})
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _store(self, key: Tuple[str, str], entry: _Entry) -> None:
+        if entry.size > self.max_bytes:
+            logger.debug("Result of '%s' too large to cache (%d bytes)", key[0], entry.size)
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
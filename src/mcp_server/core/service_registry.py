@@ -0,0 +1,62 @@
+"""
+Discovery of MCP tool services by name, without importing them.
+
+Built-in services are listed below as "module:Class" references. Other
+packages can add (or replace) services through the
+"macae_mcp.services" entry point group, e.g. in their pyproject.toml:
+
+    [project.entry-points."macae_mcp.services"]
+    billing = "billing_tools.service:BillingService"
+
+A service module is only imported when its name is enabled, so disabled
+domains cost nothing at startup.
+"""
+
+import importlib
+import logging
+from importlib.metadata import entry_points
+from typing import Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "macae_mcp.services"
+
+BUILTIN_SERVICES: Dict[str, str] = {
+    "hr": "services.hr_service:HRService",
+    "tech_support": "services.tech_support_service:TechSupportService",
+    "marketing": "services.marketing_service:MarketingService",
+    "product": "services.product_service:ProductService",
+    "general": "services.general_service:GeneralService",
+    "data": "services.data_tool_service:DataToolService",
+    "workflow": "services.workflow_service:WorkflowService",
+}
+
+
+def available_services() -> Dict[str, str]:
+    """Service name -> "module:Class" reference, built-ins first, then entry points."""
+    services = dict(BUILTIN_SERVICES)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        services[entry_point.name] = entry_point.value
+    return services
+
+
+def parse_service_names(value: str) -> List[str]:
+    """Split a comma-separated list of service names, dropping blanks and duplicates."""
+    names: List[str] = []
+    for name in value.split(","):
+        name = name.strip().lower()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def load_service_class(name: str, reference: str) -> Type:
+    """Import the module of a "module:Class" reference and return the class."""
+    module_name, _, attribute = reference.partition(":")
+    if not attribute:
+        raise ValueError(f"Service '{name}' must be referenced as 'module:Class', got '{reference}'")
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ValueError(f"Service '{name}': module '{module_name}' has no '{attribute}'") from None
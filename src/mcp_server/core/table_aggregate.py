@@ -0,0 +1,253 @@
+"""
+Vectorized group-by aggregation over columnar tables.
+
+Rows are mapped to dense group ids once (np.unique over a mixed-radix key built
+from the group columns). Each metric is then a single bincount or one sort of
+(group, value) pairs, however many groups there are.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.table_query import QueryError, filter_rows
+from core.table_store import Column, Table
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max", "median", "percentile")
+
+# Hard cap on groups returned by one call, whatever limit the caller asks for
+MAX_GROUPS = 1000
+
+_METRIC_RE = re.compile(r"^\s*(?P<op>[a-z]+|p\d{1,2}(?:\.\d+)?)\s*(?:\(\s*(?P<column>[^)]*?)\s*\))?\s*$", re.IGNORECASE)
+
+
+def parse_metric(spec: Any) -> Tuple[str, Optional[str], Optional[float], str]:
+    """
+    Normalize a metric spec to (op, column, q, label).
+
+    Accepts strings such as "count", "mean(ChurnRate)", "p90(Spend)", or dicts
+    such as {"op": "percentile", "column": "Spend", "q": 90}.
+    """
+    if isinstance(spec, dict):
+        op = str(spec.get("op", "")).lower()
+        column = spec.get("column")
+        q = spec.get("q")
+    else:
+        match = _METRIC_RE.match(str(spec))
+        if not match:
+            raise QueryError(f"Cannot parse metric '{spec}'. Use e.g. 'count', 'mean(Column)' or 'p90(Column)'")
+        op = match.group("op").lower()
+        column = match.group("column") or None
+        q = None
+    # The label keeps the name the caller used, so "median(X)" can be sorted by as written
+    name = op
+
+    if op.startswith("p") and op[1:].replace(".", "", 1).isdigit():
+        op, q = "percentile", float(op[1:])
+    if op == "median":
+        op, q = "percentile", 50.0
+    if op not in AGGREGATIONS:
+        raise QueryError(f"Unsupported aggregation '{op}'. Use one of: {', '.join(AGGREGATIONS)}, pNN")
+    if op != "count" and not column:
+        raise QueryError(f"Aggregation '{op}' needs a column")
+    if op == "percentile":
+        if q is None or not 0 <= float(q) <= 100:
+            raise QueryError("Percentile needs q between 0 and 100")
+        q = float(q)
+
+    if name == "percentile":
+        label = f"p{q:g}({column})"
+    else:
+        label = f"{name}({column})" if column else "count"
+    return op, column, q, label
+
+
+def _group_codes(column: Column, indices: np.ndarray) -> Tuple[np.ndarray, List[Any]]:
+    """Dense codes for a group column over the selected rows; nulls form their own group."""
+    nulls = column.nulls[indices]
+    if column.kind == "str":
+        raw = column.values[indices].astype(np.int64)
+        labels: List[Any] = column.categories.tolist()
+    else:
+        unique, inverse = np.unique(column.values[indices][~nulls], return_inverse=True)
+        raw = np.zeros(len(indices), dtype=np.int64)
+        raw[~nulls] = inverse
+        labels = unique.tolist()
+    codes = np.where(nulls, len(labels), raw)
+    return codes, labels + [None]
+
+
+def _group_ids(table: Table, group_by: Sequence[str], indices: np.ndarray):
+    """
+    Map each selected row to a group id.
+
+    Returns (ids, number of groups, per-column key codes per group, per-column key labels).
+    Group ids are ordered by the key columns; a column's null key has its largest code.
+    """
+    if not group_by:
+        n_groups = 1 if len(indices) else 0
+        return np.zeros(len(indices), dtype=np.int64), n_groups, [], []
+
+    per_column = [_group_codes(table.column(name), indices) for name in group_by]
+    radices = [len(labels) for _, labels in per_column]
+
+    key_space = np.prod([float(r) for r in radices])
+    if key_space < 2 ** 62:
+        key = np.zeros(len(indices), dtype=np.int64)
+        for (codes, _), radix in zip(per_column, radices):
+            key = key * radix + codes
+        if key_space <= max(4 * len(indices), 1 << 16):
+            # Small key space: densify with a counting pass instead of sorting
+            present = np.bincount(key, minlength=int(key_space)) > 0
+            unique_keys = np.flatnonzero(present)
+            ids = (np.cumsum(present) - 1)[key]
+        else:
+            unique_keys, ids = np.unique(key, return_inverse=True)
+        # Decode the mixed-radix keys back into per-column codes
+        decoded = []
+        remaining = unique_keys
+        for radix in reversed(radices):
+            decoded.append(remaining % radix)
+            remaining = remaining // radix
+        decoded.reverse()
+    else:
+        stacked = np.stack([codes for codes, _ in per_column], axis=1)
+        unique_rows, ids = np.unique(stacked, axis=0, return_inverse=True)
+        decoded = [unique_rows[:, i] for i in range(len(per_column))]
+
+    ids = ids.reshape(-1)
+    n_groups = len(decoded[0])
+    return ids, n_groups, decoded, [labels for _, labels in per_column]
+
+
+def _metric_values(
+    op: str,
+    column: Optional[Column],
+    q: Optional[float],
+    indices: np.ndarray,
+    ids: np.ndarray,
+    n_groups: int,
+    sorted_cache: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+) -> np.ndarray:
+    """One value per group as float64, NaN where the group has no non-null values."""
+    if column is None:  # count(*)
+        return np.bincount(ids, minlength=n_groups).astype(np.float64)
+
+    valid = ~column.nulls[indices]
+    if op == "count":
+        return np.bincount(ids[valid], minlength=n_groups).astype(np.float64)
+    if not column.is_numeric:
+        raise QueryError(f"Aggregation '{op}' needs a numeric column; '{column.name}' is text")
+
+    group = ids[valid]
+    values = column.values[indices][valid].astype(np.float64)
+    counts = np.bincount(group, minlength=n_groups)
+    result = np.full(n_groups, np.nan)
+    has_values = counts > 0
+
+    if op in ("sum", "mean"):
+        sums = np.bincount(group, weights=values, minlength=n_groups)
+        if op == "sum":
+            result[has_values] = sums[has_values]
+        else:
+            result[has_values] = sums[has_values] / counts[has_values]
+        return result
+
+    # min / max / percentile: one sort by (group, value), shared by all such metrics on this column
+    if column.name not in sorted_cache:
+        # Sort values, then stable-sort by group; small-int group keys use radix sort
+        by_value = np.argsort(values)
+        group_dtype = np.int16 if n_groups < 2 ** 15 else np.int32 if n_groups < 2 ** 31 else np.int64
+        order = by_value[np.argsort(group[by_value].astype(group_dtype), kind="stable")]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sorted_cache[column.name] = (values[order], starts, counts)
+    sorted_values, starts, counts = sorted_cache[column.name]
+
+    if op == "min":
+        result[has_values] = sorted_values[starts[has_values]]
+    elif op == "max":
+        result[has_values] = sorted_values[starts[has_values] + counts[has_values] - 1]
+    else:
+        # Linear interpolation between closest ranks, as numpy.percentile does by default
+        position = starts[has_values] + (q / 100.0) * (counts[has_values] - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        result[has_values] = sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+    return result
+
+
+def _to_cell(value: float, op: str, column: Optional[Column]) -> Any:
+    if np.isnan(value):
+        return None
+    if op == "count" or (column is not None and column.kind == "int" and op in ("sum", "min", "max")):
+        return int(value)
+    return round(float(value), 6)
+
+
+def run_aggregate(
+    table: Table,
+    group_by: Optional[Sequence[str]] = None,
+    metrics: Optional[Sequence[Any]] = None,
+    filters: Optional[Sequence[Dict[str, Any]]] = None,
+    sort_by: Optional[Sequence[str]] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    """Group, aggregate, sort and trim; returns a compact JSON-ready result."""
+    group_by = list(group_by or [])
+    parsed = [parse_metric(spec) for spec in (metrics or ["count"])]
+    limit = max(0, min(int(limit), MAX_GROUPS))
+    try:
+        group_columns = [table.column(name) for name in group_by]
+        metric_columns = [table.column(column) if column else None for _, column, _, _ in parsed]
+    except KeyError as e:
+        raise QueryError(str(e.args[0])) from None
+
+    indices = filter_rows(table, filters)
+    ids, n_groups, key_codes, key_labels = _group_ids(table, group_by, indices)
+
+    sorted_cache: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    metric_arrays = [
+        _metric_values(op, column, q, indices, ids, n_groups, sorted_cache)
+        for (op, _, q, _), column in zip(parsed, metric_columns)
+    ]
+
+    output_columns = [column.name for column in group_columns] + [label for _, _, _, label in parsed]
+    order = np.arange(n_groups)
+    if sort_by:
+        keys: List[np.ndarray] = []
+        for spec in reversed(list(sort_by)):
+            descending = spec.startswith("-")
+            name = spec[1:] if descending else spec
+            if name in output_columns[len(group_columns):]:
+                values = metric_arrays[output_columns.index(name) - len(group_columns)]
+                nulls = np.isnan(values)
+            elif name in output_columns[: len(group_columns)]:
+                # Key codes order like the key values; the largest code is the null key
+                position = output_columns.index(name)
+                values = key_codes[position].astype(np.float64)
+                nulls = key_codes[position] == len(key_labels[position]) - 1
+            else:
+                raise QueryError(f"Cannot sort by '{name}'. Sort by one of: {', '.join(output_columns)}")
+            keys.extend([-values if descending else values, nulls])
+        order = np.lexsort(keys)
+
+    page = order[:limit]
+    rows = []
+    for group in page.tolist():
+        row = [labels[codes[group]] for codes, labels in zip(key_codes, key_labels)]
+        for (op, _, _, _), column, values in zip(parsed, metric_columns, metric_arrays):
+            row.append(_to_cell(values[group], op, column))
+        rows.append(row)
+
+    return {
+        "table": table.name,
+        "group_by": [column.name for column in group_columns],
+        "columns": output_columns,
+        "rows": rows,
+        "matched_rows": len(indices),
+        "groups": n_groups,
+        "returned_groups": len(rows),
+        "truncated": len(rows) < n_groups,
+    }
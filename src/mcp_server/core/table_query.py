@@ -0,0 +1,160 @@
+"""
+Vectorized query operations over columnar tables: projection, filtering,
+sorting and paging.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.table_store import Column, Table
+
+COMPARISON_OPS = ("==", "!=", "<", "<=", ">", ">=")
+SUPPORTED_OPS = COMPARISON_OPS + ("in", "not_in", "contains", "is_null", "not_null")
+
+# Hard cap on rows returned by one query, whatever limit the caller asks for
+MAX_QUERY_ROWS = 500
+
+
+class QueryError(ValueError):
+    """Raised for invalid query parameters (unknown column, bad operator, ...)."""
+
+
+def _compare(left: np.ndarray, op: str, right: Any) -> np.ndarray:
+    if op == "==":
+        return left == right
+    if op == "!=":
+        return left != right
+    if op == "<":
+        return left < right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left >= right
+
+
+def _coerce_number(column: Column, value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise QueryError(f"Column '{column.name}' is numeric; '{value}' is not a number") from None
+
+
+def predicate_mask(column: Column, op: str, value: Any = None) -> np.ndarray:
+    """Boolean row mask for a single predicate. Null cells never match, except for is_null."""
+    if op not in SUPPORTED_OPS:
+        raise QueryError(f"Unsupported operator '{op}'. Use one of: {', '.join(SUPPORTED_OPS)}")
+    if op == "is_null":
+        return column.nulls.copy()
+    if op == "not_null":
+        return ~column.nulls
+
+    if column.kind == "str":
+        # Evaluate the predicate once per distinct value, then expand through the codes
+        categories = column.categories
+        if not len(categories):
+            return np.zeros(len(column.values), dtype=bool)
+        if op in ("in", "not_in"):
+            wanted = {str(item) for item in (value if isinstance(value, (list, tuple, set)) else [value])}
+            category_mask = np.fromiter((category in wanted for category in categories), bool, len(categories))
+            if op == "not_in":
+                category_mask = ~category_mask
+        elif op == "contains":
+            needle = str(value).lower()
+            category_mask = np.fromiter(
+                (needle in category.lower() for category in categories), bool, len(categories)
+            )
+        else:
+            category_mask = _compare(categories, op, str(value))
+        return category_mask[np.where(column.nulls, 0, column.values)] & ~column.nulls
+
+    if op == "contains":
+        raise QueryError(f"Operator 'contains' needs a text column; '{column.name}' is numeric")
+    if op in ("in", "not_in"):
+        items = value if isinstance(value, (list, tuple, set)) else [value]
+        wanted = np.array([_coerce_number(column, item) for item in items], dtype=np.float64)
+        mask = np.isin(column.values, wanted)
+        if op == "not_in":
+            mask = ~mask
+    else:
+        mask = _compare(column.values, op, _coerce_number(column, value))
+    return mask & ~column.nulls
+
+
+def filter_rows(table: Table, filters: Optional[Sequence[Dict[str, Any]]]) -> np.ndarray:
+    """Indices of the rows matching all filters (AND)."""
+    mask = np.ones(table.num_rows, dtype=bool)
+    for predicate in filters or []:
+        if not isinstance(predicate, dict) or "column" not in predicate:
+            raise QueryError("Each filter must be an object with 'column', 'op' and optionally 'value'")
+        column = _column(table, predicate["column"])
+        mask &= predicate_mask(column, predicate.get("op", "=="), predicate.get("value"))
+    return np.flatnonzero(mask)
+
+
+def sort_keys(column: Column, indices: np.ndarray, descending: bool) -> List[np.ndarray]:
+    """np.lexsort keys (least significant first) ordering a column, nulls last."""
+    nulls = column.nulls[indices]
+    if column.kind == "str":
+        # Categories are sorted, so codes already order like the strings they encode
+        values = column.values[indices].astype(np.int64)
+    else:
+        values = column.values[indices]
+    if descending:
+        values = -values
+    return [values, nulls]
+
+
+def sort_rows(table: Table, indices: np.ndarray, sort_by: Optional[Sequence[str]]) -> np.ndarray:
+    """Stable multi-column sort. Prefix a column with '-' for descending order."""
+    if not sort_by:
+        return indices
+    keys: List[np.ndarray] = []
+    for spec in reversed(list(sort_by)):
+        descending = spec.startswith("-")
+        column = _column(table, spec[1:] if descending else spec)
+        keys.extend(sort_keys(column, indices, descending))
+    return indices[np.lexsort(keys)]
+
+
+def run_query(
+    table: Table,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Dict[str, Any]]] = None,
+    sort_by: Optional[Sequence[str]] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Project, filter, sort and page a table; returns a compact JSON-ready result."""
+    selected = [_column(table, name) for name in columns] if columns else [table.columns[name] for name in table.column_order]
+    limit = max(0, min(int(limit), MAX_QUERY_ROWS))
+    offset = max(0, int(offset))
+
+    indices = filter_rows(table, filters)
+    matched = len(indices)
+    indices = sort_rows(table, indices, sort_by)
+    page = indices[offset : offset + limit]
+
+    cells = [column.to_python(page) for column in selected]
+    rows = [list(row) for row in zip(*cells)] if cells else []
+    next_offset = offset + len(page)
+
+    return {
+        "table": table.name,
+        "columns": [column.name for column in selected],
+        "rows": rows,
+        "total_rows": table.num_rows,
+        "matched_rows": matched,
+        "returned_rows": len(rows),
+        "offset": offset,
+        "truncated": next_offset < matched,
+        "next_offset": next_offset if next_offset < matched else None,
+    }
+
+
+def _column(table: Table, name: str) -> Column:
+    try:
+        return table.column(str(name))
+    except KeyError as e:
+        raise QueryError(str(e.args[0])) from None
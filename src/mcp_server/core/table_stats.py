@@ -0,0 +1,63 @@
+"""
+Per-column summary statistics of a columnar table, for describe_table.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+from core.sketches import hll_estimate
+from core.table_store import Column, Table
+
+# Sample rows kept with the statistics; describe_table returns at most this many
+MAX_SAMPLE_ROWS = 20
+
+# Numeric columns up to this many values get an exact distinct count; larger ones use HyperLogLog
+EXACT_DISTINCT_MAX = 1 << 16
+
+
+def _column_stats(column: Column) -> Dict[str, Any]:
+    present = ~column.nulls
+    non_null = int(np.count_nonzero(present))
+    stats: Dict[str, Any] = {
+        "name": column.name,
+        "type": column.kind,
+        "nulls": len(column.nulls) - non_null,
+        "distinct": 0,
+        "distinct_estimated": False,
+        "min": None,
+        "max": None,
+    }
+    if not non_null:
+        return stats
+
+    if column.kind == "str":
+        # Categories are exactly the distinct non-null values, sorted
+        stats["distinct"] = len(column.categories)
+        stats["min"] = str(column.categories[0])
+        stats["max"] = str(column.categories[-1])
+        return stats
+
+    values = column.values[present]
+    if non_null <= EXACT_DISTINCT_MAX:
+        stats["distinct"] = len(np.unique(values))
+    else:
+        stats["distinct"] = min(hll_estimate(values), non_null)
+        stats["distinct_estimated"] = True
+    stats["min"] = values.min().item()
+    stats["max"] = values.max().item()
+    return stats
+
+
+def describe(table: Table) -> Dict[str, Any]:
+    """Column names, types, null and distinct counts, min/max and the first rows of a table."""
+    columns = [table.columns[name] for name in table.column_order]
+    sample = np.arange(min(table.num_rows, MAX_SAMPLE_ROWS))
+    cells = [column.to_python(sample) for column in columns]
+    sample_rows: List[List[Any]] = [list(row) for row in zip(*cells)] if cells else []
+    return {
+        "table": table.name,
+        "num_rows": table.num_rows,
+        "columns": [_column_stats(column) for column in columns],
+        "sample_rows": sample_rows,
+    }
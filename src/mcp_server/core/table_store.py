@@ -0,0 +1,172 @@
+"""
+Columnar, in-memory representation of the CSV dataset tables.
+
+Each column is held as a NumPy array so filters, sorts and aggregations run as
+vectorized operations instead of Python loops over rows:
+  - "int" / "float" columns: int64 / float64 values plus a boolean null mask
+  - "str" columns: dictionary encoded, int32 codes into a sorted array of
+    distinct values, with code -1 for nulls
+Empty cells are treated as nulls.
+"""
+
+import csv
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.dataset_catalog import DatasetCatalog, DatasetEntry
+
+if TYPE_CHECKING:
+    from core.column_cache import ColumnCache
+
+logger = logging.getLogger(__name__)
+
+NULL_CODE = -1
+
+
+@dataclass
+class Column:
+    """A single typed column."""
+
+    name: str
+    kind: str  # "int", "float" or "str"
+    values: np.ndarray  # numeric values, or int32 codes for "str" columns
+    nulls: np.ndarray  # boolean mask, True where the cell is empty
+    categories: Optional[np.ndarray] = None  # sorted distinct values of a "str" column
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.kind in ("int", "float")
+
+    def to_python(self, indices: np.ndarray) -> List[Any]:
+        """Return the cells at the given row indices as plain Python values."""
+        nulls = self.nulls[indices]
+        if self.kind == "str":
+            codes = self.values[indices]
+            cells = self.categories[np.where(nulls, 0, codes)].tolist() if len(self.categories) else [None] * len(codes)
+        else:
+            cells = self.values[indices].tolist()
+        return [None if is_null else cell for cell, is_null in zip(cells, nulls.tolist())]
+
+
+@dataclass
+class Table:
+    """A dataset table held column by column."""
+
+    name: str
+    columns: Dict[str, Column]
+    num_rows: int
+    source_mtime: float = 0.0
+    source_size: int = 0
+    column_order: List[str] = field(default_factory=list)
+
+    def column(self, name: str) -> Column:
+        """Return a column by exact name, falling back to a case-insensitive match."""
+        column = self.columns.get(name)
+        if column is not None:
+            return column
+        lowered = name.lower()
+        for candidate_name, candidate in self.columns.items():
+            if candidate_name.lower() == lowered:
+                return candidate
+        raise KeyError(f"Unknown column '{name}'. Available columns: {', '.join(self.column_order)}")
+
+
+def _build_column(name: str, cells: List[str]) -> Column:
+    """Infer the narrowest type for a column of raw CSV cells and encode it."""
+    raw = np.array(cells, dtype=object)
+    stripped = np.array([cell.strip() for cell in cells], dtype=object)
+    nulls = stripped == ""
+
+    present = stripped[~nulls]
+    for kind, dtype in (("int", np.int64), ("float", np.float64)):
+        try:
+            converted = present.astype(dtype)
+        except (ValueError, OverflowError):
+            continue
+        values = np.zeros(len(cells), dtype=dtype)
+        values[~nulls] = converted
+        return Column(name=name, kind=kind, values=values, nulls=nulls)
+
+    categories, codes = np.unique(raw[~nulls].astype(str), return_inverse=True)
+    values = np.full(len(cells), NULL_CODE, dtype=np.int32)
+    values[~nulls] = codes.astype(np.int32)
+    return Column(name=name, kind="str", values=values, nulls=nulls, categories=categories)
+
+
+def load_csv(path: str, name: str = "") -> Table:
+    """Parse a CSV file (first row = header) into a columnar Table."""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        header = [column.strip() or f"column_{i}" for i, column in enumerate(header)]
+        cells: List[List[str]] = [[] for _ in header]
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < len(header):
+                row = row + [""] * (len(header) - len(row))
+            for column_cells, cell in zip(cells, row):
+                column_cells.append(cell)
+
+    columns = {column: _build_column(column, column_cells) for column, column_cells in zip(header, cells)}
+    num_rows = len(cells[0]) if cells else 0
+    return Table(name=name or path, columns=columns, num_rows=num_rows, column_order=list(header))
+
+
+class TableStore:
+    """
+    Lazily loads dataset tables into columnar form and keeps them in memory.
+
+    A table is (re)loaded on first access and whenever the catalog reports a
+    different size or mtime for its file. With a ColumnCache, tables are
+    memory-mapped from their converted copies instead of parsed from CSV.
+    """
+
+    def __init__(self, catalog: DatasetCatalog, cache: Optional["ColumnCache"] = None):
+        self.catalog = catalog
+        self.cache = cache
+        self._tables: Dict[str, Tuple[Tuple[float, int], Table]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> Optional[Table]:
+        """Return the table for a dataset filename, or None if the file is not in the catalog."""
+        entry = self.catalog.get(filename)
+        if entry is None:
+            return None
+
+        key = (entry.mtime, entry.size)
+        with self._lock:
+            cached = self._tables.get(filename)
+            if cached and cached[0] == key:
+                return cached[1]
+
+            table = self._load(entry)
+            self._tables[filename] = (key, table)
+            return table
+
+    def warm(self) -> int:
+        """Load every table in the catalog up front; returns the number loaded."""
+        loaded = 0
+        for entry in self.catalog.entries():
+            try:
+                self.get(entry.filename)
+                loaded += 1
+            except (OSError, ValueError) as e:
+                logger.warning("Could not preload table '%s': %s", entry.filename, e)
+        return loaded
+
+    def _load(self, entry: DatasetEntry) -> Table:
+        if self.cache is not None:
+            try:
+                return self.cache.load(entry)
+            except OSError as e:
+                logger.warning("Columnar cache unavailable for '%s', parsing CSV: %s", entry.filename, e)
+        logger.info("Loading table '%s' into columnar form", entry.filename)
+        table = load_csv(entry.path, name=entry.filename[:-4])
+        table.source_mtime = entry.mtime
+        table.source_size = entry.size
+        return table
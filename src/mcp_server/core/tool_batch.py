@@ -0,0 +1,101 @@
+"""
+Batched tool invocation over plain HTTP.
+
+POST <mcp path>/tools/batch with
+
+    {"calls": [{"tool": "assign_mentor", "arguments": {"employee_name": "Ann"}}, ...]}
+
+runs the calls concurrently and answers with one result per call, in
+request order:
+
+    {"results": [{"tool": "assign_mentor", "content": [...], "structured_content": {...}},
+                 {"tool": "nope", "error": "Unknown tool: nope"}]}
+
+A failing call only fails its own entry. Calls go through the server's
+middleware, so cached() tools are served from the result cache as usual.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Any, Dict, List, Tuple
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import CallToolRequestParams
+
+logger = logging.getLogger(__name__)
+
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+def parse_batch(body: Any, max_calls: int) -> List[ToolCall]:
+    """Validate a batch request body; raises ValueError with a client-facing message."""
+    if not isinstance(body, dict) or not isinstance(body.get("calls"), list):
+        raise ValueError('Body must be a JSON object with a "calls" list')
+    calls = body["calls"]
+    if not calls:
+        raise ValueError("No calls given")
+    if len(calls) > max_calls:
+        raise ValueError(f"At most {max_calls} calls per batch, got {len(calls)}")
+
+    parsed = []
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+            raise ValueError(f'Call {index} must be an object with a "tool" name')
+        arguments = call.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError(f'Call {index}: "arguments" must be an object')
+        parsed.append((call["tool"], arguments))
+    return parsed
+
+
+async def _run_tool(mcp: FastMCP, tool: str, arguments: Dict[str, Any]) -> ToolResult:
+    """Run a tool the way a tools/call request does: through the server's middleware, then Tool.run."""
+
+    async def run(context: MiddlewareContext) -> ToolResult:
+        found = await mcp.get_tool(context.message.name)
+        if not found.enabled:
+            raise NotFoundError(f"Unknown tool: {context.message.name}")
+        return await found.run(context.message.arguments or {})
+
+    chain = run
+    for middleware in reversed(mcp.middleware):
+        chain = partial(middleware, call_next=chain)
+    async with Context(fastmcp=mcp) as fastmcp_context:
+        return await chain(
+            MiddlewareContext(
+                message=CallToolRequestParams(name=tool, arguments=arguments),
+                source="client",
+                type="request",
+                method="tools/call",
+                fastmcp_context=fastmcp_context,
+            )
+        )
+
+
+async def call_tool(mcp: FastMCP, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Call one tool through the server's middleware; errors are returned, not raised."""
+    try:
+        result = await _run_tool(mcp, tool, arguments)
+    except Exception as e:
+        logger.debug("Call of %s failed: %s", tool, e)
+        return {"tool": tool, "error": str(e) or type(e).__name__}
+    return {
+        "tool": tool,
+        "content": [block.model_dump(mode="json", exclude_none=True) for block in result.content],
+        "structured_content": result.structured_content,
+    }
+
+
+async def run_batch(mcp: FastMCP, calls: List[ToolCall], max_concurrency: int = 16) -> List[Dict[str, Any]]:
+    """Run independent tool calls concurrently; results come back in call order."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bounded(tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await call_tool(mcp, tool, arguments)
+
+    return list(await asyncio.gather(*(bounded(tool, arguments) for tool, arguments in calls)))
@@ -0,0 +1,170 @@
+"""
+Off-loop execution of blocking and CPU-bound MCP tools.
+
+FastMCP calls synchronous tool functions directly on the event loop, so one
+slow file read or aggregation stalls every other request on the server.
+Tools marked through MCPToolBase.blocking() / MCPToolBase.cpu_bound() are
+instead awaited on a pool:
+  - "io" tools (file and network I/O) run on a thread pool
+  - "cpu" tools run on a separate thread pool sized to the CPU count, so they
+    never hold up the I/O workers
+Each tool can also cap how many of its calls run at once; extra calls wait
+without occupying a pool worker. Time spent waiting (for the tool's limit and
+for a free worker) is recorded per tool, see ToolExecutor.metrics().
+Unmarked tools, including all async tools, keep running on the loop.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+POOL_KINDS = ("io", "cpu")
+
+
+@dataclass
+class ToolMetrics:
+    """Counters for one off-loaded tool. Times are in milliseconds."""
+
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0  # waiting for a slot or running
+    queue_wait_total_ms: float = 0.0
+    queue_wait_max_ms: float = 0.0
+    run_total_ms: float = 0.0
+
+
+def _timed_call(fn: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[float, Any]:
+    # Runs in the worker thread
+    started = time.monotonic()
+    return started, fn(*args, **kwargs)
+
+
+class ToolExecutor:
+    """Thread pools plus per-tool concurrency limits and queue-wait metrics."""
+
+    def __init__(
+        self,
+        io_workers: int = 8,
+        cpu_workers: Optional[int] = None,
+        slow_wait_seconds: float = 1.0,
+    ):
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.slow_wait_seconds = slow_wait_seconds
+        self._pools: Dict[str, Executor] = {}
+        self._metrics: Dict[str, ToolMetrics] = {}
+        self._lock = threading.Lock()
+
+    # ---------------- Public API ---------------- #
+
+    def offload(self, kind: str = "io", max_concurrency: Optional[int] = None) -> Callable[[Callable], Callable]:
+        """
+        Decorator turning a synchronous tool function into a coroutine function
+        that runs it on the `kind` pool. Apply it below @mcp.tool() so the tool
+        keeps the function's name, docstring and signature.
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(f"kind must be one of {POOL_KINDS}, got '{kind}'")
+
+        def decorator(fn: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(fn):
+                return fn  # already cooperative, stays on the loop
+
+            name = fn.__name__
+            metrics = self._tool_metrics(name)
+            # asyncio primitives belong to one loop, so keep one semaphore per loop
+            limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+                weakref.WeakKeyDictionary()
+            )
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                loop = asyncio.get_running_loop()
+                limit = None
+                if max_concurrency:
+                    limit = limits.get(loop)
+                    if limit is None:
+                        limit = limits[loop] = asyncio.Semaphore(max_concurrency)
+
+                submitted = time.monotonic()
+                metrics.in_flight += 1
+                try:
+                    if limit is not None:
+                        await limit.acquire()
+                    try:
+                        started, result = await loop.run_in_executor(
+                            self._pool(kind), _timed_call, fn, args, kwargs
+                        )
+                    finally:
+                        if limit is not None:
+                            limit.release()
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    metrics.in_flight -= 1
+                    metrics.calls += 1
+
+                finished = time.monotonic()
+                self._record(name, metrics, started - submitted, finished - started)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the per-tool counters."""
+        return {name: asdict(metrics) for name, metrics in self._metrics.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait)
+
+    # ---------------- Internal Helpers ---------------- #
+
+    def _tool_metrics(self, name: str) -> ToolMetrics:
+        with self._lock:
+            return self._metrics.setdefault(name, ToolMetrics())
+
+    def _pool(self, kind: str) -> Executor:
+        pool = self._pools.get(kind)
+        if pool is not None:
+            return pool
+        with self._lock:
+            if kind not in self._pools:
+                if kind == "io":
+                    self._pools[kind] = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="mcp-io")
+                else:
+                    self._pools[kind] = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="mcp-cpu")
+            return self._pools[kind]
+
+    def _record(self, name: str, metrics: ToolMetrics, wait: float, run: float) -> None:
+        # Only the event loop thread updates these counters
+        metrics.queue_wait_total_ms += wait * 1e3
+        metrics.queue_wait_max_ms = max(metrics.queue_wait_max_ms, wait * 1e3)
+        metrics.run_total_ms += run * 1e3
+        if wait >= self.slow_wait_seconds:
+            logger.warning("Tool '%s' waited %.2fs for a worker", name, wait)
+
+
+_default_executor: Optional[ToolExecutor] = None
+
+
+def get_default_executor() -> ToolExecutor:
+    """Shared executor for services that were not given one by the factory."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ToolExecutor()
+    return _default_executor
@@ -0,0 +1,105 @@
+"""
+Per-worker health reporting for the multi-worker HTTP mode.
+
+Each worker process writes a small JSON heartbeat into a shared state
+directory every `interval` seconds. Any worker can then answer /health for
+the whole group by reading the directory, whichever worker the load
+balancer picked. Heartbeats of exited processes or older than a few
+intervals are skipped and removed.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkerHeartbeat:
+    """Background thread publishing this process's health snapshot to state_dir."""
+
+    def __init__(self, state_dir: str, snapshot: Callable[[], Dict[str, Any]], interval: float = 5.0):
+        self.state_dir = state_dir
+        self.snapshot = snapshot
+        self.interval = interval
+        self.pid = os.getpid()
+        self.started_at = time.time()
+        self.path = os.path.join(state_dir, f"worker-{self.pid}.json")
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="mcp-heartbeat", daemon=True)
+        os.makedirs(state_dir, exist_ok=True)
+
+    def start(self) -> None:
+        self.write()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def write(self) -> None:
+        now = time.time()
+        state = {
+            "pid": self.pid,
+            "started_at": self.started_at,
+            "updated_at": now,
+            "uptime_seconds": round(now - self.started_at, 1),
+            **self.snapshot(),
+        }
+        descriptor, staging = tempfile.mkstemp(prefix=".heartbeat.", dir=self.state_dir)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(state, file, default=str)
+        os.replace(staging, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except Exception as e:  # keep beating; a missed write only makes this worker look stale
+                logger.warning("Could not write worker heartbeat: %s", e)
+
+
+def read_workers(state_dir: str, max_age: float) -> List[Dict[str, Any]]:
+    """Heartbeats of live workers, oldest worker first; stale ones are removed."""
+    workers = []
+    now = time.time()
+    try:
+        names = os.listdir(state_dir)
+    except OSError:
+        return []
+    for name in names:
+        if not (name.startswith("worker-") and name.endswith(".json")):
+            continue
+        path = os.path.join(state_dir, name)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            continue
+        if now - state.get("updated_at", 0) > max_age or not _pid_alive(int(state.get("pid", 0))):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        workers.append(state)
+    return sorted(workers, key=lambda state: state["started_at"])
@@ -0,0 +1,163 @@
+"""
+Dependency-aware execution of tool blueprints.
+
+A blueprint is a flat list of steps such as the one returned by
+employee_onboarding_blueprint_flat:
+
+    {"id": "orientation", "domain": "HR", "tool": "schedule_orientation_session",
+     "required": True, "depends_on": ["bg_check"]}
+
+Every step starts as soon as the steps it depends on have succeeded, so
+independent steps run concurrently, capped per domain. Each step's arguments
+are the workflow parameters that its tool accepts, overlaid with that step's
+own parameters. A step whose dependency failed or was skipped is skipped.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from fastmcp import FastMCP
+
+from core.tool_batch import call_tool
+
+WORKFLOW_TOOL = "run_workflow"
+
+
+def validate_steps(steps: Any) -> List[Dict[str, Any]]:
+    """Check ids, tools and dependency edges; raises ValueError, e.g. on a cycle."""
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("The blueprint has no steps")
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict) or not isinstance(step.get("id"), str) or not isinstance(step.get("tool"), str):
+            raise ValueError(f'Step {index} must be an object with an "id" and a "tool"')
+        if step["id"] in by_id:
+            raise ValueError(f"Duplicate step id '{step['id']}'")
+        if step["tool"] == WORKFLOW_TOOL:
+            raise ValueError(f"Step '{step['id']}' cannot run a workflow itself")
+        by_id[step["id"]] = step
+    for step in steps:
+        for dependency in step.get("depends_on") or []:
+            if dependency not in by_id:
+                raise ValueError(f"Step '{step['id']}' depends on unknown step '{dependency}'")
+
+    # Kahn's algorithm; whatever cannot be ordered sits on a cycle
+    remaining = {step_id: len(set(step.get("depends_on") or [])) for step_id, step in by_id.items()}
+    dependents: Dict[str, List[str]] = {step_id: [] for step_id in by_id}
+    for step in steps:
+        for dependency in set(step.get("depends_on") or []):
+            dependents[dependency].append(step["id"])
+    ready = [step_id for step_id, count in remaining.items() if count == 0]
+    ordered = 0
+    while ready:
+        step_id = ready.pop()
+        ordered += 1
+        for dependent in dependents[step_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if ordered < len(steps):
+        cycle = sorted(step_id for step_id, count in remaining.items() if count > 0)
+        raise ValueError(f"Dependency cycle between steps: {', '.join(cycle)}")
+    return steps
+
+
+def _result_text(call: Dict[str, Any]) -> str:
+    return "\n".join(block.get("text", "") for block in call.get("content", []) if block.get("type") == "text")
+
+
+class WorkflowRunner:
+    """Runs validated blueprint steps against the tools of one FastMCP server."""
+
+    def __init__(self, mcp: FastMCP, domain_concurrency: Mapping[str, int], default_concurrency: int = 4):
+        self.mcp = mcp
+        self.domain_concurrency = {domain.lower(): limit for domain, limit in domain_concurrency.items()}
+        self.default_concurrency = default_concurrency
+
+    async def _tool_arguments(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            tool = await self.mcp.get_tool(tool_name)
+        except Exception:
+            return dict(parameters)  # unknown tool: let the call report it
+        accepted = tool.parameters.get("properties", {})
+        arguments = {name: value for name, value in parameters.items() if name in accepted}
+        missing = [name for name in tool.parameters.get("required", []) if name not in arguments]
+        if missing:
+            raise ValueError(f"Missing parameter(s) for {tool_name}: {', '.join(missing)}")
+        return arguments
+
+    async def run(
+        self,
+        steps: List[Dict[str, Any]],
+        parameters: Optional[Dict[str, Any]] = None,
+        step_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        validate_steps(steps)
+        parameters = parameters or {}
+        step_parameters = step_parameters or {}
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        done: Dict[str, asyncio.Event] = {step["id"]: asyncio.Event() for step in steps}
+        started = time.perf_counter()
+
+        async def run_step(step: Dict[str, Any]) -> None:
+            outcome = outcomes[step["id"]]
+            try:
+                for dependency in step.get("depends_on") or []:
+                    await done[dependency].wait()
+                blocked = [d for d in step.get("depends_on") or [] if outcomes[d]["status"] != "ok"]
+                if blocked:
+                    outcome.update(status="skipped", error=f"Dependency not completed: {', '.join(blocked)}")
+                    return
+                try:
+                    arguments = await self._tool_arguments(
+                        step["tool"], {**parameters, **step_parameters.get(step["id"], {})}
+                    )
+                except ValueError as e:
+                    outcome.update(status="error", error=str(e))
+                    return
+
+                domain = str(step.get("domain", "")).lower()
+                if domain not in semaphores:
+                    semaphores[domain] = asyncio.Semaphore(
+                        max(1, self.domain_concurrency.get(domain, self.default_concurrency))
+                    )
+                async with semaphores[domain]:
+                    step_started = time.perf_counter()
+                    call = await call_tool(self.mcp, step["tool"], arguments)
+                    outcome["elapsed_ms"] = round((time.perf_counter() - step_started) * 1e3, 1)
+                    outcome["started_ms"] = round((step_started - started) * 1e3, 1)
+                if "error" in call:
+                    outcome.update(status="error", error=call["error"])
+                else:
+                    outcome.update(status="ok", result=_result_text(call))
+            finally:
+                done[step["id"]].set()
+
+        for step in steps:
+            outcomes[step["id"]] = {
+                "id": step["id"],
+                "domain": step.get("domain"),
+                "tool": step["tool"],
+                "required": bool(step.get("required", False)),
+                "status": "pending",
+            }
+        await asyncio.gather(*(run_step(step) for step in steps))
+
+        results = [outcomes[step["id"]] for step in steps]
+        failed_required = [r["id"] for r in results if r["required"] and r["status"] != "ok"]
+        completed = sum(r["status"] == "ok" for r in results)
+        if failed_required:
+            status = "failed"
+        elif completed < len(results):
+            status = "completed_with_errors"
+        else:
+            status = "completed"
+        return {
+            "status": status,
+            "summary": f"{completed} of {len(results)} steps completed"
+            + (f"; required steps not completed: {', '.join(failed_required)}" if failed_required else ""),
+            "elapsed_ms": round((time.perf_counter() - started) * 1e3, 1),
+            "steps": results,
+        }
@@ -3,39 +3,55 @@ MACAE MCP Server - FastMCP server with organized tools and services.
 """
 
 import argparse
+import contextlib
 import logging
 ###
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional
 
 from config.settings import config
-from core.factory import MCPToolFactory
-from fastmcp import FastMCP
-from fastmcp.server.auth.providers.jwt import JWTVerifier
-from services.hr_service import HRService
-from services.marketing_service import MarketingService
-from services.product_service import ProductService
-from services.tech_support_service import TechSupportService
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global factory instance
-factory = MCPToolFactory()
-
-# Initialize services
-factory.register_service(HRService())
-factory.register_service(TechSupportService())
-factory.register_service(MarketingService())
-factory.register_service(ProductService())
-
+# Built on first use, so importing this module stays cheap (see __getattr__ below)
+_factory = None
+_mcp = None
+_heartbeat = None  # set in worker processes of the multi-worker mode
+
+
+def get_factory():
+    """Return the factory with the enabled services loaded, importing them on first call."""
+    global _factory
+    if _factory is None:
+        from core.factory import MCPToolFactory
+        from core.service_registry import parse_service_names
+        from core.tool_executor import ToolExecutor
+
+        factory = MCPToolFactory(
+            executor=ToolExecutor(
+                io_workers=config.tool_io_workers,
+                cpu_workers=config.tool_cpu_workers,
+            ),
+            cache_max_entries=config.tool_cache_max_entries,
+            cache_max_bytes=config.tool_cache_max_bytes,
+        )
+        factory.load_services(parse_service_names(config.enabled_services), config)
+        _factory = factory
+    return _factory
 
 
 def create_fastmcp_server():
     """Create and configure FastMCP server."""
     try:
+        import fastmcp
+        from fastmcp.server.auth.providers.jwt import JWTVerifier
+
         # Create authentication provider if enabled
         auth = None
         if config.enable_auth:
@@ -53,7 +69,42 @@ def create_fastmcp_server():
                 )
 
         # Create MCP server
-        mcp_server = factory.create_mcp_server(name=config.server_name, auth=auth)
+        mcp_server = get_factory().create_mcp_server(name=config.server_name, auth=auth)
+
+        from starlette.responses import JSONResponse
+
+        @mcp_server.custom_route("/health", methods=["GET"])
+        async def health(request):
+            return JSONResponse(health_report())
+
+        @mcp_server.custom_route("/catalog", methods=["GET"])
+        async def catalog(request):
+            factory = get_factory()
+            return JSONResponse(
+                {
+                    "version": await factory.get_catalog_version(),
+                    "total_tools": factory.get_tool_summary()["total_tools"],
+                }
+            )
+
+        # Next to the MCP endpoint, where MCPService expects its tools/ routes
+        batch_path = f"{fastmcp.settings.streamable_http_path.rstrip('/')}/tools/batch"
+
+        @mcp_server.custom_route(batch_path, methods=["POST"])
+        async def tools_batch(request):
+            from core.tool_batch import parse_batch, run_batch
+
+            # Custom routes bypass the MCP endpoint's auth, so check the bearer token here
+            if mcp_server.auth is not None:
+                scheme, _, token = request.headers.get("authorization", "").partition(" ")
+                if scheme.lower() != "bearer" or await mcp_server.auth.verify_token(token) is None:
+                    return JSONResponse({"error": "Unauthorized"}, status_code=401)
+            try:
+                calls = parse_batch(await request.json(), config.tool_batch_max_calls)
+            except ValueError as e:
+                return JSONResponse({"error": str(e)}, status_code=400)
+            results = await run_batch(mcp_server, calls, config.tool_batch_max_concurrency)
+            return JSONResponse({"results": results})
 
         logger.info("✅ FastMCP server created successfully")
         return mcp_server
@@ -63,17 +114,150 @@ def create_fastmcp_server():
         return None
 
 
-# Create FastMCP server instance for fastmcp run command
-mcp = create_fastmcp_server()
+def get_mcp():
+    """Return the FastMCP server, creating it on first call."""
+    global _mcp
+    if _mcp is None:
+        _mcp = create_fastmcp_server()
+    return _mcp
+
+
+def worker_snapshot() -> dict:
+    """Health details of this process: services, per-tool executor metrics and result cache stats."""
+    factory = get_factory()
+    return {
+        "services": sorted(domain.value for domain in factory.get_all_services()),
+        "tools": factory.get_executor_metrics(),
+        "cache": factory.result_cache.stats() if factory.result_cache else None,
+    }
+
+
+def health_report() -> dict:
+    """Body of GET /health; in multi-worker mode it also lists every live worker."""
+    report = {"status": "ok", "pid": os.getpid(), **worker_snapshot()}
+    if _heartbeat is not None:
+        from core.worker_health import read_workers
+
+        report["uptime_seconds"] = round(time.time() - _heartbeat.started_at, 1)
+        report["workers"] = read_workers(_heartbeat.state_dir, max_age=3 * _heartbeat.interval)
+    return report
+
+
+def create_http_app():
+    """ASGI app for one worker process of the multi-worker mode (see run_workers)."""
+    global _heartbeat
+    from core.worker_health import WorkerHeartbeat
+
+    app = get_mcp().http_app(transport=config.worker_transport, stateless_http=True)
+    if config.worker_state_dir:
+        _heartbeat = WorkerHeartbeat(
+            config.worker_state_dir, worker_snapshot, interval=config.worker_heartbeat_interval
+        )
+        server_lifespan = app.router.lifespan_context
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app):
+            # Publish heartbeats while this worker serves; withdraw them on graceful shutdown
+            async with server_lifespan(app) as state:
+                _heartbeat.start()
+                try:
+                    yield state
+                finally:
+                    _heartbeat.stop()
+
+        app.router.lifespan_context = lifespan
+    return app
+
+
+def warm_shared_caches() -> None:
+    """Convert the datasets once, before forking, so every worker just maps the shared files."""
+    from core.service_registry import parse_service_names
+
+    if "data" not in parse_service_names(config.enabled_services) or not config.dataset_cache_dir:
+        return
+    from services.data_tool_service import DataToolService
+
+    loaded = DataToolService.from_config(config).store.warm()
+    logger.info(f"🗂️  Dataset cache ready: {loaded} tables in {config.dataset_cache_dir}")
+
+
+def run_workers(transport: str, host: str, port: int, workers: int, log_level: str = "info") -> None:
+    """
+    Serve HTTP from `workers` processes sharing one listening socket.
+
+    Uses uvicorn's pre-fork supervisor: SIGHUP replaces the workers one at a
+    time (graceful reload), SIGTTIN / SIGTTOU add or remove a worker, and a
+    crashed worker is restarted. Sessions cannot follow a client across
+    processes, so workers serve streamable HTTP in stateless mode.
+    """
+    import uvicorn
+
+    if transport == "sse":
+        raise ValueError("SSE keeps sessions in one process; use --transport http with --workers")
+
+    state_dir = config.worker_state_dir or os.path.join(tempfile.gettempdir(), f"macae-mcp-{port}")
+    # Workers are fresh interpreters that read their settings from the environment
+    os.environ.update(
+        {
+            "WORKER_TRANSPORT": transport,
+            "WORKER_STATE_DIR": state_dir,
+            "ENABLE_AUTH": str(config.enable_auth).lower(),
+            "DEBUG": str(config.debug).lower(),
+        }
+    )
+    warm_shared_caches()
+
+    logger.info(f"🤖 Starting {workers} workers with {transport} transport")
+    logger.info(f"🌐 Server will be available at: http://{host}:{port}/mcp/ (health: /health)")
+    uvicorn.run(
+        "mcp_server:create_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level=log_level,
+        app_dir=str(Path(__file__).parent),
+    )
+
+
+def __getattr__(name: str):
+    # `mcp` (looked up by `fastmcp run mcp_server.py`) and `factory` are created on first access
+    if name == "mcp":
+        return get_mcp()
+    if name == "factory":
+        return get_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def profile_startup() -> float:
+    """Build the server and log import / init / register time per service; returns the total in ms."""
+    started = time.perf_counter()
+    import core.factory  # noqa: F401  (FastMCP and the shared core)
+
+    framework_ms = (time.perf_counter() - started) * 1e3
+    get_mcp()
+    total_ms = (time.perf_counter() - started) * 1e3
+
+    logger.info(f"⏱️  Startup profile (services: {config.enabled_services})")
+    logger.info(f"   {'framework import':<18} {framework_ms:8.1f} ms")
+    for domain, timings in get_factory().startup_profile.items():
+        logger.info(
+            f"   {domain:<18} {sum(timings.values()):8.1f} ms"
+            f"  (import {timings.get('import_ms', 0):.1f}, init {timings.get('init_ms', 0):.1f},"
+            f" register {timings.get('register_ms', 0):.1f})"
+        )
+    logger.info(f"   {'total':<18} {total_ms:8.1f} ms")
+    return total_ms
 
 
 def log_server_info():
     """Log server initialization info."""
+    mcp = get_mcp()
     if not mcp:
         logger.error("❌ FastMCP server not available")
         return
 
-    summary = factory.get_tool_summary()
+    summary = get_factory().get_tool_summary()
     logger.info(f"🚀 {config.server_name} initialized")
     logger.info(f"📊 Total services: {summary['total_services']}")
     logger.info(f"🔧 Total tools: {summary['total_tools']}")
@@ -86,9 +270,20 @@ def log_server_info():
 
 
 def run_server(
-    transport: str = "stdio", host: str = "127.0.0.1", port: int = 9000, **kwargs
+    transport: str = "stdio",
+    host: str = "127.0.0.1",
+    port: int = 9000,
+    workers: int = 1,
+    **kwargs,
 ):
     """Run the FastMCP server with specified transport."""
+    if workers > 1 and transport == "sse":
+        logger.warning("⚠️  SSE keeps sessions in one process; serving with a single worker")
+    elif workers > 1 and transport in ["http", "streamable-http"]:
+        run_workers(transport, host, port, workers, log_level=kwargs.get("log_level", "info"))
+        return
+
+    mcp = get_mcp()
     if not mcp:
         logger.error("❌ Cannot start FastMCP server - not available")
         return
@@ -129,8 +324,28 @@ def main():
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--no-auth", action="store_true", help="Disable authentication")
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=config.workers,
+        help="Worker processes for HTTP transports, sharing one port (default: 1)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Build the server, report per-service startup time and exit",
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        default=None,
+        help="With --profile-startup: exit with status 1 if startup takes longer",
+    )
 
     args = parser.parse_args()
+    if args.workers > 1 and args.transport == "sse":
+        parser.error("--workers needs --transport http or streamable-http; SSE keeps sessions in one process")
 
     # Override config with command line arguments
     if args.debug:
@@ -145,6 +360,13 @@ def main():
         os.environ["MCP_ENABLE_AUTH"] = "false"
         config.enable_auth = False
 
+    if args.profile_startup:
+        total_ms = profile_startup()
+        if args.startup_budget_ms is not None and total_ms > args.startup_budget_ms:
+            logger.error(f"❌ Startup took {total_ms:.0f} ms, budget is {args.startup_budget_ms:.0f} ms")
+            sys.exit(1)
+        return
+
     # Print startup info
     print(f"🚀 Starting MACAE MCP Server")
     print(f"📋 Transport: {args.transport.upper()}")
@@ -153,6 +375,7 @@ def main():
     if args.transport in ["http", "streamable-http", "sse"]:
         print(f"🌐 Host: {args.host}")
         print(f"🌐 Port: {args.port}")
+        print(f"👷 Workers: {args.workers}")
     print("-" * 50)
 
     # Run the server
@@ -160,6 +383,7 @@ def main():
         transport=args.transport,
         host=args.host,
         port=args.port,
+        workers=args.workers,
         log_level="debug" if args.debug else "info",
     )
 
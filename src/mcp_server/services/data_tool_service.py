@@ -1,7 +1,13 @@
-import os
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from core.column_cache import ColumnCache
+from core.csv_pager import read_page
+from core.dataset_catalog import DatasetCatalog
 from core.factory import MCPToolBase, Domain
+from core.table_aggregate import run_aggregate
+from core.table_query import QueryError, run_query
+from core.table_stats import MAX_SAMPLE_ROWS, describe
+from core.table_store import Table, TableStore
 
 ALLOWED_FILES = [
     "competitor_Pricing_Analysis.csv",
@@ -24,44 +30,117 @@ ALLOWED_FILES = [
 
 
 class DataToolService(MCPToolBase):
-    def __init__(self, dataset_path: str):
+    def __init__(
+        self,
+        dataset_path: str,
+        poll_interval: float = 5.0,
+        cache_dir: Optional[str] = None,
+    ):
         super().__init__(Domain.DATA)
         self.dataset_path = dataset_path
         self.allowed_files = set(ALLOWED_FILES)
+        self.poll_interval = poll_interval
+        self.cache_dir = cache_dir
+        self._catalog: Optional[DatasetCatalog] = None
+        self._store: Optional[TableStore] = None
+        # filename -> ((mtime, size), statistics) of the table version they were computed on
+        self._stats: Dict[str, Tuple[Tuple[float, int], Dict[str, Any]]] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "DataToolService":
+        return cls(
+            config.dataset_path,
+            poll_interval=config.dataset_poll_interval,
+            cache_dir=config.dataset_cache_dir,
+        )
 
     @property
-    def tool_count(self) -> int:
-        """Return the number of tools provided by this service."""
-        return 2
-    
+    def catalog(self) -> DatasetCatalog:
+        """Index of the allowed dataset files, built on first use (normally at registration)."""
+        if self._catalog is None:
+            self._catalog = DatasetCatalog(
+                self.dataset_path,
+                allowed_files=self.allowed_files,
+                poll_interval=self.poll_interval,
+            )
+        return self._catalog
+
+    @property
+    def store(self) -> TableStore:
+        """Columnar copies of the dataset tables, memory-mapped from cache_dir when one is set."""
+        if self._store is None:
+            cache = ColumnCache(self.cache_dir) if self.cache_dir else None
+            self._store = TableStore(self.catalog, cache=cache)
+        return self._store
+
+    def _table_filename(self, tablename: str) -> str:
+        tablename = tablename.strip()
+        return (
+            f"{tablename}.csv"
+            if not tablename.lower().endswith(".csv")
+            else tablename
+        )
+
+    def _load_table(self, tablename: str) -> Table:
+        """Resolve an allowed table name to its columnar table; raises QueryError otherwise."""
+        filename = self._table_filename(tablename)
+        if filename not in self.allowed_files:
+            raise QueryError(f"File '{filename}' is not allowed.")
+        table = self.store.get(filename)
+        if table is None:
+            raise QueryError(f"File '{filename}' not found.")
+        return table
+
+    def _table_stats(self, table: Table) -> Dict[str, Any]:
+        """Statistics of a table, computed once per file version."""
+        key = (table.source_mtime, table.source_size)
+        cached = self._stats.get(table.name)
+        if cached and cached[0] == key:
+            return cached[1]
+        stats = describe(table)
+        self._stats[table.name] = (key, stats)
+        return stats
+
+    def _normalize_table_args(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Canonical tool arguments for the result cache: 'x' and 'x.csv' name the same table."""
+        return {**arguments, "tablename": self._table_filename(arguments["tablename"])}
+
     def _find_file(self, filename: str) -> str:
         """
-        Searches recursively within the dataset_path for an exact filename match (case-sensitive).
+        Looks up an exact filename match (case-sensitive) anywhere under dataset_path.
         Returns the full path if found, else None.
         """
         logger = logging.getLogger("find_file")
-        for root, _, files in os.walk(self.dataset_path):
-            if filename in files:
-                full_path = os.path.join(root, filename)
-                logger.info("Found file: %s", full_path)
-                return full_path
+        full_path = self.catalog.find(filename)
+        if full_path:
+            logger.info("Found file: %s", full_path)
+            return full_path
         logger.warning(
             "File '%s' not found in '%s' directory.", filename, self.dataset_path
         )
         return None
 
     def register_tools(self, mcp):
+        # Index the dataset tree once, up front, instead of walking it per call
+        self.catalog
+        if self.cache_dir:
+            # Convert (or map already converted) tables at startup; mapped pages are shared by all workers
+            loaded = self.store.warm()
+            logging.getLogger(__name__).info("Mapped %d dataset tables from '%s'", loaded, self.cache_dir)
+
+        # Synchronous tools run off the event loop; whole-file reads are capped to bound memory.
+        # Results are cached per dataset version, so any file change invalidates them.
+        table_cache = self.cached(ttl=300, normalize=self._normalize_table_args, version=self.catalog.version_nowait)
+
         @mcp.tool()
+        @table_cache
+        @self.blocking(max_concurrency=4)
         def data_provider(tablename: str) -> str:
-            """A tool that provides data from database based on given table name as parameter."""
+            """A tool that provides data from database based on given table name as parameter.
+            Returns the whole table; use read_table_page for large tables."""
             logger = logging.getLogger("file_provider")
             logger.info("Table '%s' requested.", tablename)
-            tablename = tablename.strip()
-            filename = (
-                f"{tablename}.csv"
-                if not tablename.lower().endswith(".csv")
-                else tablename
-            )
+            filename = self._table_filename(tablename)
             if filename not in self.allowed_files:
                 logger.error("File '%s' is not allowed.", filename)
                 return f"File '{filename}' is not allowed."
@@ -78,23 +157,165 @@ class DataToolService(MCPToolBase):
                 return None
 
         @mcp.tool()
+        @self.cached(ttl=60, version=self.catalog.version_nowait)
+        @self.blocking()
         def show_tables() -> List[str]:
             """Returns a list of allowed table names (without .csv extension) that exist in the dataset path."""
             logger = logging.getLogger("show_tables")
-            found_tables = []
-            for filename in self.allowed_files:
-                file_path = self._find_file(filename)
-                if file_path:
-                    table_name = filename[:-4]  # Remove .csv
-                    found_tables.append(table_name)
-                    logger.info("Found table: %s", table_name)
+            found_tables = [
+                entry.filename[:-4]  # Remove .csv
+                for entry in self.catalog.entries()
+            ]
+            logger.info("Found tables: %s", found_tables)
             if not found_tables:
                 logger.warning(
                     "No allowed CSV tables found in '%s' directory.", self.dataset_path
                 )
             return found_tables
 
+        @mcp.tool()
+        @table_cache
+        @self.cpu_bound()
+        def describe_table(tablename: str, sample_rows: int = 5) -> Dict[str, Any]:
+            """
+            Describe a table without downloading it: use this to plan queries.
+
+            Args:
+                tablename: Table name as returned by show_tables.
+                sample_rows: Number of leading rows to include (capped at 20).
+
+            Returns num_rows and, per column, its type ("int", "float" or "str"), null count,
+            distinct count (estimated for large numeric columns), min and max, plus sample rows.
+            """
+            logger = logging.getLogger("describe_table")
+            try:
+                table = self._load_table(tablename)
+            except QueryError as e:
+                logger.error("Cannot describe '%s': %s", tablename, e)
+                return {"error": str(e)}
+            stats = self._table_stats(table)
+            sample_rows = max(0, min(int(sample_rows), MAX_SAMPLE_ROWS))
+            return {**stats, "sample_rows": stats["sample_rows"][:sample_rows]}
+
+        @mcp.tool()
+        @self.blocking()
+        def read_table_page(
+            tablename: str, cursor: Optional[str] = None, page_size: int = 200
+        ) -> Dict[str, Any]:
+            """
+            Read a table page by page instead of all at once.
+
+            Args:
+                tablename: Table name as returned by show_tables.
+                cursor: next_cursor from the previous page; omit for the first page.
+                page_size: Rows per page (capped at 1000).
+
+            Returns columns, rows, start_row and next_cursor (null after the last page).
+            """
+            logger = logging.getLogger("read_table_page")
+            filename = self._table_filename(tablename)
+            try:
+                if filename not in self.allowed_files:
+                    raise QueryError(f"File '{filename}' is not allowed.")
+                entry = self.catalog.get(filename)
+                if entry is None:
+                    raise QueryError(f"File '{filename}' not found.")
+                page = read_page(entry, cursor, page_size)
+            except QueryError as e:
+                logger.error("Invalid page request on '%s': %s", tablename, e)
+                return {"error": str(e)}
+            except (IOError, UnicodeDecodeError) as e:
+                logger.error("Error reading file '%s': %s", filename, e)
+                return {"error": f"Error reading file '{filename}'."}
+            logger.info(
+                "Page of '%s' from row %d: %d rows",
+                page["table"],
+                page["start_row"],
+                page["returned_rows"],
+            )
+            return page
+
+        @mcp.tool()
+        @table_cache
+        @self.cpu_bound()
+        def query_table(
+            tablename: str,
+            columns: Optional[List[str]] = None,
+            filters: Optional[List[Dict[str, Any]]] = None,
+            sort_by: Optional[List[str]] = None,
+            limit: int = 50,
+            offset: int = 0,
+        ) -> Dict[str, Any]:
+            """
+            Query a table without downloading all of it. Prefer this over data_provider.
+
+            Args:
+                tablename: Table name as returned by show_tables.
+                columns: Columns to return (default: all).
+                filters: Conditions that must all hold, e.g.
+                    [{"column": "Segment", "op": "==", "value": "Premium"},
+                     {"column": "ChurnRate", "op": ">", "value": 0.2}]
+                    Operators: ==, !=, <, <=, >, >=, in, not_in, contains, is_null, not_null.
+                sort_by: Columns to sort by; prefix with "-" for descending, e.g. ["-ChurnRate"].
+                limit: Maximum rows to return (capped at 500).
+                offset: Rows to skip, for fetching the next page (see next_offset).
+
+            Returns rows plus total_rows, matched_rows, truncated and next_offset.
+            """
+            logger = logging.getLogger("query_table")
+            try:
+                table = self._load_table(tablename)
+                result = run_query(table, columns, filters, sort_by, limit, offset)
+            except QueryError as e:
+                logger.error("Invalid query on '%s': %s", tablename, e)
+                return {"error": str(e)}
+            logger.info(
+                "Query on '%s' matched %d of %d rows",
+                table.name,
+                result["matched_rows"],
+                result["total_rows"],
+            )
+            return result
+
+        @mcp.tool()
+        @table_cache
+        @self.cpu_bound()
+        def aggregate_table(
+            tablename: str,
+            metrics: List[Any],
+            group_by: Optional[List[str]] = None,
+            filters: Optional[List[Dict[str, Any]]] = None,
+            sort_by: Optional[List[str]] = None,
+            limit: int = 100,
+        ) -> Dict[str, Any]:
+            """
+            Compute grouped statistics on a table, e.g. churn rate by segment or return rate per product.
+
+            Args:
+                tablename: Table name as returned by show_tables.
+                metrics: Aggregations to compute: "count", "count(Col)", "sum(Col)", "mean(Col)",
+                    "min(Col)", "max(Col)", "median(Col)" or percentiles such as "p90(Col)".
+                group_by: Columns to group by (default: aggregate the whole table).
+                filters: Row conditions applied before grouping, same format as query_table.
+                sort_by: Output columns to sort by, "-" prefix for descending, e.g. ["-mean(ChurnRate)"].
+                limit: Maximum groups to return (capped at 1000).
+            """
+            logger = logging.getLogger("aggregate_table")
+            try:
+                table = self._load_table(tablename)
+                result = run_aggregate(table, group_by, metrics, filters, sort_by, limit)
+            except QueryError as e:
+                logger.error("Invalid aggregation on '%s': %s", tablename, e)
+                return {"error": str(e)}
+            logger.info(
+                "Aggregation on '%s' produced %d groups from %d rows",
+                table.name,
+                result["groups"],
+                result["matched_rows"],
+            )
+            return result
+
     @property
     def tool_count(self) -> int:
         """Return the number of tools provided by this service."""
-        return 2  # data_provider and show_tables
+        return 6  # data_provider, show_tables, describe_table, read_table_page, query_table, aggregate_table
@@ -19,6 +19,7 @@ class HRService(MCPToolBase):
         """Register HR tools with the MCP server."""
 
         @mcp.tool(tags={self.domain.value})
+        @self.cached(ttl=300)
         async def employee_onboarding_blueprint_flat(
             employee_name: str | None = None,
             start_date: str | None = None,
@@ -30,6 +31,8 @@ class HRService(MCPToolBase):
             1. Call this first when onboarding intent detected.
             2. Filter steps to its own domain.
             3. Execute in listed order while honoring depends_on.
+            Or pass this tool's name to run_workflow to execute every step
+            server-side in one call.
             """
             return {
                 "version": "1.0",
@@ -19,6 +19,7 @@ class ProductService(MCPToolBase):
         """Register Product tools with the MCP server."""
 
         @mcp.tool(tags={self.domain.value})
+        @self.cached(ttl=300)
         async def get_product_info() -> str:
             """Get information about the different products and phone plans available, including roaming services."""
             product_info = """
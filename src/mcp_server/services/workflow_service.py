@@ -0,0 +1,91 @@
+"""
+Workflow MCP tools service: runs multi-step blueprints on the server.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from fastmcp.exceptions import NotFoundError
+
+from core.factory import Domain, MCPToolBase
+from core.tool_batch import call_tool
+from core.workflow import WORKFLOW_TOOL, WorkflowRunner, validate_steps
+
+
+def parse_concurrency(value: str) -> Dict[str, int]:
+    """Parse "hr=4,tech_support=2" into {"hr": 4, "tech_support": 2}."""
+    limits: Dict[str, int] = {}
+    for item in value.split(","):
+        domain, _, limit = item.partition("=")
+        if domain.strip():
+            limits[domain.strip().lower()] = int(limit)
+    return limits
+
+
+class WorkflowService(MCPToolBase):
+    """Executes blueprints such as employee onboarding in one tool call."""
+
+    def __init__(self, domain_concurrency: Optional[Dict[str, int]] = None, default_concurrency: int = 4):
+        super().__init__(Domain.WORKFLOW)
+        self.domain_concurrency = domain_concurrency or {}
+        self.default_concurrency = default_concurrency
+
+    @classmethod
+    def from_config(cls, config: Any) -> "WorkflowService":
+        if config is None:
+            return cls()
+        return cls(
+            parse_concurrency(config.workflow_domain_concurrency),
+            default_concurrency=config.workflow_default_concurrency,
+        )
+
+    def register_tools(self, mcp) -> None:
+        """Register workflow tools with the MCP server."""
+        runner = WorkflowRunner(mcp, self.domain_concurrency, self.default_concurrency)
+
+        @mcp.tool(name=WORKFLOW_TOOL, tags={self.domain.value})
+        async def run_workflow(
+            blueprint: Union[str, Dict[str, Any]],
+            parameters: Optional[Dict[str, Any]] = None,
+            step_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+        ) -> dict:
+            """
+            Run every step of a blueprint in one call, honoring depends_on.
+            Independent steps run concurrently. Use this instead of calling
+            the blueprint's tools one by one.
+
+            Args:
+                blueprint: A blueprint ({"steps": [...]}) or the name of the tool
+                    that returns it, e.g. "employee_onboarding_blueprint_flat".
+                parameters: Values shared by all steps, e.g. {"employee_name": ...,
+                    "date": ..., "email_address": ..., "laptop_model": ...}. Each
+                    step receives the ones its tool accepts.
+                step_parameters: Per-step overrides keyed by step id.
+
+            Returns:
+                Overall status, a summary and each step's status and result in
+                blueprint order. Steps whose dependencies did not complete are skipped.
+            """
+            parameters = parameters or {}
+            if isinstance(blueprint, str):
+                if blueprint == WORKFLOW_TOOL:
+                    return {"error": "A workflow cannot run itself"}
+                try:
+                    tool = await mcp.get_tool(blueprint)
+                except NotFoundError:
+                    return {"error": f"Unknown blueprint tool '{blueprint}'"}
+                accepted = tool.parameters.get("properties", {})
+                call = await call_tool(mcp, blueprint, {k: v for k, v in parameters.items() if k in accepted})
+                if "error" in call:
+                    return {"error": f"Could not get blueprint: {call['error']}"}
+                blueprint = call["structured_content"] or {}
+
+            try:
+                steps = validate_steps(blueprint.get("steps"))
+            except ValueError as e:
+                return {"error": str(e)}
+            result = await runner.run(steps, parameters, step_parameters)
+            return {"intent": blueprint.get("intent"), **result}
+
+    @property
+    def tool_count(self) -> int:
+        return 1
@@ -0,0 +1,73 @@
+import random
+import string
+import sys
+from pathlib import Path
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from v3.orchestration.helper.agent_name_matcher import (AgentNameMatcher,
+                                                        get_agent_name_matcher)
+from v3.orchestration.helper.plan_to_mplan_converter import \
+    PlanToMPlanConverter
+
+
+def _linear_scan(team, head_segment):
+    """The original window rule: first team member whose name is in the segment."""
+    for canonical in team:
+        if canonical.lower() in head_segment:
+            return canonical
+    return None
+
+
+def test_matches_linear_scan_on_random_teams_and_texts():
+    rng = random.Random(7)
+    alphabet = "abAB_"  # a small alphabet forces overlapping / nested names
+    for _ in range(2000):
+        team = tuple(
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+            for _ in range(rng.randint(1, 8))
+        )
+        text = "".join(rng.choice(alphabet + " ") for _ in range(rng.randint(0, 30))).lower()
+        matcher = AgentNameMatcher(team)
+        matcher.linear_scan_max_team = 0  # exercise the automaton even for small teams
+        assert matcher.find_first(text) == _linear_scan(team, text)
+
+
+def test_prefers_team_order_over_text_position():
+    matcher = AgentNameMatcher(("MarketingAgent", "ProductAgent", "Agent"))
+    matcher.linear_scan_max_team = 0
+    assert matcher.find_first("productagent then marketingagent") == "MarketingAgent"
+    assert matcher.find_first("the productagent") == "ProductAgent"
+    assert matcher.find_first("some agent") == "Agent"
+    assert matcher.find_first("nobody") is None
+
+
+def test_matcher_is_built_once_per_team():
+    team = ["ProductAgent", "MarketingAgent"]
+    first = PlanToMPlanConverter(team=team)
+    second = PlanToMPlanConverter(team=list(team))
+    assert first._agent_matcher is second._agent_matcher
+    assert get_agent_name_matcher(tuple(team)) is first._agent_matcher
+
+
+def test_converter_output_unchanged_for_large_team():
+    rng = random.Random(3)
+    team = [f"Agent{''.join(rng.choice(string.ascii_letters) for _ in range(6))}" for _ in range(200)]
+    lines = []
+    for _ in range(300):
+        name = rng.choice(team)
+        style = rng.choice(["**{}** to act", "{} to act", "please ask {} to act", "no agent here"])
+        lines.append("- " + style.format(name if rng.random() < 0.5 else name.lower()))
+    plan_text = "\n".join(lines)
+
+    mplan = PlanToMPlanConverter(team=team).parse(plan_text)
+
+    assert len(mplan.steps) == len(lines)
+    for line, step in zip(lines, mplan.steps):
+        body = line[2:]
+        expected = _linear_scan(team, body[:25].lower())
+        if "**" in body:
+            expected = next(t for t in team if t.lower() == body.split("**")[1].lower())
+        assert step.agent == (expected or "MagenticAgent")
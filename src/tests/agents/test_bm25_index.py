@@ -0,0 +1,93 @@
+"""
+Tests for the local BM25 search index and the local ReasoningSearch backend.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from semantic_kernel import Kernel  # noqa: E402
+from v3.magentic_agents import reasoning_search  # noqa: E402
+from v3.magentic_agents.common.bm25_index import BM25Index, file_chunks  # noqa: E402
+from v3.magentic_agents.models.agent_models import SearchConfig  # noqa: E402
+from v3.magentic_agents.reasoning_search import ReasoningSearch  # noqa: E402
+
+DATASETS = Path(__file__).parent.parent.parent.parent / "data" / "datasets"
+
+
+def test_bm25_ranks_rare_and_frequent_terms():
+    index = BM25Index()
+    index.upsert("a", "laptop laptop laptop setup guide")
+    index.upsert("b", "laptop return policy")
+    index.upsert("c", "payroll schedule and benefits enrolment")
+    index.upsert("d", "office access badge")
+
+    assert [doc_id for doc_id, _, _ in index.search("laptop", top=3)] == ["a", "b"]
+    assert index.search("payroll benefits")[0][0] == "c"
+    assert index.search("nothing matches") == []
+
+    index.upsert("a", "badge printer")  # replaced, not duplicated
+    index.remove("b")
+    assert [doc_id for doc_id, _, _ in index.search("laptop")] == []
+    assert len(index) == 3 and index.search("badge", top=1)[0][0] in {"a", "d"}
+
+
+def test_csv_chunks_repeat_the_header():
+    text = "id,name\n" + "".join(f"{i},item {i}\n" for i in range(100))
+    chunks = file_chunks("items.csv", text, 200)
+    assert len(chunks) > 1 and all(chunk.startswith("id,name\n") for chunk in chunks)
+
+
+def test_sync_is_incremental_and_index_persists(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "returns.csv").write_text("product,rate\nheadphones,12%\nlaptops,3%\n")
+    (data / "notes.md").write_text("Quarterly churn is driven by delivery delays.")
+    (data / "image.png").write_bytes(b"\x89PNG")
+
+    index = BM25Index()
+    assert index.sync_directory(str(data)) == {"added": 2, "updated": 0, "removed": 0, "unchanged": 0}
+    assert index.sync_directory(str(data))["unchanged"] == 2
+
+    (data / "notes.md").write_text("Churn fell after the loyalty program launch.")
+    (data / "returns.csv").unlink()
+    assert index.sync_directory(str(data)) == {"added": 0, "updated": 1, "removed": 1, "unchanged": 0}
+    assert index.search("headphones") == [] and index.search("loyalty")[0][0] == "notes.md#0"
+
+    path = tmp_path / "index.json.gz"
+    index.save(str(path))
+    loaded = BM25Index.load(str(path))
+    assert loaded.search("loyalty churn") == index.search("loyalty churn")
+    assert loaded.sync_directory(str(data))["unchanged"] == 1
+    assert BM25Index.load(str(tmp_path / "missing.json.gz")) is None
+
+
+def test_reasoning_search_answers_from_the_local_datasets(tmp_path):
+    reasoning_search._local_indexes.clear()
+    config = SearchConfig(
+        backend="local", index_name="local", data_dir=str(DATASETS), index_path=str(tmp_path / "index.json.gz")
+    )
+
+    async def scenario():
+        search = ReasoningSearch(config)
+        assert await search.initialize(Kernel())
+        return await search.search_documents("customer loyalty program", limit="2"), search
+
+    results, search = asyncio.run(scenario())
+    assert len(results) == 2 and all(result.startswith("content: ") for result in results)
+    assert "PointsRedeemed" in results[0]  # loyalty_program_overview.csv, matched on its name
+    assert search.metrics["searches"] == 1
+    assert (tmp_path / "index.json.gz").exists()
@@ -0,0 +1,147 @@
+"""
+Tests for the shared MCP client session pool.
+"""
+
+import asyncio
+import os
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from v3.common.services import http_client  # noqa: E402
+from v3.magentic_agents.common.mcp_session_pool import MCPSessionPool  # noqa: E402
+
+fastmcp = pytest.importorskip("fastmcp")
+uvicorn = pytest.importorskip("uvicorn")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _run_with_server(scenario, catalog_version=None):
+    mcp = fastmcp.FastMCP("pool-test")
+    sessions = set()
+    listings = []
+
+    class CountListings(fastmcp.server.middleware.Middleware):
+        async def on_list_tools(self, context, call_next):
+            listings.append(context)
+            return await call_next(context)
+
+    mcp.add_middleware(CountListings())
+    if catalog_version:
+
+        @mcp.custom_route("/catalog", methods=["GET"])
+        async def catalog(request):
+            from starlette.responses import JSONResponse
+
+            return JSONResponse({"version": catalog_version})
+
+    @mcp.tool()
+    async def echo(text: str) -> str:
+        """Echo the text after a short delay."""
+        await asyncio.sleep(0.05)
+        return text
+
+    @mcp.tool()
+    async def session_id(ctx: fastmcp.Context) -> str:
+        """Report which server session served the call."""
+        sessions.add(id(ctx.session))
+        return str(id(ctx.session))
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(mcp.http_app(), host="127.0.0.1", port=port, log_level="warning"))
+
+    async def main():
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+        try:
+            return await scenario(f"http://127.0.0.1:{port}/mcp/", sessions, listings)
+        finally:
+            await http_client.close_shared_session()
+            server.should_exit = True
+            await serving
+
+    return asyncio.run(main())
+
+
+def test_agents_share_one_session_and_its_tool_catalog():
+    async def scenario(url, server_sessions, _):
+        pool = MCPSessionPool()
+
+        async def agent(i):
+            async with pool.lease(url, name="MCP") as plugin:
+                await plugin.session_id()
+                return str((await plugin.echo(text=f"agent {i}"))[0])
+
+        replies = await asyncio.gather(*(agent(i) for i in range(5)))
+        stats = pool.stats()
+        await pool.aclose()
+        return replies, stats, server_sessions
+
+    replies, stats, server_sessions = _run_with_server(scenario)
+    assert replies == [f"agent {i}" for i in range(5)]
+    assert stats["sessions_opened"] == 1 and stats["leases"] == 5
+    (session,) = stats["sessions"]
+    assert session["calls"] == 10 and session["tools"] == 2 and session["leases"] == 0
+    assert len(server_sessions) == 1
+
+
+def test_broken_sessions_reconnect_in_place_and_idle_ones_close():
+    async def scenario(url, *_):
+        pool = MCPSessionPool(idle_seconds=0.1, health_check_seconds=0)
+        async with pool.lease(url, name="MCP") as first:
+            first.healthy = False  # as after a transport error
+        async with pool.lease(url, name="MCP") as second:
+            reply = str((await second.echo(text="again"))[0])
+        await asyncio.sleep(0.15)
+        async with pool.lease(url, name="MCP", headers={"X-Tenant": "a"}):
+            pass
+        return first is second, reply, pool.stats()
+
+    same_plugin, reply, stats = _run_with_server(scenario)
+    assert same_plugin and reply == "again"
+    assert stats["reconnects"] == 1 and stats["sessions_opened"] == 3
+    assert stats["sessions_closed"] == 1  # the idle session of the first key
+    assert [s["url"] for s in stats["sessions"]] == [stats["sessions"][0]["url"]]
+
+
+def test_tool_metadata_is_reused_for_a_known_catalog_version():
+    from v3.magentic_agents.common.mcp_tool_catalog import tool_catalog_cache
+
+    async def scenario(url, _, listings):
+        pool = MCPSessionPool()
+        tool_catalog_cache.clear()
+        listed, replies = [], []
+        for tenant in ("a", "b"):  # different headers, so two sessions
+            async with pool.lease(url, name="MCP", headers={"X-Tenant": tenant}) as plugin:
+                listed.append(len(listings))
+                replies.append(str((await plugin.echo(text=tenant))[0]))
+                functions = sorted(plugin.tool_names)
+        stats = pool.stats()
+        await pool.aclose()
+        return listed, replies, functions, stats
+
+    listed, replies, functions, stats = _run_with_server(scenario, catalog_version="v1")
+    assert replies == ["a", "b"] and functions == ["echo", "session_id"]
+    assert listed == [1, 1]  # the second session was not listed on connect
+    assert stats["catalog_cache"] == {"misses": 1, "hits": 1}
+    assert [s["catalog_version"] for s in stats["sessions"]] == ["v1", "v1"]
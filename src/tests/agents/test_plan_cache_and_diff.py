@@ -0,0 +1,149 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+import v3.orchestration.helper.plan_to_mplan_converter as converter_module
+from semantic_kernel.agents.orchestration.magentic import MagenticContext
+from semantic_kernel.connectors.ai.chat_completion_client_base import \
+    ChatCompletionClientBase
+from semantic_kernel.connectors.ai.open_ai import \
+    OpenAIChatPromptExecutionSettings
+from semantic_kernel.contents import (ChatHistory, ChatMessageContent,
+                                      StreamingChatMessageContent)
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from v3.config.settings import connection_config
+from v3.models.models import MStep
+from v3.orchestration.helper.plan_to_mplan_converter import (
+    PlanToMPlanConverter, diff_plan_steps)
+from v3.orchestration.human_approval_manager import \
+    HumanApprovalMagenticManager
+
+TEAM = ["ProductAgent", "MarketingAgent"]
+PLAN = "- **ProductAgent** to describe the product\n- **MarketingAgent** to draft the release\n"
+
+
+def test_parse_is_memoized_and_returns_independent_plans(monkeypatch):
+    calls = []
+    original = PlanToMPlanConverter._parse_steps
+
+    def counting_parse(self, plan_text):
+        calls.append(plan_text)
+        return original(self, plan_text)
+
+    monkeypatch.setattr(PlanToMPlanConverter, "_parse_steps", counting_parse)
+    converter_module._parse_cache.clear()
+
+    first = PlanToMPlanConverter.convert(PLAN, team=TEAM, facts="old facts")
+    first.steps[0].action = "mutated"
+    second = PlanToMPlanConverter.convert(PLAN, team=TEAM, facts="new facts")
+
+    assert len(calls) == 1
+    assert first.id != second.id
+    assert second.facts == "new facts"
+    assert second.steps[0].action == "to describe the product"
+
+    PlanToMPlanConverter.convert(PLAN, team=TEAM + ["ProxyAgent"])
+    assert len(calls) == 2
+
+
+def test_parse_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(converter_module, "PARSE_CACHE_SIZE", 3)
+    converter_module._parse_cache.clear()
+    for i in range(5):
+        PlanToMPlanConverter.convert(f"- **ProductAgent** step {i}", team=TEAM)
+    assert len(converter_module._parse_cache) == 3
+
+
+def test_diff_reports_added_removed_and_changed_steps():
+    old = [MStep(agent="A", action="one"), MStep(agent="B", action="two"), MStep(agent="C", action="three")]
+    new = [MStep(agent="A", action="one"), MStep(agent="B", action="two, revised"), MStep(agent="C", action="three"),
+           MStep(agent="D", action="four")]
+
+    diff = diff_plan_steps(old, new)
+
+    assert diff["changed"] == [
+        {"old_index": 1, "index": 1, "agent": "B", "action": "two, revised", "old_agent": "B", "old_action": "two"}
+    ]
+    assert diff["added"] == [{"index": 3, "agent": "D", "action": "four"}]
+    assert diff["removed"] == []
+
+    assert diff_plan_steps(new, new) == {"added": [], "removed": [], "changed": []}
+    assert diff_plan_steps(old, old[:1])["removed"] == [
+        {"index": 1, "agent": "B", "action": "two"},
+        {"index": 2, "agent": "C", "action": "three"},
+    ]
+
+
+class _ScriptedChatService(ChatCompletionClientBase):
+    """Chat service that replays canned completions in order."""
+
+    SUPPORTS_FUNCTION_CALLING: bool = True
+    replies: list = []
+    streamed_replies: list = []
+
+    def _verify_function_choice_settings(self, settings):
+        pass
+
+    def get_prompt_execution_settings_class(self):
+        return OpenAIChatPromptExecutionSettings
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        return [ChatMessageContent(role=AuthorRole.ASSISTANT, content=self.replies.pop(0))]
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        reply = self.streamed_replies.pop(0)
+        for i in range(0, len(reply), 7):
+            yield [StreamingChatMessageContent(role=AuthorRole.ASSISTANT, content=reply[i:i + 7], choice_index=0)]
+
+
+def test_replan_sends_only_the_diff():
+    replanned = PLAN.replace("draft the release", "draft and publish the release")
+    service = _ScriptedChatService(
+        ai_model_id="test",
+        # facts for plan(), then updated facts and the new plan for replan()
+        replies=["facts", "facts", replanned],
+        streamed_replies=[PLAN],
+    )
+    manager = HumanApprovalMagenticManager(
+        user_id="replan-user",
+        chat_completion_service=service,
+        prompt_execution_settings=OpenAIChatPromptExecutionSettings(),
+    )
+    context = MagenticContext(
+        task=ChatMessageContent(role=AuthorRole.USER, content="Launch"),
+        chat_history=ChatHistory(),
+        participant_descriptions={name: name for name in TEAM},
+    )
+    queue = connection_config.subscribe_events("replan-user")
+
+    async def run():
+        await manager._plan_streaming_steps(context)
+        plan_id = manager.magentic_plan.id
+        await manager.replan(context)
+        return plan_id
+
+    plan_id = asyncio.run(run())
+    connection_config.unsubscribe_events("replan-user", queue)
+
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    step_events = [payload for _, event_type, payload in events if event_type == "plan_step_streaming"]
+    assert len(step_events) == 2 and f'"m_plan_id": "{plan_id}"' in step_events[0]
+    replan_events = [payload for _, event_type, payload in events if event_type == "replan"]
+    assert len(replan_events) == 1
+    assert '"changed": [{"old_index": 1, "index": 1' in replan_events[0]
+    assert '"added": []' in replan_events[0]
+    assert manager.magentic_plan.id == plan_id
+    assert manager.magentic_plan.steps[1].action == "to draft and publish the release"
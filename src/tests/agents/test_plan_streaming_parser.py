@@ -0,0 +1,94 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from v3.orchestration.helper.plan_to_mplan_converter import \
+    PlanToMPlanConverter
+
+TEAM = ["ProductAgent", "MarketingAgent", "ProxyAgent"]
+
+# Building blocks for randomly generated plans, including the awkward cases:
+# sub-bullets, blank bullets, non-bullet prose, CRLF / CR line endings and
+# agent names that are not on the team.
+LINE_PARTS = [
+    "- **ProductAgent** to describe the product line",
+    "- **MarketingAgent** to draft the press release",
+    "* ProxyAgent to ask the user for the launch date",
+    "• **UnknownAgent** to do something off-team",
+    "  - **ProductAgent** to review  the   outline",
+    "- ",
+    "-    ",
+    "Plan overview:",
+    "",
+    "- plain step with no agent at all",
+    "- **MarketingAgent**",
+    "\t* marketingagent to check casing",
+]
+LINE_ENDINGS = ["\n", "\r\n", "\r", "\n\n"]
+
+
+def _random_plan(rng: random.Random) -> str:
+    lines = [rng.choice(LINE_PARTS) + rng.choice(LINE_ENDINGS) for _ in range(rng.randint(0, 12))]
+    text = "".join(lines)
+    if text and rng.random() < 0.5:
+        # Half of the plans do not end with a line break
+        text = text.rstrip("\r\n")
+    return text
+
+
+def _random_chunks(rng: random.Random, text: str) -> list[str]:
+    if not text:
+        return []
+    cuts = sorted(set(rng.randint(0, len(text)) for _ in range(rng.randint(0, 20))))
+    bounds = [0] + cuts + [len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("enable_sub_bullets", [False, True])
+def test_streaming_parse_matches_batch_parse(enable_sub_bullets):
+    rng = random.Random(42)
+    for _ in range(300):
+        plan_text = _random_plan(rng)
+        converter = PlanToMPlanConverter(
+            team=TEAM, task="Launch", facts="Facts", enable_sub_bullets=enable_sub_bullets
+        )
+        expected = converter.parse(plan_text)
+        expected_levels = getattr(converter, "last_step_levels", None)
+
+        streaming_converter = PlanToMPlanConverter(
+            team=TEAM, task="Launch", facts="Facts", enable_sub_bullets=enable_sub_bullets
+        )
+        parser = streaming_converter.stream()
+        emitted = []
+        for chunk in _random_chunks(rng, plan_text):
+            emitted.extend(parser.feed(chunk))
+        actual = parser.finish()
+
+        assert actual.model_dump(exclude={"id"}) == expected.model_dump(exclude={"id"})
+        assert emitted == actual.steps[: len(emitted)]
+        assert getattr(streaming_converter, "last_step_levels", None) == expected_levels
+
+
+def test_steps_are_emitted_as_soon_as_their_line_completes():
+    parser = PlanToMPlanConverter(team=TEAM).stream()
+
+    assert parser.feed("- **ProductAgent** to describe") == []
+    steps = parser.feed(" the product\n- **Marketing")
+    assert [(s.agent, s.action) for s in steps] == [("ProductAgent", "to describe the product")]
+
+    assert parser.feed("Agent** to draft") == []
+    mplan = parser.finish()
+    assert [s.agent for s in mplan.steps] == ["ProductAgent", "MarketingAgent"]
+
+
+def test_feed_after_finish_is_rejected():
+    parser = PlanToMPlanConverter(team=TEAM).stream()
+    parser.finish()
+    with pytest.raises(ValueError):
+        parser.feed("- **ProductAgent** late step\n")
@@ -0,0 +1,90 @@
+"""
+Tests for ReasoningSearch: async shared clients, concurrent queries and result caching.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Provide safe defaults for vars that app_config reads at import-time
+os.environ.setdefault("APPLICATIONINSIGHTS_CONNECTION_STRING", "InstrumentationKey=mock")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://mock-openai-endpoint")
+os.environ.setdefault("AZURE_AI_SUBSCRIPTION_ID", "00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("AZURE_AI_RESOURCE_GROUP", "rg-test")
+os.environ.setdefault("AZURE_AI_PROJECT_NAME", "proj-test")
+os.environ.setdefault("AZURE_AI_AGENT_ENDPOINT", "https://agents.example.com/")
+
+# Add the backend path to sys.path so we can import v3 modules
+backend_path = Path(__file__).parent.parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from semantic_kernel import Kernel  # noqa: E402
+from v3.magentic_agents import reasoning_search  # noqa: E402
+from v3.magentic_agents.models.agent_models import SearchConfig  # noqa: E402
+from v3.magentic_agents.reasoning_search import ReasoningSearch  # noqa: E402
+
+
+class FakeSearchClient:
+    """Async search client stand-in; each search takes 0.2 s."""
+
+    instances = []
+
+    def __init__(self, endpoint, credential, index_name):
+        self.index_name = index_name
+        self.searches = []
+        self.closed = False
+        FakeSearchClient.instances.append(self)
+
+    async def search(self, search_text, query_type, select, top):
+        self.searches.append(search_text)
+        await asyncio.sleep(0.2)
+
+        async def results():
+            for n in range(top):
+                # Every query also finds the shared document
+                yield {"content": "shared" if n == 0 else f"{search_text} #{n}"}
+
+        return results()
+
+    async def close(self):
+        self.closed = True
+
+
+def test_queries_run_concurrently_on_one_shared_client_and_are_cached(monkeypatch):
+    monkeypatch.setattr(reasoning_search, "SearchClient", FakeSearchClient)
+    FakeSearchClient.instances.clear()
+    reasoning_search._results_cache.invalidate()
+    config = SearchConfig(endpoint="https://search.example.com", index_name="docs", api_key="key")
+
+    async def scenario():
+        searches = [ReasoningSearch(config), ReasoningSearch(config)]
+        for search in searches:
+            assert await search.initialize(Kernel())
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        results = await searches[0].search_documents("vacation", limit="2", queries=["payroll", "vacation"])
+        elapsed = time.perf_counter() - started
+        ticking.cancel()
+
+        cached = await searches[1].search_documents("payroll", limit="2")
+        await reasoning_search.close_search_clients()
+        return results, cached, elapsed, ticks, searches[0].metrics
+
+    results, cached, elapsed, ticks, metrics = asyncio.run(scenario())
+    (client,) = FakeSearchClient.instances
+    assert results == ["content: shared", "content: vacation #1", "content: payroll #1"]
+    assert cached == ["content: shared", "content: payroll #1"]
+    assert sorted(client.searches) == ["payroll", "vacation"] and client.closed
+    assert elapsed < 0.35 and ticks >= 10  # both queries overlapped without blocking the loop
+    assert metrics["queries"] == 2 and metrics["searches"] == 2 and metrics["search_ms_max"] >= 150
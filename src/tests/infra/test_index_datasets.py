@@ -0,0 +1,158 @@
+"""
+Tests for the dataset indexer, against local stand-ins for Blob Storage and AI Search.
+"""
+
+import hashlib
+import importlib.util
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+script_path = Path(__file__).parent.parent.parent.parent / "infra" / "scripts" / "index_datasets.py"
+spec = importlib.util.spec_from_file_location("index_datasets", script_path)
+index_datasets = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(index_datasets)
+
+
+class FakeContainer:
+    """Blob container stand-in; downloads take a moment so they can overlap."""
+
+    def __init__(self, blobs):
+        self.blobs = dict(blobs)
+        self.downloads = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def list_blobs(self):
+        return [
+            SimpleNamespace(name=name, etag=hashlib.md5(data).hexdigest(), content_settings=None)
+            for name, data in self.blobs.items()
+        ]
+
+    def download_blob(self, name):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.downloads.append(name)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return SimpleNamespace(readall=lambda: self.blobs[name])
+
+
+class FakeSearch:
+    """Search client stand-in keeping documents in a dict."""
+
+    def __init__(self, documents=None, failing_titles=()):
+        self.documents = dict(documents or {})
+        self.failing_titles = set(failing_titles)
+        self.batches = []
+
+    def upload_documents(self, documents):
+        self.batches.append(len(json.dumps(documents)))
+        results = []
+        for document in documents:
+            failed = document["title"] in self.failing_titles
+            if not failed:
+                self.documents[document["id"]] = document
+            results.append(SimpleNamespace(key=document["id"], succeeded=not failed, error_message="rejected"))
+        return results
+
+    def delete_documents(self, documents):
+        for document in documents:
+            self.documents.pop(document["id"], None)
+        return [SimpleNamespace(key=document["id"], succeeded=True) for document in documents]
+
+    def search(self, search_text, select):
+        return [{"id": key} for key in self.documents]
+
+    def get_document_count(self):
+        return len(self.documents)
+
+
+def _run(container, search, manifest, **kwargs):
+    return index_datasets.index_blobs(
+        container, search, str(manifest), chunk_chars=200, max_batch_bytes=1500, log=lambda line: None, **kwargs
+    )
+
+
+def test_chunking_repeats_csv_header_and_splits_long_lines():
+    rows = "".join(f"row {i},value\n" for i in range(30))
+    documents = index_datasets.blob_documents("data/sales.csv", "name,value\n" + rows, 100)
+    assert len(documents) > 1 and {d["title"] for d in documents} == {"data/sales"}
+    assert all(d["content"].startswith("name,value\n") and len(d["content"]) <= 100 for d in documents)
+    assert "".join(d["content"][len("name,value\n"):] for d in documents) == rows
+
+    chunks = index_datasets.chunk_text("x" * 250, 100)
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+
+def test_first_run_indexes_everything_in_bounded_batches(tmp_path):
+    blobs = {f"file{i}.json": (f'{{"n": {i}}}\n' * 40).encode() for i in range(6)}
+    blobs["broken.csv"] = b"\xff\xfe"
+    container = FakeContainer(blobs)
+    search = FakeSearch(documents={"1": {"id": "1"}})  # left over from the previous indexer
+
+    stats = _run(container, search, tmp_path / "manifest.json", download_concurrency=4)
+
+    assert stats["blobs_indexed"] == 6 and stats["blobs_failed"] == 1 and stats["documents_failed"] == 0
+    assert container.peak > 1
+    assert max(search.batches) <= 1500 and len(search.batches) > 1
+    assert "1" not in search.documents and stats["documents_deleted"] == 1
+    assert stats["documents_uploaded"] == len(search.documents) > 6
+
+
+def test_later_runs_skip_unchanged_blobs_and_remove_stale_documents(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    container = FakeContainer({"keep.json": b"{}\n" * 100, "shrink.json": b"{}\n" * 200, "gone.json": b"{}\n"})
+    search = FakeSearch()
+    _run(container, search, manifest)
+    shrink_ids = {key for key, d in search.documents.items() if d["title"] == "shrink"}
+
+    container.blobs["shrink.json"] = b"[]\n"
+    del container.blobs["gone.json"]
+    container.downloads.clear()
+    stats = _run(container, search, manifest)
+
+    assert container.downloads == ["shrink.json"]
+    assert stats["blobs_unchanged"] == 1 and stats["blobs_indexed"] == 1
+    assert {d["title"] for d in search.documents.values()} == {"keep", "shrink"}
+    assert {key for key, d in search.documents.items() if d["title"] == "shrink"} < shrink_ids
+    # All but one chunk of shrink.json, plus the only document of gone.json
+    assert stats["documents_deleted"] == len(shrink_ids)
+
+
+def test_failed_uploads_are_retried_on_the_next_run(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    container = FakeContainer({"a.json": b"{}\n", "b.json": b"{}\n"})
+    search = FakeSearch(failing_titles={"b"})
+    stats = _run(container, search, manifest)
+    assert stats["blobs_indexed"] == 1 and stats["blobs_failed"] == 1
+
+    search.failing_titles.clear()
+    container.downloads.clear()
+    stats = _run(container, search, manifest)
+    assert container.downloads == ["b.json"] and stats["blobs_indexed"] == 1
+    assert {d["title"] for d in search.documents.values()} == {"a", "b"}
+
+
+def test_manifest_of_another_target_or_a_recreated_index_is_not_used(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    container = FakeContainer({"a.json": b"{}\n" * 100, "b.json": b"{}\n"})
+    target = {"storage_account": "st1", "container": "data", "search_endpoint": "https://s1", "index_name": "idx"}
+    first = FakeSearch()
+    _run(container, first, manifest, target=target)
+
+    # Same target, but the index was recreated: everything is uploaded again
+    recreated = FakeSearch()
+    stats = _run(container, recreated, manifest, target=target)
+    assert stats["blobs_indexed"] == 2 and recreated.documents == first.documents
+
+    # Another search service: the manifest is ignored even though its index looks complete
+    other = FakeSearch(documents=first.documents)
+    container.downloads.clear()
+    stats = _run(container, other, manifest, target={**target, "search_endpoint": "https://s2"})
+    assert sorted(container.downloads) == ["a.json", "b.json"] and stats["blobs_unchanged"] == 0
@@ -0,0 +1,87 @@
+"""
+Startup time and memory of the data tools with and without the columnar cache.
+
+Writes a synthetic CSV, then measures in fresh processes:
+  - csv read:     data_provider's approach, reading the whole file as text
+  - csv parse:    parsing the CSV into columnar tables (no cache)
+  - cache build:  first start with an empty cache dir (parse + convert)
+  - cache map:    later starts / other workers, mapping the converted copy
+Each child reports wall time and its peak RSS after answering one query.
+Run from the repository root (Linux):
+
+    python src/tests/mcp_server/benchmarks/bench_column_cache.py [rows]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+MCP_SERVER = str(Path(__file__).parent.parent.parent.parent / "mcp_server")
+
+CHILD = r"""
+import resource, sys, time
+sys.path.insert(0, {mcp_server!r})
+from core.column_cache import ColumnCache
+from core.dataset_catalog import DatasetCatalog
+from core.table_query import run_query
+from core.table_store import TableStore
+
+mode, data_dir, cache_dir = sys.argv[1:4]
+start = time.perf_counter()
+catalog = DatasetCatalog(data_dir)
+entry = catalog.get("purchase_history.csv")
+if mode == "csv read":
+    with open(entry.path, "r", encoding="utf-8") as file:
+        text = file.read()
+    elapsed = time.perf_counter() - start
+else:
+    store = TableStore(catalog, cache=ColumnCache(cache_dir) if mode != "csv parse" else None)
+    table = store.get("purchase_history.csv")
+    elapsed = time.perf_counter() - start
+    run_query(table, filters=[{{"column": "Amount", "op": ">", "value": 400}}], sort_by=["-Amount"], limit=20)
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_csv(path: str, rows: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    products = np.array([f"Product {i:04d}" for i in range(2000)])
+    customers = rng.integers(0, 50_000, rows).tolist()
+    product = products[rng.integers(0, len(products), rows)].tolist()
+    quantity = rng.integers(1, 10, rows).tolist()
+    amount = np.round(rng.gamma(2.0, 60.0, rows), 2).tolist()
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("OrderID,CustomerID,Product,Quantity,Amount\n")
+        for i in range(rows):
+            file.write(f"O{i},C{customers[i]},{product[i]},{quantity[i]},{amount[i]}\n")
+
+
+def run_child(mode: str, data_dir: str, cache_dir: str):
+    script = CHILD.format(mcp_server=MCP_SERVER)
+    output = subprocess.run(
+        [sys.executable, "-c", script, mode, data_dir, cache_dir], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), int(output[1]) / 1024  # seconds, MiB (ru_maxrss is KiB on Linux)
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as work:
+        data_dir = os.path.join(work, "data")
+        cache_dir = os.path.join(work, "cache")
+        os.makedirs(data_dir)
+        path = os.path.join(data_dir, "purchase_history.csv")
+        write_csv(path, rows)
+        print(f"{rows:,} rows, {os.path.getsize(path) / 2**20:.1f} MiB CSV")
+        print(f"  {'':<12} {'startup':>10} {'peak RSS':>10}")
+        for mode in ("csv read", "csv parse", "cache build", "cache map", "cache map"):
+            elapsed, rss = run_child(mode, data_dir, cache_dir)
+            print(f"  {mode:<12} {elapsed * 1e3:8.0f} ms {rss:7.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
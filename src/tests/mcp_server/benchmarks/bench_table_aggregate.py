@@ -0,0 +1,83 @@
+"""
+Latency benchmark for query_table / aggregate_table on synthetic tables.
+
+Builds a 10^6-row customer table in memory and times typical agent questions.
+Run from the repository root:
+
+    python src/tests/mcp_server/benchmarks/bench_table_aggregate.py [rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "mcp_server"))
+
+from core.table_aggregate import run_aggregate  # noqa: E402
+from core.table_query import run_query  # noqa: E402
+from core.table_store import Column, Table  # noqa: E402
+
+
+def synthetic_table(rows: int, seed: int = 0) -> Table:
+    rng = np.random.default_rng(seed)
+    segments = np.array(sorted(["Basic", "Gold", "Platinum", "Premium", "Silver"]))
+    products = np.array(sorted(f"Product {i:04d}" for i in range(2000)))
+
+    def text(name, categories, codes, null_rate=0.0):
+        nulls = rng.random(rows) < null_rate
+        return Column(name, "str", np.where(nulls, -1, codes).astype(np.int32), nulls, categories)
+
+    def number(name, values, null_rate=0.0):
+        nulls = rng.random(rows) < null_rate
+        kind = "int" if values.dtype.kind == "i" else "float"
+        return Column(name, kind, values, nulls)
+
+    columns = [
+        text("Segment", segments, rng.integers(0, len(segments), rows), 0.01),
+        text("Product", products, rng.integers(0, len(products), rows)),
+        number("Churned", rng.integers(0, 2, rows).astype(np.int64)),
+        number("Returned", (rng.random(rows) < 0.08).astype(np.int64)),
+        number("Spend", rng.gamma(2.0, 60.0, rows), 0.02),
+    ]
+    return Table("synthetic", {c.name: c for c in columns}, rows, column_order=[c.name for c in columns])
+
+
+CASES = {
+    "churn rate by segment": lambda t: run_aggregate(t, ["Segment"], ["count", "mean(Churned)"]),
+    "return rate per product (top 20)": lambda t: run_aggregate(
+        t, ["Product"], ["count", "mean(Returned)"], sort_by=["-mean(Returned)"], limit=20
+    ),
+    "spend percentiles by segment": lambda t: run_aggregate(
+        t, ["Segment"], ["min(Spend)", "median(Spend)", "p90(Spend)", "max(Spend)"]
+    ),
+    "segment x product sums, filtered": lambda t: run_aggregate(
+        t, ["Segment", "Product"], ["sum(Spend)"], filters=[{"column": "Churned", "op": "==", "value": 1}]
+    ),
+    "query: top spenders in Premium": lambda t: run_query(
+        t,
+        columns=["Product", "Spend"],
+        filters=[{"column": "Segment", "op": "==", "value": "Premium"}, {"column": "Spend", "op": ">", "value": 200}],
+        sort_by=["-Spend"],
+        limit=20,
+    ),
+}
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    table = synthetic_table(rows)
+    print(f"{rows:,} rows")
+    for name, case in CASES.items():
+        case(table)  # warm-up
+        runs = 5
+        start = time.perf_counter()
+        for _ in range(runs):
+            case(table)
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"  {name:<36} {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Tests for the memory-mapped columnar dataset cache.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+import core.column_cache as column_cache  # noqa: E402
+from core.column_cache import ColumnCache  # noqa: E402
+from core.dataset_catalog import DatasetCatalog  # noqa: E402
+from core.table_query import run_query  # noqa: E402
+from core.table_store import TableStore, load_csv  # noqa: E402
+
+CSV = (
+    "CustomerID,Segment,ChurnRate,Visits\n"
+    "C1,Premium,0.25,10\n"
+    "C2,Basic,0.10,\n"
+    'C3,"Premium, Plus",0.40,3\n'
+    "C4,,0.05,7\n"
+)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    (tmp_path / "data").mkdir()
+    path = tmp_path / "data" / "customer_churn_analysis.csv"
+    path.write_text(CSV)
+    catalog = DatasetCatalog(str(tmp_path / "data"), poll_interval=0)
+    return path, catalog, str(tmp_path / "cache")
+
+
+def _count_conversions(monkeypatch):
+    calls = []
+    original = column_cache.load_csv
+    monkeypatch.setattr(column_cache, "load_csv", lambda *a, **k: calls.append(a) or original(*a, **k))
+    return calls
+
+
+def test_mapped_table_matches_csv(dataset):
+    path, catalog, cache_dir = dataset
+    ColumnCache(cache_dir).load(catalog.get(path.name))
+
+    # A fresh cache instance (another worker) maps the converted copy
+    table = ColumnCache(cache_dir).load(catalog.get(path.name))
+    parsed = load_csv(str(path), name="customer_churn_analysis")
+
+    assert table.column_order == parsed.column_order
+    assert {n: c.kind for n, c in table.columns.items()} == {n: c.kind for n, c in parsed.columns.items()}
+    assert not table.columns["ChurnRate"].values.flags.writeable  # backed by the read-only mapping
+    query = dict(filters=[{"column": "Segment", "op": "contains", "value": "prem"}], sort_by=["-ChurnRate"])
+    assert run_query(table, **query) == run_query(parsed, **query)
+
+
+def test_touch_keeps_cache_and_edit_reconverts(dataset, monkeypatch):
+    path, catalog, cache_dir = dataset
+    cache = ColumnCache(cache_dir)
+    cache.load(catalog.get(path.name))
+    conversions = _count_conversions(monkeypatch)
+
+    os.utime(path, (1, 1))  # same content, new mtime: re-hash only
+    cache.load(catalog.get(path.name))
+    assert conversions == []
+
+    path.write_text(CSV + "C5,Basic,0.5,1\n")
+    table = cache.load(catalog.get(path.name))
+    assert len(conversions) == 1
+    assert table.num_rows == 5
+    data_dirs = [name for name in os.listdir(cache_dir) if not name.endswith(".json")]
+    assert len(data_dirs) == 1  # the previous version was removed
+
+
+def test_table_store_uses_cache_and_falls_back_to_csv(dataset, monkeypatch):
+    path, catalog, cache_dir = dataset
+    store = TableStore(catalog, cache=ColumnCache(cache_dir))
+    assert store.warm() == 1
+    assert os.path.exists(os.path.join(cache_dir, f"{path.name}.json"))
+
+    def unavailable(entry):
+        raise OSError("read-only file system")
+
+    store = TableStore(catalog, cache=ColumnCache(cache_dir))
+    monkeypatch.setattr(store.cache, "load", unavailable)
+    assert store.get(path.name).num_rows == 4
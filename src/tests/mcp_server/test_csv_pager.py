@@ -0,0 +1,98 @@
+"""
+Tests for paged CSV reads and the read_table_page tool.
+"""
+
+import asyncio
+import csv
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.csv_pager import read_page  # noqa: E402
+from core.dataset_catalog import DatasetCatalog  # noqa: E402
+from core.table_query import QueryError  # noqa: E402
+
+CSV = (
+    "id,comment\r\n"
+    "1,plain\r\n"
+    '2,"multi\nline, with ""quotes"""\r\n'
+    "\r\n"
+    "3,\r\n"
+    '4,"x"\r\n'
+    "5,last"
+)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    (tmp_path / "product_table.csv").write_bytes(CSV.encode("utf-8"))
+    return DatasetCatalog(str(tmp_path), poll_interval=0)
+
+
+def _read_all(catalog, page_size, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = read_page(catalog.get("product_table.csv"), cursor, page_size, **kwargs)
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 10])
+def test_pages_concatenate_to_the_whole_table(catalog, page_size):
+    expected = [row for row in csv.reader(io.StringIO(CSV, newline="")) if row][1:]
+    pages = _read_all(catalog, page_size)
+    assert [row for page in pages for row in page["rows"]] == expected
+    assert all(page["columns"] == ["id", "comment"] for page in pages)
+    assert [page["start_row"] for page in pages] == list(range(0, len(expected), page_size))
+
+
+def test_page_byte_limit_still_returns_a_row(catalog):
+    pages = _read_all(catalog, 100, max_bytes=1)
+    assert [page["returned_rows"] for page in pages] == [1] * 5
+
+
+def test_trailing_blank_lines_do_not_make_an_empty_page(tmp_path):
+    (tmp_path / "product_table.csv").write_text("id\n1\n2\n\n\r\n  \n")
+    catalog = DatasetCatalog(str(tmp_path), poll_interval=0)
+    pages = _read_all(catalog, 2)
+    assert [page["rows"] for page in pages] == [[["1"], ["2"]]]
+
+
+def test_stale_or_malformed_cursor_is_rejected(catalog, tmp_path):
+    cursor = read_page(catalog.get("product_table.csv"), None, 2)["next_cursor"]
+    with pytest.raises(QueryError):
+        read_page(catalog.get("product_table.csv"), "not-a-cursor")
+
+    (tmp_path / "product_table.csv").write_text("id,comment\n9,new\n")
+    os.utime(tmp_path / "product_table.csv", (1, 1))
+    with pytest.raises(QueryError, match="changed"):
+        read_page(catalog.get("product_table.csv"), cursor)
+
+
+def test_read_table_page_tool(tmp_path):
+    from fastmcp import Client, FastMCP
+    from services.data_tool_service import DataToolService
+
+    (tmp_path / "product_table.csv").write_text(CSV)
+    mcp = FastMCP("test")
+    DataToolService(str(tmp_path)).register_tools(mcp)
+
+    async def call(arguments):
+        async with Client(mcp) as client:
+            return (await client.call_tool("read_table_page", arguments)).structured_content
+
+    first = asyncio.run(call({"tablename": "product_table", "page_size": 4}))
+    second = asyncio.run(call({"tablename": "product_table", "cursor": first["next_cursor"]}))
+    assert [row[0] for row in first["rows"] + second["rows"]] == ["1", "2", "3", "4", "5"]
+    assert second["next_cursor"] is None
+
+    assert asyncio.run(call({"tablename": "secrets"})) == {"error": "File 'secrets.csv' is not allowed."}
@@ -0,0 +1,92 @@
+"""
+Tests for the dataset catalog used by the data tools.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.dataset_catalog import DatasetCatalog, count_rows  # noqa: E402
+from services.data_tool_service import DataToolService  # noqa: E402
+
+
+@pytest.fixture
+def dataset_dir(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "product_table.csv").write_text("id,name\n1,a\n2,b\n")
+    (tmp_path / "nested" / "purchase_history.csv").write_text("id\n1\n2\n3")
+    (tmp_path / "nested" / "notes.txt").write_text("not a dataset\n")
+    return tmp_path
+
+
+def test_count_rows_handles_missing_trailing_newline(tmp_path):
+    path = tmp_path / "t.csv"
+    path.write_text("h\n1\n2")
+    assert count_rows(str(path)) == 2
+    path.write_text("h\n")
+    assert count_rows(str(path)) == 0
+
+
+def test_count_rows_counts_records_not_lines(tmp_path):
+    path = tmp_path / "t.csv"
+    path.write_text('id,note\n1,"two\nlines"\n\n2,plain\n\n\n')
+    assert count_rows(str(path)) == 2
+
+
+def test_catalog_indexes_allowed_files_once(dataset_dir, monkeypatch):
+    catalog = DatasetCatalog(
+        str(dataset_dir), allowed_files={"product_table.csv", "purchase_history.csv"}
+    )
+
+    walks = []
+    monkeypatch.setattr(os, "walk", lambda *a, **k: walks.append(a) or iter(()))
+
+    entry = catalog.get("purchase_history.csv")
+    assert entry.path == str(dataset_dir / "nested" / "purchase_history.csv")
+    assert entry.row_count == 3
+    assert catalog.get("notes.txt") is None
+    assert [e.filename for e in catalog.entries()] == ["product_table.csv", "purchase_history.csv"]
+    assert walks == []
+
+
+def test_catalog_picks_up_changes_after_poll_interval(dataset_dir):
+    catalog = DatasetCatalog(str(dataset_dir), poll_interval=0)
+    version = catalog.version
+
+    (dataset_dir / "product_table.csv").write_text("id,name\n1,a\n2,b\n3,c\n4,d\n")
+    os.utime(dataset_dir / "product_table.csv", (1, 1))
+    assert catalog.get("product_table.csv").row_count == 4
+    assert catalog.version > version
+
+    (dataset_dir / "nested" / "new.csv").write_text("x\n1\n")
+    os.utime(dataset_dir / "nested", (2, 2))
+    assert catalog.find("new.csv") == str(dataset_dir / "nested" / "new.csv")
+
+
+def test_version_nowait_polls_in_a_background_thread(dataset_dir, monkeypatch):
+    catalog = DatasetCatalog(str(dataset_dir), poll_interval=0)
+    version = catalog.version
+    release, polled = threading.Event(), threading.Event()
+    poll = catalog._poll
+    monkeypatch.setattr(catalog, "_poll", lambda: (release.wait(5), poll(), polled.set()))
+
+    (dataset_dir / "nested" / "new.csv").write_text("x\n1\n")
+    os.utime(dataset_dir / "nested", (2, 2))
+    assert catalog.version_nowait() == version  # answered while the poll is still running
+    release.set()
+    assert polled.wait(5)
+    assert catalog.version_nowait() > version
+
+
+def test_data_tool_service_uses_catalog(dataset_dir):
+    service = DataToolService(str(dataset_dir))
+    assert service._find_file("product_table.csv") == str(dataset_dir / "product_table.csv")
+    assert service._find_file("customer_profile.csv") is None
+    assert service.tool_count == 6
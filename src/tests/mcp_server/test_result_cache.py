@@ -0,0 +1,125 @@
+"""
+Tests for the opt-in tool result cache.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.factory import Domain, MCPToolBase, MCPToolFactory  # noqa: E402
+from core.result_cache import CACHE_META_KEY  # noqa: E402
+
+
+class CountingService(MCPToolBase):
+    def __init__(self, ttl: float = 60):
+        super().__init__(Domain.GENERAL)
+        self.ttl = ttl
+        self.calls = 0
+
+    def register_tools(self, mcp):
+        @mcp.tool()
+        @self.cached(ttl=self.ttl)
+        async def lookup(key: str, verbose: bool = False) -> dict:
+            """Count calls."""
+            self.calls += 1
+            return {"key": key, "call": self.calls}
+
+        @mcp.tool()
+        async def uncached(key: str) -> dict:
+            """Never cached."""
+            self.calls += 1
+            return {"call": self.calls}
+
+    @property
+    def tool_count(self) -> int:
+        return 2
+
+
+def _call_all(mcp, calls):
+    from fastmcp import Client
+
+    async def scenario():
+        async with Client(mcp) as client:
+            results = []
+            for name, arguments in calls:
+                if name == "sleep":
+                    await asyncio.sleep(arguments)
+                    continue
+                result = await client.call_tool(name, arguments)
+                results.append((result.structured_content, (result.content[0].meta or {}).get(CACHE_META_KEY)))
+            return results
+
+    return asyncio.run(scenario())
+
+
+def test_equivalent_calls_hit_and_carry_cache_meta():
+    factory = MCPToolFactory()
+    service = CountingService()
+    factory.register_service(service)
+    mcp = factory.create_mcp_server(name="test")
+
+    results = _call_all(
+        mcp,
+        [
+            ("lookup", {"key": "a"}),
+            ("lookup", {"verbose": False, "key": "a"}),  # defaults and key order do not matter
+            ("lookup", {"key": "b"}),
+            ("uncached", {"key": "a"}),
+            ("uncached", {"key": "a"}),
+        ],
+    )
+    assert [r[0]["call"] for r in results] == [1, 1, 2, 3, 4]
+    assert [r[1]["status"] if r[1] else None for r in results] == ["miss", "hit", "miss", None, None]
+    assert results[1][1]["ttl_seconds"] == 60
+    assert factory.result_cache.stats()["hits"] == {"lookup": 1}
+
+
+def test_ttl_expiry_and_lru_bound():
+    factory = MCPToolFactory(cache_max_entries=1)
+    factory.register_service(CountingService(ttl=0.05))
+    mcp = factory.create_mcp_server(name="test")
+
+    results = _call_all(
+        mcp,
+        [
+            ("lookup", {"key": "a"}),
+            ("sleep", 0.1),
+            ("lookup", {"key": "a"}),  # expired
+            ("lookup", {"key": "b"}),  # evicts "a"
+            ("lookup", {"key": "a"}),
+        ],
+    )
+    assert [r[1]["status"] for r in results] == ["miss", "miss", "miss", "miss"]
+    assert factory.result_cache.stats()["entries"] == 1
+
+
+def test_data_tools_are_invalidated_by_dataset_changes(tmp_path):
+    from services.data_tool_service import DataToolService
+
+    path = tmp_path / "product_table.csv"
+    path.write_text("id\n1\n")
+    service = DataToolService(str(tmp_path), poll_interval=0)
+    factory = MCPToolFactory()
+    factory.register_service(service)
+    mcp = factory.create_mcp_server(name="test")
+
+    first, second = _call_all(
+        mcp, [("data_provider", {"tablename": "product_table"}), ("data_provider", {"tablename": "product_table.csv"})]
+    )
+    assert second[1]["status"] == "hit" and second[0] == first[0]
+
+    version = service.catalog.version
+    path.write_text("id\n1\n2\n")
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    # The catalog polls in the background; the cache sees the change once that poll lands
+    deadline = time.monotonic() + 5
+    while service.catalog.version_nowait() == version and time.monotonic() < deadline:
+        time.sleep(0.01)
+    ((content, meta),) = _call_all(mcp, [("data_provider", {"tablename": "product_table"})])
+    assert meta["status"] == "miss" and content["result"] == "id\n1\n2\n"
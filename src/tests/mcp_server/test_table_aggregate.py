@@ -0,0 +1,121 @@
+"""
+Tests for vectorized group-by aggregation.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.table_aggregate import parse_metric, run_aggregate  # noqa: E402
+from core.table_query import QueryError  # noqa: E402
+from core.table_store import load_csv  # noqa: E402
+
+CSV = (
+    "CustomerID,Segment,Region,Churned,Spend\n"
+    "C1,Premium,North,1,120.5\n"
+    "C2,Basic,North,0,40\n"
+    "C3,Premium,South,0,300\n"
+    "C4,Basic,South,1,\n"
+    "C5,,North,1,80\n"
+    "C6,Premium,North,0,100\n"
+)
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "customer_churn_analysis.csv"
+    path.write_text(CSV)
+    return load_csv(str(path), name="customer_churn_analysis")
+
+
+def test_parse_metric_forms():
+    assert parse_metric("count") == ("count", None, None, "count")
+    assert parse_metric("mean(Spend)") == ("mean", "Spend", None, "mean(Spend)")
+    assert parse_metric("p90(Spend)") == ("percentile", "Spend", 90.0, "p90(Spend)")
+    assert parse_metric("median(Spend)") == ("percentile", "Spend", 50.0, "median(Spend)")
+    assert parse_metric({"op": "percentile", "column": "Spend", "q": 25}) == ("percentile", "Spend", 25.0, "p25(Spend)")
+    with pytest.raises(QueryError):
+        parse_metric("stddev(Spend)")
+    with pytest.raises(QueryError):
+        parse_metric("sum")
+
+
+def test_group_by_with_null_group_last(table):
+    result = run_aggregate(table, ["Segment"], ["count", "mean(Churned)", "sum(Spend)", "count(Spend)"])
+    assert result["columns"] == ["Segment", "count", "mean(Churned)", "sum(Spend)", "count(Spend)"]
+    assert result["rows"] == [
+        ["Basic", 2, 0.5, 40, 1],
+        ["Premium", 3, 0.333333, 520.5, 3],
+        [None, 1, 1.0, 80, 1],
+    ]
+    assert result["groups"] == 3
+    assert result["truncated"] is False
+
+
+def test_min_max_and_percentiles_match_numpy(tmp_path):
+    rng = np.random.default_rng(0)
+    spend = rng.normal(100, 30, 1000)
+    groups = rng.integers(0, 7, 1000)
+    lines = ["Group,Spend"] + [f"g{g},{v}" for g, v in zip(groups, spend)]
+    path = tmp_path / "big.csv"
+    path.write_text("\n".join(lines) + "\n")
+    big = load_csv(str(path))
+
+    result = run_aggregate(big, ["Group"], ["min(Spend)", "max(Spend)", "p10(Spend)", "median(Spend)", "p99(Spend)"])
+    for row in result["rows"]:
+        values = spend[groups == int(row[0][1:])]
+        expected = [values.min(), values.max(), *np.percentile(values, [10, 50, 99])]
+        assert row[1:] == pytest.approx(expected, abs=1e-5)
+
+
+def test_multi_column_groups_filters_sort_and_limit(table):
+    result = run_aggregate(
+        table,
+        ["Region", "Segment"],
+        ["count", "max(Spend)"],
+        filters=[{"column": "Churned", "op": "==", "value": 0}],
+        sort_by=["-max(Spend)"],
+        limit=2,
+    )
+    assert result["rows"] == [["South", "Premium", 1, 300.0], ["North", "Premium", 1, 100.0]]
+    assert result["matched_rows"] == 3
+    assert result["groups"] == 3
+    assert result["truncated"] is True
+
+
+def test_metrics_can_be_sorted_by_the_label_as_written(table):
+    result = run_aggregate(table, ["Region"], ["median(Spend)"], sort_by=["-median(Spend)"])
+    assert result["columns"] == ["Region", "median(Spend)"]
+    medians = [row[1] for row in result["rows"]]
+    assert medians == sorted(medians, reverse=True)
+
+
+def test_whole_table_aggregate_and_errors(table):
+    assert run_aggregate(table, None, ["count", "mean(Spend)"])["rows"] == [[6, 128.1]]
+    with pytest.raises(QueryError):
+        run_aggregate(table, ["Segment"], ["mean(Segment)"])
+    with pytest.raises(QueryError):
+        run_aggregate(table, ["Nope"], ["count"])
+    with pytest.raises(QueryError):
+        run_aggregate(table, ["Segment"], ["count"], sort_by=["Spend"])
+
+
+def test_sparse_multi_column_keys_match_python_grouping(tmp_path):
+    rng = np.random.default_rng(1)
+    keys = rng.integers(0, 120, size=(300, 3))
+    path = tmp_path / "sparse.csv"
+    path.write_text("A,B,C\n" + "".join(f"{a},{b},{c}\n" for a, b, c in keys))
+
+    result = run_aggregate(load_csv(str(path)), ["A", "B", "C"], ["count"], limit=1000)
+
+    expected = {}
+    for row in map(tuple, keys.tolist()):
+        expected[row] = expected.get(row, 0) + 1
+    assert {tuple(row[:3]): row[3] for row in result["rows"]} == expected
+    assert [row[:3] for row in result["rows"]] == sorted(row[:3] for row in result["rows"])
@@ -0,0 +1,109 @@
+"""
+Tests for the columnar table store and the query_table tool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.table_query import MAX_QUERY_ROWS, QueryError, run_query  # noqa: E402
+from core.table_store import load_csv  # noqa: E402
+
+CSV = (
+    "CustomerID,Segment,ChurnRate,Visits\n"
+    "C1,Premium,0.25,10\n"
+    "C2,Basic,0.10,\n"
+    'C3,"Premium, Plus",0.40,3\n'
+    "C4,,0.05,7\n"
+    "C5,Basic,,12\n"
+)
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "customer_churn_analysis.csv"
+    path.write_text(CSV)
+    return load_csv(str(path), name="customer_churn_analysis")
+
+
+def test_types_and_nulls_are_inferred(table):
+    assert table.num_rows == 5
+    kinds = {name: column.kind for name, column in table.columns.items()}
+    assert kinds == {"CustomerID": "str", "Segment": "str", "ChurnRate": "float", "Visits": "int"}
+    assert table.columns["Visits"].nulls.tolist() == [False, True, False, False, False]
+    assert list(table.columns["Segment"].categories) == ["Basic", "Premium", "Premium, Plus"]
+
+
+def test_filters_projection_and_sort(table):
+    result = run_query(
+        table,
+        columns=["CustomerID", "ChurnRate"],
+        filters=[{"column": "segment", "op": "contains", "value": "prem"}],
+        sort_by=["-ChurnRate"],
+    )
+    assert result["columns"] == ["CustomerID", "ChurnRate"]
+    assert result["rows"] == [["C3", 0.4], ["C1", 0.25]]
+    assert result["matched_rows"] == 2
+    assert result["truncated"] is False
+    assert result["next_offset"] is None
+
+
+def test_nulls_never_match_comparisons_and_sort_last(table):
+    result = run_query(table, columns=["CustomerID"], filters=[{"column": "Visits", "op": "<", "value": 100}])
+    assert [row[0] for row in result["rows"]] == ["C1", "C3", "C4", "C5"]
+
+    result = run_query(table, columns=["CustomerID", "Visits"], sort_by=["Visits"])
+    assert result["rows"][-1] == ["C2", None]
+
+    result = run_query(table, columns=["CustomerID"], filters=[{"column": "Segment", "op": "is_null"}])
+    assert result["rows"] == [["C4"]]
+
+
+def test_in_filters_on_text_and_numbers(table):
+    text = run_query(table, columns=["CustomerID"], filters=[{"column": "Segment", "op": "in", "value": ["Basic"]}])
+    numbers = run_query(table, columns=["CustomerID"], filters=[{"column": "Visits", "op": "not_in", "value": [10, 3]}])
+    assert text["rows"] == [["C2"], ["C5"]]
+    assert numbers["rows"] == [["C4"], ["C5"]]
+
+
+def test_paging_and_row_cap(table):
+    first = run_query(table, columns=["CustomerID"], limit=2)
+    second = run_query(table, columns=["CustomerID"], limit=2, offset=first["next_offset"])
+    assert first["truncated"] is True
+    assert [row[0] for row in first["rows"] + second["rows"]] == ["C1", "C2", "C3", "C4"]
+    assert run_query(table, limit=10 ** 9)["returned_rows"] == min(5, MAX_QUERY_ROWS)
+
+
+def test_invalid_queries_raise_query_error(table):
+    with pytest.raises(QueryError):
+        run_query(table, columns=["Missing"])
+    with pytest.raises(QueryError):
+        run_query(table, filters=[{"column": "Visits", "op": "~", "value": 1}])
+    with pytest.raises(QueryError):
+        run_query(table, filters=[{"column": "Visits", "op": ">", "value": "many"}])
+
+
+def test_query_table_tool(tmp_path):
+    from fastmcp import Client, FastMCP
+    from services.data_tool_service import DataToolService
+
+    (tmp_path / "customer_Churn_Analysis.csv").write_text(CSV)
+    mcp = FastMCP("test")
+    DataToolService(str(tmp_path)).register_tools(mcp)
+
+    async def call(arguments):
+        async with Client(mcp) as client:
+            return (await client.call_tool("query_table", arguments)).structured_content
+
+    result = asyncio.run(call({"tablename": "customer_Churn_Analysis", "columns": ["CustomerID"], "limit": 1}))
+    assert result["rows"] == [["C1"]]
+    assert result["next_offset"] == 1
+
+    error = asyncio.run(call({"tablename": "secrets"}))
+    assert error == {"error": "File 'secrets.csv' is not allowed."}
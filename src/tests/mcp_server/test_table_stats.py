@@ -0,0 +1,84 @@
+"""
+Tests for table statistics, the HyperLogLog sketch and the describe_table tool.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+import services.data_tool_service as data_tool_service  # noqa: E402
+from core.sketches import hll_estimate  # noqa: E402
+from core.table_stats import describe  # noqa: E402
+from core.table_store import load_csv  # noqa: E402
+
+CSV = (
+    "CustomerID,Segment,ChurnRate,Visits\n"
+    "C1,Premium,0.25,10\n"
+    "C2,Basic,0.10,\n"
+    "C3,Premium,0.40,3\n"
+    "C4,,0.05,10\n"
+)
+
+
+@pytest.mark.parametrize("distinct", [0, 1, 1000, 300_000])
+def test_hll_estimate_is_close(distinct):
+    rng = np.random.default_rng(distinct)
+    values = rng.permutation(np.repeat(rng.choice(10**12, distinct, replace=False), 3))
+    assert hll_estimate(values) == pytest.approx(distinct, rel=0.03, abs=1)
+    assert hll_estimate(values.astype(np.float64)) == pytest.approx(distinct, rel=0.03, abs=1)
+
+
+def test_describe_reports_types_nulls_distinct_and_range(tmp_path):
+    path = tmp_path / "customer_churn_analysis.csv"
+    path.write_text(CSV)
+    stats = describe(load_csv(str(path), name="customer_churn_analysis"))
+
+    by_name = {column["name"]: column for column in stats["columns"]}
+    assert stats["num_rows"] == 4
+    assert by_name["Segment"] == {
+        "name": "Segment",
+        "type": "str",
+        "nulls": 1,
+        "distinct": 2,
+        "distinct_estimated": False,
+        "min": "Basic",
+        "max": "Premium",
+    }
+    assert (by_name["Visits"]["nulls"], by_name["Visits"]["distinct"]) == (1, 2)
+    assert (by_name["ChurnRate"]["min"], by_name["ChurnRate"]["max"]) == (0.05, 0.40)
+    assert stats["sample_rows"][1] == ["C2", "Basic", 0.10, None]
+
+
+def test_describe_table_tool_caches_per_file_version(tmp_path, monkeypatch):
+    from fastmcp import Client, FastMCP
+
+    path = tmp_path / "customer_Churn_Analysis.csv"
+    path.write_text(CSV)
+    service = data_tool_service.DataToolService(str(tmp_path), poll_interval=0)
+    mcp = FastMCP("test")
+    service.register_tools(mcp)
+
+    computed = []
+    monkeypatch.setattr(data_tool_service, "describe", lambda table: computed.append(1) or describe(table))
+
+    async def call(arguments):
+        async with Client(mcp) as client:
+            return (await client.call_tool("describe_table", arguments)).structured_content
+
+    first = asyncio.run(call({"tablename": "customer_Churn_Analysis", "sample_rows": 1}))
+    again = asyncio.run(call({"tablename": "customer_Churn_Analysis"}))
+    assert len(first["sample_rows"]) == 1 and len(again["sample_rows"]) == 4
+    assert len(computed) == 1
+
+    path.write_text(CSV + "C5,Basic,0.5,1\n")
+    os.utime(path, (1, 1))
+    assert asyncio.run(call({"tablename": "customer_Churn_Analysis"}))["num_rows"] == 5
+    assert len(computed) == 2
@@ -0,0 +1,117 @@
+"""
+Tests for the batched tool invocation endpoint.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.factory import Domain, MCPToolBase, MCPToolFactory  # noqa: E402
+from core.result_cache import CACHE_META_KEY  # noqa: E402
+from core.tool_batch import parse_batch, run_batch  # noqa: E402
+
+
+class SlowService(MCPToolBase):
+    def __init__(self):
+        super().__init__(Domain.GENERAL)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def register_tools(self, mcp):
+        @mcp.tool()
+        @self.cached(ttl=60)
+        async def slow_echo(text: str) -> dict:
+            """Echo after a delay."""
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                self.in_flight -= 1
+            return {"text": text}
+
+        @mcp.tool()
+        async def fail() -> str:
+            """Always fails."""
+            raise ValueError("boom")
+
+    @property
+    def tool_count(self) -> int:
+        return 2
+
+
+def test_calls_run_concurrently_in_order_with_per_call_errors():
+    service = SlowService()
+    factory = MCPToolFactory()
+    factory.register_service(service)
+    mcp = factory.create_mcp_server(name="test")
+    calls = parse_batch(
+        {
+            "calls": [
+                {"tool": "slow_echo", "arguments": {"text": "a"}},
+                {"tool": "fail"},
+                {"tool": "missing"},
+                {"tool": "slow_echo", "arguments": {"text": "b"}},
+                {"tool": "slow_echo", "arguments": {"text": "c"}},
+            ]
+        },
+        max_calls=10,
+    )
+
+    results = asyncio.run(run_batch(mcp, calls))
+
+    assert [r["tool"] for r in results] == ["slow_echo", "fail", "missing", "slow_echo", "slow_echo"]
+    assert [r.get("structured_content", {}).get("text") for r in results if "error" not in r] == ["a", "b", "c"]
+    assert "boom" in results[1]["error"] and "Unknown tool" in results[2]["error"]
+    assert service.max_in_flight == 3
+
+    # Calls go through the server's middleware, so a repeated call is served from the result cache
+    (again,) = asyncio.run(run_batch(mcp, calls[:1]))
+    assert again["content"][0]["meta"][CACHE_META_KEY]["status"] == "hit"
+    assert service.max_in_flight == 3
+
+
+def test_max_concurrency_bounds_in_flight_calls():
+    service = SlowService()
+    factory = MCPToolFactory()
+    factory.register_service(service)
+    mcp = factory.create_mcp_server(name="test")
+    calls = [("slow_echo", {"text": str(i)}) for i in range(6)]
+
+    results = asyncio.run(run_batch(mcp, calls, max_concurrency=2))
+
+    assert [r["structured_content"]["text"] for r in results] == [str(i) for i in range(6)]
+    assert service.max_in_flight == 2
+
+
+def test_batch_route(monkeypatch):
+    import importlib.util
+
+    from starlette.testclient import TestClient
+
+    # `import mcp_server` would find this test package, so load the server module by path
+    spec = importlib.util.spec_from_file_location("macae_mcp_server", mcp_server_path / "mcp_server.py")
+    mcp_server = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mcp_server)
+    monkeypatch.setattr(mcp_server.config, "enable_auth", False)
+    monkeypatch.setattr(mcp_server.config, "tool_batch_max_calls", 2)
+    app = mcp_server.create_fastmcp_server().http_app()
+    calls = [
+        {"tool": "get_product_info", "arguments": {}},
+        {"tool": "assign_mentor", "arguments": {"employee_name": "Ann"}},
+    ]
+    with TestClient(app) as client:
+        response = client.post("/mcp/tools/batch", json={"calls": calls})
+        too_many = client.post("/mcp/tools/batch", json={"calls": calls * 2})
+        not_json = client.post("/mcp/tools/batch", content=b"nope")
+
+    assert response.status_code == 200
+    first, second = response.json()["results"]
+    assert first["tool"] == "get_product_info" and first["content"][0]["type"] == "text"
+    assert "Ann" in second["content"][0]["text"]
+    assert too_many.status_code == 400 and "At most 2" in too_many.json()["error"]
+    assert not_json.status_code == 400
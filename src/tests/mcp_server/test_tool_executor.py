@@ -0,0 +1,83 @@
+"""
+Tests for running blocking and CPU-bound tools off the event loop.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.factory import Domain, MCPToolBase, MCPToolFactory  # noqa: E402
+from core.tool_executor import ToolExecutor  # noqa: E402
+
+
+class SlowService(MCPToolBase):
+    def __init__(self):
+        super().__init__(Domain.GENERAL)
+
+    def register_tools(self, mcp):
+        @mcp.tool()
+        @self.blocking(max_concurrency=1)
+        def slow(seconds: float) -> dict:
+            """Sleep, then report."""
+            time.sleep(seconds)
+            return {"slept": seconds}
+
+        @mcp.tool()
+        async def ping() -> dict:
+            """Answer right away."""
+            return {"at": time.monotonic()}
+
+    @property
+    def tool_count(self) -> int:
+        return 2
+
+
+def _server(executor):
+    factory = MCPToolFactory(executor=executor)
+    factory.register_service(SlowService())
+    return factory, factory.create_mcp_server(name="test")
+
+
+def test_blocking_tool_does_not_stall_the_loop():
+    from fastmcp import Client
+
+    factory, mcp = _server(ToolExecutor())
+
+    async def scenario():
+        async with Client(mcp) as client:
+            tools = {tool.name: tool for tool in await client.list_tools()}
+            assert list(tools["slow"].inputSchema["properties"]) == ["seconds"]
+            assert tools["slow"].description == "Sleep, then report."
+
+            slow = asyncio.create_task(client.call_tool("slow", {"seconds": 0.3}))
+            await asyncio.sleep(0.05)
+            ping = (await client.call_tool("ping", {})).structured_content
+            slow_done_at = time.monotonic()
+            assert (await slow).structured_content == {"slept": 0.3}
+            return ping["at"], slow_done_at
+
+    ping_at, slow_done_at = asyncio.run(scenario())
+    assert ping_at < slow_done_at
+
+
+def test_concurrency_limit_queues_calls_and_records_wait():
+    from fastmcp import Client
+
+    factory, mcp = _server(ToolExecutor())
+
+    async def scenario():
+        async with Client(mcp) as client:
+            await asyncio.gather(*(client.call_tool("slow", {"seconds": 0.1}) for _ in range(3)))
+
+    started = time.monotonic()
+    asyncio.run(scenario())
+    assert time.monotonic() - started >= 0.3  # one call at a time
+
+    metrics = factory.get_executor_metrics()["slow"]
+    assert metrics["calls"] == 3 and metrics["in_flight"] == 0 and metrics["errors"] == 0
+    assert metrics["queue_wait_max_ms"] >= 150
@@ -0,0 +1,98 @@
+"""
+Tests for worker heartbeats and the multi-worker HTTP mode.
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.worker_health import WorkerHeartbeat, read_workers  # noqa: E402
+
+
+def test_heartbeats_are_listed_and_stale_ones_removed(tmp_path):
+    heartbeat = WorkerHeartbeat(str(tmp_path), lambda: {"services": ["hr"]}, interval=60)
+    heartbeat.start()
+    (tmp_path / "worker-999999999.json").write_text(json.dumps({"pid": 999999999, "started_at": 0, "updated_at": time.time()}))
+
+    workers = read_workers(str(tmp_path), max_age=60)
+    assert [(w["pid"], w["services"]) for w in workers] == [(os.getpid(), ["hr"])]
+    assert not (tmp_path / "worker-999999999.json").exists()  # that process is gone
+
+    heartbeat.stop()
+    assert read_workers(str(tmp_path), max_age=60) == []
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _worker_pids(port: int, expected: int, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=2) as response:
+                workers = json.load(response)["workers"]
+            if len(workers) == expected:
+                return sorted(worker["pid"] for worker in workers)
+        except (OSError, ValueError, KeyError):
+            pass
+        time.sleep(0.3)
+    raise AssertionError(f"{expected} workers did not report within {timeout}s")
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="needs POSIX signals")
+def test_workers_share_a_port_and_reload_on_sighup(tmp_path):
+    port = _free_port()
+    env = {
+        **os.environ,
+        "ENABLED_SERVICES": "product",
+        "WORKER_STATE_DIR": str(tmp_path),
+        "WORKER_HEARTBEAT_INTERVAL": "0.5",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "mcp_server.py", "-t", "http", "--port", str(port), "--workers", "2", "--no-auth"],
+        cwd=mcp_server_path,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        before = _worker_pids(port, 2)
+        server.send_signal(signal.SIGHUP)
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            after = _worker_pids(port, 2)
+            if not set(after) & set(before):
+                break
+            time.sleep(0.3)
+        assert not set(after) & set(before)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    assert list(tmp_path.glob("worker-*.json")) == []  # withdrawn on graceful shutdown
+
+
+def test_sse_with_several_workers_is_a_usage_error():
+    result = subprocess.run(
+        [sys.executable, "mcp_server.py", "-t", "sse", "--workers", "2"],
+        cwd=mcp_server_path,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 2
+    assert "--workers needs --transport http" in result.stderr and "Traceback" not in result.stderr
@@ -0,0 +1,127 @@
+"""
+Tests for the dependency-aware workflow runner and the run_workflow tool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Services import `core.*` relative to src/mcp_server
+mcp_server_path = Path(__file__).parent.parent.parent / "mcp_server"
+sys.path.insert(0, str(mcp_server_path))
+
+from core.factory import Domain, MCPToolBase, MCPToolFactory  # noqa: E402
+from core.workflow import WorkflowRunner, validate_steps  # noqa: E402
+from services.workflow_service import WorkflowService, parse_concurrency  # noqa: E402
+
+
+class StepService(MCPToolBase):
+    """Tools that record how many of them run at once."""
+
+    def __init__(self):
+        super().__init__(Domain.GENERAL)
+        self.running = 0
+        self.peak = 0
+        self.order = []
+
+    def register_tools(self, mcp):
+        @mcp.tool()
+        async def work(name: str) -> str:
+            """Pretend to work."""
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.05)
+            self.running -= 1
+            self.order.append(name)
+            return f"did {name}"
+
+        @mcp.tool()
+        async def broken(name: str) -> str:
+            """Always fails."""
+            raise RuntimeError(f"{name} broke")
+
+    @property
+    def tool_count(self) -> int:
+        return 2
+
+
+def _step(step_id, tool="work", depends_on=None, required=True, domain="A"):
+    return {"id": step_id, "tool": tool, "domain": domain, "required": required, "depends_on": depends_on or []}
+
+
+def _run(steps, limits=None, default=4):
+    factory = MCPToolFactory()
+    service = StepService()
+    factory.register_service(service)
+    mcp = factory.create_mcp_server(name="test")
+    runner = WorkflowRunner(mcp, limits or {}, default_concurrency=default)
+    step_parameters = {step["id"]: {"name": step["id"]} for step in steps}
+    return asyncio.run(runner.run(steps, step_parameters=step_parameters)), service
+
+
+def test_independent_steps_overlap_and_dependencies_wait():
+    result, service = _run([_step("a"), _step("b"), _step("c", depends_on=["a", "b"]), _step("d")])
+    assert result["status"] == "completed" and service.peak == 3
+    assert service.order[-1] == "c"
+    steps = {s["id"]: s for s in result["steps"]}
+    assert steps["c"]["started_ms"] >= steps["a"]["started_ms"] + steps["a"]["elapsed_ms"]
+    assert steps["c"]["result"] == "did c"
+
+
+def test_domain_caps_limit_concurrency():
+    result, service = _run([_step(str(i), domain="HR") for i in range(4)], limits={"hr": 1})
+    assert result["status"] == "completed" and service.peak == 1
+
+
+def test_failures_skip_dependents_and_set_status():
+    result, _ = _run(
+        [
+            _step("a", tool="broken", required=False),
+            _step("b", depends_on=["a"], required=False),
+            _step("c"),
+        ]
+    )
+    assert result["status"] == "completed_with_errors"
+    assert [s["status"] for s in result["steps"]] == ["error", "skipped", "ok"]
+    assert "a broke" in result["steps"][0]["error"]
+
+    result, _ = _run([_step("a", tool="broken"), _step("b")])
+    assert result["status"] == "failed" and "required steps not completed: a" in result["summary"]
+
+
+def test_invalid_blueprints_are_rejected():
+    with pytest.raises(ValueError, match="cycle between steps: a, b"):
+        validate_steps([_step("a", depends_on=["b"]), _step("b", depends_on=["a"]), _step("c")])
+    with pytest.raises(ValueError, match="unknown step 'x'"):
+        validate_steps([_step("a", depends_on=["x"])])
+    with pytest.raises(ValueError, match="Duplicate"):
+        validate_steps([_step("a"), _step("a")])
+
+
+def test_onboarding_blueprint_runs_in_one_call():
+    from fastmcp import Client
+
+    factory = MCPToolFactory()
+    factory.load_services(["hr", "tech_support"])
+    factory.register_service(WorkflowService(parse_concurrency("hr=2, tech_support=1")))
+    mcp = factory.create_mcp_server(name="test")
+    parameters = {"employee_name": "Ann", "date": "2025-10-01", "email_address": "ann@example.com", "laptop_model": "X1"}
+
+    async def scenario():
+        async with Client(mcp) as client:
+            return (
+                await client.call_tool(
+                    "run_workflow", {"blueprint": "employee_onboarding_blueprint_flat", "parameters": parameters}
+                )
+            ).structured_content
+
+    result = asyncio.run(scenario())
+    assert result["intent"] == "employee_onboarding" and result["status"] == "completed"
+    assert len(result["steps"]) == 11 and all("Ann" in step["result"] for step in result["steps"])
+
+    del parameters["date"]  # orientation can no longer run
+    result = asyncio.run(scenario())
+    orientation = next(step for step in result["steps"] if step["id"] == "orientation")
+    assert result["status"] == "failed" and "Missing parameter(s)" in orientation["error"]